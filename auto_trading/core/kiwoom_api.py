@@ -1415,6 +1415,10 @@ class KiwoomAPI:
                 order_price = int(self.ocx.dynamicCall("GetChejanData(int)", 901))
                 
                 log.info(f"체결 데이터: {stock_code} {order_quantity}주 @ {order_price}원 [{order_status}]")
+            
+            # 보유 종목 변경 알림 (0: 주문체결, 1: 잔고변경)
+            if gubun in ("0", "1") and 'positions_changed' in self.callbacks:
+                self.callbacks['positions_changed']()
                 
         except Exception as e:
             log.error(f"체결 데이터 처리 중 오류: {e}")
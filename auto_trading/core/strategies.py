@@ -27,10 +27,14 @@ signal = strategy.generate_signal(prices)
 
 [전략 추가 방법]
 BaseStrategy를 상속하여 generate_signal() 메서드 구현
+(새 봉만 반영해 갱신할 수 있으면 update()도 구현)
 """
 
 from enum import Enum
-from typing import List, Dict, Optional
+from typing import Any, List, Dict, Optional, Tuple
+
+import numpy as np
+
 from core.indicators import calculate_sma, calculate_rsi, calculate_macd
 from utils.logger import log
 from config import Config
@@ -72,6 +76,25 @@ class BaseStrategy:
             신호 강도
         """
         return 0.5  # 기본값
+    
+    def update(self, prices: List[float], state: Any = None) -> Tuple[SignalType, float, Any]:
+        """
+        새 봉이 1개 추가된 가격으로 신호/강도 갱신
+        
+        전략 객체는 여러 종목에 같이 쓰이므로 종목별 상태는 호출하는 쪽이 보관합니다.
+        state는 직전 가격(prices[:-1])으로 호출했을 때 돌려받은 상태이며,
+        처음이거나 연속이 끊기면 None입니다.
+        
+        기본 구현은 상태 없이 전체를 다시 계산합니다.
+        
+        Args:
+            prices: 가격 리스트
+            state: 직전 호출이 반환한 상태 (없으면 None)
+        
+        Returns:
+            (매매 신호, 신호 강도, 다음 호출에 넘길 상태)
+        """
+        return self.generate_signal(prices), self.get_signal_strength(prices), None
 
 
 class MACrossoverStrategy(BaseStrategy):
@@ -258,6 +281,93 @@ class MACDStrategy(BaseStrategy):
         strength = min(abs(histogram) / 5.0, 1.0)
         
         return strength
+    
+    def update(self, prices: List[float], state: Any = None) -> Tuple[SignalType, float, Any]:
+        """
+        새 봉이 1개 추가된 가격으로 MACD 신호/강도 갱신
+        
+        state(직전 봉까지의 EMA 값)가 있으면 새 봉 하나만 반영하고, 없으면 전체 가격으로
+        다시 만듭니다. calculate_macd()와 같은 점화식/자료형으로 계산하므로 결과는
+        generate_signal(), get_signal_strength()와 같습니다.
+        
+        Args:
+            prices: 가격 리스트
+            state: 직전 호출이 반환한 상태 (없으면 None)
+        
+        Returns:
+            (매매 신호, 신호 강도, 다음 호출에 넘길 상태)
+        """
+        if not prices:
+            return SignalType.HOLD, 0.0, None
+        
+        # 새 가격이 들어오며 배열 자료형이 바뀌면 (예: 정수 → 실수) 전체 재계산
+        if state is not None and np.result_type(state[0], np.asarray(prices[-1]).dtype) != state[0]:
+            state = None
+        
+        if state is None:
+            state = self._macd_state(np.array(prices))
+            
+            # 마지막 가격 때문에 자료형이 바뀌었으면 이전 히스토그램은 이전 가격만의 자료형으로 계산
+            if len(prices) > 1:
+                prev_data = np.array(prices[:-1])
+                if prev_data.dtype != state[0]:
+                    state = state[:5] + (self._macd_state(prev_data)[4],)
+        else:
+            state = self._macd_step(state, state[0].type(prices[-1]))
+        
+        n = len(prices)
+        
+        # calculate_macd() 데이터 부족
+        if n < self.slow + self.signal:
+            return SignalType.HOLD, 0.0, state
+        
+        histogram = float(state[4])
+        strength = min(abs(histogram) / 5.0, 1.0)
+        
+        if n < self.slow + self.signal + 1:
+            return SignalType.HOLD, strength, state
+        
+        histogram_prev = float(state[5])
+        
+        # MACD선이 시그널선을 상향 돌파
+        if histogram > 0 and histogram_prev <= 0:
+            log.debug(f"[{self.name}] MACD 골든크로스: 히스토그램 {histogram:.2f}")
+            return SignalType.BUY, strength, state
+        
+        # MACD선이 시그널선을 하향 돌파
+        elif histogram < 0 and histogram_prev >= 0:
+            log.debug(f"[{self.name}] MACD 데드크로스: 히스토그램 {histogram:.2f}")
+            return SignalType.SELL, strength, state
+        
+        return SignalType.HOLD, strength, state
+    
+    def _macd_state(self, data: np.ndarray) -> tuple:
+        """
+        가격 배열 전체로 MACD 상태 생성
+        
+        Returns:
+            (자료형, 빠른 EMA, 느린 EMA, 시그널선, 히스토그램, 이전 히스토그램)
+        """
+        first = data[0]
+        state = (data.dtype, first, first, first - first, first - first, None)
+        for price in data[1:]:
+            state = self._macd_step(state, price)
+        return state
+    
+    def _macd_step(self, state: tuple, price) -> tuple:
+        """MACD 상태에 봉 하나 반영 (calculate_macd()의 EMA 점화식과 동일, 같은 자료형으로 저장)"""
+        dtype, ema_fast, ema_slow, signal_line, histogram, _ = state
+        cast = dtype.type
+        fast_mult = 2 / (self.fast + 1)
+        slow_mult = 2 / (self.slow + 1)
+        signal_mult = 2 / (self.signal + 1)
+        
+        ema_fast = cast((price * fast_mult) + (ema_fast * (1 - fast_mult)))
+        ema_slow = cast((price * slow_mult) + (ema_slow * (1 - slow_mult)))
+        macd = ema_fast - ema_slow
+        signal_line = cast((macd * signal_mult) + (signal_line * (1 - signal_mult)))
+        
+        return dtype, ema_fast, ema_slow, signal_line, macd - signal_line, histogram
 
 
 class MultiStrategy:
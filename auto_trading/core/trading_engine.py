@@ -767,9 +767,9 @@ class TradingEngine:
         if self.surge_detector:
             self.surge_detector.stop_monitoring()
         
-        # 뉴스 자동 갱신 중지
+        # 뉴스 자동 갱신 중지 및 수집 스레드 풀 정리
         if self.news_enabled and self.news_crawler:
-            self.news_crawler.stop_auto_update()
+            self.news_crawler.close()
             log.info("뉴스 자동 갱신 중지")
         
         # 헬스 모니터링 중지
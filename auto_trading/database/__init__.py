@@ -10,6 +10,7 @@
 
 __all__ = [
     'StockDatabase',
+    'CandleRecord',
     'TradingHistoryDB',
     'DataAnalyzer',
     'CandleAggregator',
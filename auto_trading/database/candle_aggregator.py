@@ -336,10 +336,10 @@ if __name__ == "__main__":
             
             if candles:
                 for c in candles[-3:]:  # 최근 3개
-                    print(f"   {c['timestamp'].strftime('%H:%M')} - "
-                          f"O:{c['open']:,.0f} H:{c['high']:,.0f} "
-                          f"L:{c['low']:,.0f} C:{c['close']:,.0f} "
-                          f"V:{c['volume']:,}")
+                    print(f"   {c.timestamp.strftime('%H:%M')} - "
+                          f"O:{c.open:,.0f} H:{c.high:,.0f} "
+                          f"L:{c.low:,.0f} C:{c.close:,.0f} "
+                          f"V:{c.volume:,}")
             
             print("\n" + "=" * 70)
             print("테스트 완료!")
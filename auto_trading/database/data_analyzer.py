@@ -5,7 +5,7 @@
 데이터베이스에 저장된 주식 데이터를 분석하고 다양한 형식으로 내보냅니다.
 
 [주요 기능]
-- Excel/CSV 내보내기
+- Excel/CSV/Parquet 내보내기
 - 통계 분석 (수익률, 변동성, 샤프 비율 등)
 - 자동 리포트 생성
 - Grafana/Power BI 연동 지원
@@ -19,13 +19,177 @@ analyzer = DataAnalyzer(db)
 analyzer.export_to_excel('005930', start_date, end_date, 'output.xlsx')
 """
 
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timedelta
-from typing import Optional, Dict, List
+from operator import attrgetter
+from typing import Optional, Dict, List, Tuple
 from pathlib import Path
 import math
+import os
+import string
 
+from database.database import CandleRecord
 from utils.logger import log
 
+# pyarrow (선택) - 32비트 Python 미지원이므로 없으면 순수 Python 경로 사용
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.parquet as pq
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+
+# CSV 헤더 (Excel 호환을 위해 UTF-8 BOM 포함) 및 행 포맷
+_CSV_HEADER = '\ufefftimestamp,stock_code,open,high,low,close,volume\r\n'.encode('utf-8')
+_CSV_ROW_FORMAT = b"%s,%s,%r,%r,%r,%r,%r\r\n"
+
+def _format_timestamps(timestamps: List[datetime]) -> List[str]:
+    """
+    타임스탬프 열 전체를 'YYYY-MM-DD HH:MM:SS' 문자열로 변환
+    
+    pyarrow가 있으면 compute 커널로 열 전체를 한 번에 변환하고,
+    없으면 strftime 대신 C 구현인 isoformat을 사용합니다.
+    """
+    if PYARROW_AVAILABLE:
+        ts_col = pa.array(timestamps, type=pa.timestamp('s'))
+        return pc.strftime(ts_col, format='%Y-%m-%d %H:%M:%S', locale='C').to_pylist()
+    return [ts.isoformat(' ', 'seconds') for ts in timestamps]
+
+
+# HTML 리포트 템플릿 (모듈 로드 시 한 번만 생성)
+_REPORT_TEMPLATE = string.Template("""
+<!DOCTYPE html>
+<html lang="ko">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>$stock_code 분석 리포트</title>
+    <style>
+        body {
+            font-family: 'Malgun Gothic', sans-serif;
+            max-width: 800px;
+            margin: 50px auto;
+            padding: 20px;
+            background-color: #f5f5f5;
+        }
+        .container {
+            background-color: white;
+            padding: 30px;
+            border-radius: 10px;
+            box-shadow: 0 2px 10px rgba(0,0,0,0.1);
+        }
+        h1 {
+            color: #333;
+            border-bottom: 3px solid #4472C4;
+            padding-bottom: 10px;
+        }
+        .stats {
+            display: grid;
+            grid-template-columns: repeat(2, 1fr);
+            gap: 20px;
+            margin-top: 30px;
+        }
+        .stat-box {
+            background: #f8f9fa;
+            padding: 15px;
+            border-radius: 5px;
+            border-left: 4px solid #4472C4;
+        }
+        .stat-label {
+            font-size: 14px;
+            color: #666;
+            margin-bottom: 5px;
+        }
+        .stat-value {
+            font-size: 24px;
+            font-weight: bold;
+            color: #333;
+        }
+        .positive { color: #d9534f; }
+        .negative { color: #5cb85c; }
+        .footer {
+            margin-top: 30px;
+            padding-top: 20px;
+            border-top: 1px solid #ddd;
+            text-align: center;
+            color: #999;
+            font-size: 12px;
+        }
+    </style>
+</head>
+<body>
+    <div class="container">
+        <h1>📊 $stock_code 분석 리포트</h1>
+        
+        <p><strong>분석 기간:</strong> $start_date ~ $end_date</p>
+        <p><strong>생성 시간:</strong> $generated_at</p>
+        
+        <div class="stats">
+            <div class="stat-box">
+                <div class="stat-label">1분봉 개수</div>
+                <div class="stat-value">${candle_count}개</div>
+            </div>
+            
+            <div class="stat-box">
+                <div class="stat-label">평균가</div>
+                <div class="stat-value">${avg_price}원</div>
+            </div>
+            
+            <div class="stat-box">
+                <div class="stat-label">최저가</div>
+                <div class="stat-value">${min_price}원</div>
+            </div>
+            
+            <div class="stat-box">
+                <div class="stat-label">최고가</div>
+                <div class="stat-value">${max_price}원</div>
+            </div>
+            
+            <div class="stat-box">
+                <div class="stat-label">총 수익률</div>
+                <div class="stat-value $total_return_class">
+                    $total_return%
+                </div>
+            </div>
+            
+            <div class="stat-box">
+                <div class="stat-label">일평균 수익률</div>
+                <div class="stat-value $avg_daily_return_class">
+                    $avg_daily_return%
+                </div>
+            </div>
+            
+            <div class="stat-box">
+                <div class="stat-label">변동성</div>
+                <div class="stat-value">$volatility%</div>
+            </div>
+            
+            <div class="stat-box">
+                <div class="stat-label">샤프 비율</div>
+                <div class="stat-value">$sharpe_ratio</div>
+            </div>
+            
+            <div class="stat-box">
+                <div class="stat-label">최대 상승</div>
+                <div class="stat-value positive">$max_gain%</div>
+            </div>
+            
+            <div class="stat-box">
+                <div class="stat-label">최대 하락</div>
+                <div class="stat-value negative">$max_loss%</div>
+            </div>
+        </div>
+        
+        <div class="footer">
+            CleonAI 자동매매 프로그램 | 데이터 분석 리포트
+        </div>
+    </div>
+</body>
+</html>
+""")
+
 
 class DataAnalyzer:
     """
@@ -78,27 +242,7 @@ class DataAnalyzer:
                 log.warning(f"CSV 내보내기 실패: 데이터 없음 ({stock_code})")
                 return False
             
-            # CSV 생성
-            import csv
-            
-            Path(output_path).parent.mkdir(parents=True, exist_ok=True)
-            
-            with open(output_path, 'w', newline='', encoding='utf-8-sig') as f:
-                writer = csv.DictWriter(f, fieldnames=[
-                    'timestamp', 'stock_code', 'open', 'high', 'low', 'close', 'volume'
-                ])
-                writer.writeheader()
-                
-                for candle in candles:
-                    writer.writerow({
-                        'timestamp': candle['timestamp'].strftime('%Y-%m-%d %H:%M:%S'),
-                        'stock_code': candle['stock_code'],
-                        'open': candle['open'],
-                        'high': candle['high'],
-                        'low': candle['low'],
-                        'close': candle['close'],
-                        'volume': candle['volume']
-                    })
+            self._write_csv(candles, output_path)
             
             log.success(f"CSV 내보내기 완료: {output_path} ({len(candles)}개)")
             return True
@@ -130,89 +274,14 @@ class DataAnalyzer:
             return False
         
         try:
-            from openpyxl import Workbook
-            from openpyxl.styles import Font, Alignment, PatternFill
-            from openpyxl.utils import get_column_letter
-            
-            # 데이터 조회
-            candles = self.database.get_candles(stock_code, start_date, end_date)
+            # 데이터 조회 + 통계 계산 (한 번의 조회로 공유)
+            candles, stats = self._get_candles_and_stats(stock_code, start_date, end_date)
             
             if not candles:
                 log.warning(f"Excel 내보내기 실패: 데이터 없음 ({stock_code})")
                 return False
             
-            # 통계 계산
-            stats = self.get_statistics(stock_code, start_date, end_date)
-            
-            # 엑셀 워크북 생성
-            wb = Workbook()
-            
-            # 시트 1: 1분봉 데이터
-            ws_candles = wb.active
-            ws_candles.title = "1분봉 데이터"
-            
-            # 헤더
-            headers = ['날짜/시간', '종목코드', '시가', '고가', '저가', '종가', '거래량']
-            ws_candles.append(headers)
-            
-            # 헤더 스타일
-            header_font = Font(bold=True, color="FFFFFF")
-            header_fill = PatternFill(start_color="4472C4", end_color="4472C4", fill_type="solid")
-            header_align = Alignment(horizontal="center", vertical="center")
-            
-            for col in range(1, len(headers) + 1):
-                cell = ws_candles.cell(1, col)
-                cell.font = header_font
-                cell.fill = header_fill
-                cell.alignment = header_align
-            
-            # 데이터 추가
-            for candle in candles:
-                ws_candles.append([
-                    candle['timestamp'].strftime('%Y-%m-%d %H:%M:%S'),
-                    candle['stock_code'],
-                    candle['open'],
-                    candle['high'],
-                    candle['low'],
-                    candle['close'],
-                    candle['volume']
-                ])
-            
-            # 열 너비 자동 조정
-            for col in range(1, len(headers) + 1):
-                ws_candles.column_dimensions[get_column_letter(col)].width = 15
-            
-            # 시트 2: 통계
-            if stats:
-                ws_stats = wb.create_sheet("통계")
-                
-                ws_stats.append(['항목', '값'])
-                ws_stats.append(['종목 코드', stock_code])
-                ws_stats.append(['기간', f"{start_date.strftime('%Y-%m-%d')} ~ {end_date.strftime('%Y-%m-%d')}"])
-                ws_stats.append([])
-                ws_stats.append(['1분봉 개수', stats['candle_count']])
-                ws_stats.append(['최저가', f"{stats['min_price']:,.0f}원"])
-                ws_stats.append(['최고가', f"{stats['max_price']:,.0f}원"])
-                ws_stats.append(['평균가', f"{stats['avg_price']:,.0f}원"])
-                ws_stats.append(['총 거래량', f"{stats['total_volume']:,}"])
-                ws_stats.append([])
-                ws_stats.append(['변동성', f"{stats['volatility']:.2f}%"])
-                ws_stats.append(['일평균 수익률', f"{stats['avg_daily_return']:.2f}%"])
-                ws_stats.append(['최대 상승', f"{stats['max_gain']:.2f}%"])
-                ws_stats.append(['최대 하락', f"{stats['max_loss']:.2f}%"])
-                
-                # 스타일
-                for row in range(1, ws_stats.max_row + 1):
-                    ws_stats.cell(row, 1).font = Font(bold=True)
-                    ws_stats.cell(row, 1).alignment = Alignment(horizontal="left")
-                    ws_stats.cell(row, 2).alignment = Alignment(horizontal="right")
-                
-                ws_stats.column_dimensions['A'].width = 20
-                ws_stats.column_dimensions['B'].width = 25
-            
-            # 파일 저장
-            Path(output_path).parent.mkdir(parents=True, exist_ok=True)
-            wb.save(output_path)
+            self._write_excel(stock_code, start_date, end_date, candles, stats, output_path)
             
             log.success(f"Excel 내보내기 완료: {output_path} ({len(candles)}개)")
             return True
@@ -224,6 +293,71 @@ class DataAnalyzer:
             log.error(f"Excel 내보내기 오류: {e}")
             return False
     
+    def export_to_parquet(
+        self,
+        stock_code: str,
+        start_date: datetime,
+        end_date: datetime,
+        output_path: str
+    ) -> bool:
+        """
+        Parquet 파일로 내보내기 (분석 도구 연동용)
+        
+        CSV 대비 파일 크기가 작고 문자열 변환이 없어 쓰기가 빠릅니다.
+        DuckDB, Power BI, Grafana 등에서 바로 읽을 수 있습니다.
+        
+        Args:
+            stock_code: 종목 코드
+            start_date: 시작 날짜
+            end_date: 종료 날짜
+            output_path: 출력 파일 경로
+            
+        Returns:
+            성공 여부
+        """
+        if not self.enabled:
+            return False
+        
+        if not PYARROW_AVAILABLE:
+            log.error("pyarrow가 설치되지 않았습니다. pip install pyarrow (64비트 Python 필요)")
+            return False
+        
+        try:
+            # 데이터 조회
+            candles = self.database.get_candles(stock_code, start_date, end_date)
+            
+            if not candles:
+                log.warning(f"Parquet 내보내기 실패: 데이터 없음 ({stock_code})")
+                return False
+            
+            # 열 단위 Arrow 테이블 구성
+            table = pa.table({
+                'timestamp': pa.array(list(map(attrgetter('timestamp'), candles)), type=pa.timestamp('s')),
+                'stock_code': pa.array(list(map(attrgetter('stock_code'), candles)), type=pa.string()),
+                'open': pa.array(list(map(attrgetter('open'), candles)), type=pa.float64()),
+                'high': pa.array(list(map(attrgetter('high'), candles)), type=pa.float64()),
+                'low': pa.array(list(map(attrgetter('low'), candles)), type=pa.float64()),
+                'close': pa.array(list(map(attrgetter('close'), candles)), type=pa.float64()),
+                'volume': pa.array(list(map(attrgetter('volume'), candles)), type=pa.int64()),
+            })
+            
+            # 파일 저장 (ZSTD 레벨 3, 반복이 많은 종목코드는 사전 인코딩)
+            Path(output_path).parent.mkdir(parents=True, exist_ok=True)
+            pq.write_table(
+                table,
+                output_path,
+                compression='zstd',
+                compression_level=3,
+                use_dictionary=['stock_code']
+            )
+            
+            log.success(f"Parquet 내보내기 완료: {output_path} ({len(candles)}개)")
+            return True
+            
+        except Exception as e:
+            log.error(f"Parquet 내보내기 오류: {e}")
+            return False
+    
     def get_statistics(
         self,
         stock_code: str,
@@ -245,67 +379,8 @@ class DataAnalyzer:
             return None
         
         try:
-            # 데이터 조회
-            candles = self.database.get_candles(stock_code, start_date, end_date)
-            
-            if not candles or len(candles) < 2:
-                return None
-            
-            # 기본 통계
-            prices = [c['close'] for c in candles]
-            volumes = [c['volume'] for c in candles]
-            
-            min_price = min(prices)
-            max_price = max(prices)
-            avg_price = sum(prices) / len(prices)
-            total_volume = sum(volumes)
-            
-            # 수익률 계산
-            returns = []
-            for i in range(1, len(prices)):
-                ret = (prices[i] - prices[i-1]) / prices[i-1] * 100
-                returns.append(ret)
-            
-            # 변동성 (표준편차)
-            if returns:
-                avg_return = sum(returns) / len(returns)
-                variance = sum((r - avg_return) ** 2 for r in returns) / len(returns)
-                volatility = math.sqrt(variance)
-                
-                max_gain = max(returns) if returns else 0
-                max_loss = min(returns) if returns else 0
-            else:
-                avg_return = 0
-                volatility = 0
-                max_gain = 0
-                max_loss = 0
-            
-            # 전체 기간 수익률
-            total_return = (prices[-1] - prices[0]) / prices[0] * 100 if prices else 0
-            
-            # 일평균 수익률 (1분봉 → 일봉 변환)
-            days = (end_date - start_date).days or 1
-            avg_daily_return = total_return / days
-            
-            # 샤프 비율 (단순화: 무위험 수익률 0 가정)
-            sharpe_ratio = (avg_return / volatility) if volatility > 0 else 0
-            
-            return {
-                'stock_code': stock_code,
-                'candle_count': len(candles),
-                'min_price': min_price,
-                'max_price': max_price,
-                'avg_price': avg_price,
-                'total_volume': total_volume,
-                'total_return': total_return,
-                'avg_daily_return': avg_daily_return,
-                'volatility': volatility,
-                'max_gain': max_gain,
-                'max_loss': max_loss,
-                'sharpe_ratio': sharpe_ratio,
-                'start_date': start_date,
-                'end_date': end_date
-            }
+            _, stats = self._get_candles_and_stats(stock_code, start_date, end_date)
+            return stats
             
         except Exception as e:
             log.error(f"통계 분석 오류 ({stock_code}): {e}")
@@ -341,143 +416,7 @@ class DataAnalyzer:
                 log.warning(f"리포트 생성 실패: 데이터 없음 ({stock_code})")
                 return False
             
-            # HTML 생성
-            html = f"""
-<!DOCTYPE html>
-<html lang="ko">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>{stock_code} 분석 리포트</title>
-    <style>
-        body {{
-            font-family: 'Malgun Gothic', sans-serif;
-            max-width: 800px;
-            margin: 50px auto;
-            padding: 20px;
-            background-color: #f5f5f5;
-        }}
-        .container {{
-            background-color: white;
-            padding: 30px;
-            border-radius: 10px;
-            box-shadow: 0 2px 10px rgba(0,0,0,0.1);
-        }}
-        h1 {{
-            color: #333;
-            border-bottom: 3px solid #4472C4;
-            padding-bottom: 10px;
-        }}
-        .stats {{
-            display: grid;
-            grid-template-columns: repeat(2, 1fr);
-            gap: 20px;
-            margin-top: 30px;
-        }}
-        .stat-box {{
-            background: #f8f9fa;
-            padding: 15px;
-            border-radius: 5px;
-            border-left: 4px solid #4472C4;
-        }}
-        .stat-label {{
-            font-size: 14px;
-            color: #666;
-            margin-bottom: 5px;
-        }}
-        .stat-value {{
-            font-size: 24px;
-            font-weight: bold;
-            color: #333;
-        }}
-        .positive {{ color: #d9534f; }}
-        .negative {{ color: #5cb85c; }}
-        .footer {{
-            margin-top: 30px;
-            padding-top: 20px;
-            border-top: 1px solid #ddd;
-            text-align: center;
-            color: #999;
-            font-size: 12px;
-        }}
-    </style>
-</head>
-<body>
-    <div class="container">
-        <h1>📊 {stock_code} 분석 리포트</h1>
-        
-        <p><strong>분석 기간:</strong> {stats['start_date'].strftime('%Y-%m-%d')} ~ {stats['end_date'].strftime('%Y-%m-%d')}</p>
-        <p><strong>생성 시간:</strong> {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}</p>
-        
-        <div class="stats">
-            <div class="stat-box">
-                <div class="stat-label">1분봉 개수</div>
-                <div class="stat-value">{stats['candle_count']:,}개</div>
-            </div>
-            
-            <div class="stat-box">
-                <div class="stat-label">평균가</div>
-                <div class="stat-value">{stats['avg_price']:,.0f}원</div>
-            </div>
-            
-            <div class="stat-box">
-                <div class="stat-label">최저가</div>
-                <div class="stat-value">{stats['min_price']:,.0f}원</div>
-            </div>
-            
-            <div class="stat-box">
-                <div class="stat-label">최고가</div>
-                <div class="stat-value">{stats['max_price']:,.0f}원</div>
-            </div>
-            
-            <div class="stat-box">
-                <div class="stat-label">총 수익률</div>
-                <div class="stat-value {'positive' if stats['total_return'] >= 0 else 'negative'}">
-                    {stats['total_return']:+.2f}%
-                </div>
-            </div>
-            
-            <div class="stat-box">
-                <div class="stat-label">일평균 수익률</div>
-                <div class="stat-value {'positive' if stats['avg_daily_return'] >= 0 else 'negative'}">
-                    {stats['avg_daily_return']:+.2f}%
-                </div>
-            </div>
-            
-            <div class="stat-box">
-                <div class="stat-label">변동성</div>
-                <div class="stat-value">{stats['volatility']:.2f}%</div>
-            </div>
-            
-            <div class="stat-box">
-                <div class="stat-label">샤프 비율</div>
-                <div class="stat-value">{stats['sharpe_ratio']:.2f}</div>
-            </div>
-            
-            <div class="stat-box">
-                <div class="stat-label">최대 상승</div>
-                <div class="stat-value positive">{stats['max_gain']:+.2f}%</div>
-            </div>
-            
-            <div class="stat-box">
-                <div class="stat-label">최대 하락</div>
-                <div class="stat-value negative">{stats['max_loss']:+.2f}%</div>
-            </div>
-        </div>
-        
-        <div class="footer">
-            CleonAI 자동매매 프로그램 | 데이터 분석 리포트
-        </div>
-    </div>
-</body>
-</html>
-"""
-            
-            # 파일 저장
-            Path(output_path).parent.mkdir(parents=True, exist_ok=True)
-            
-            with open(output_path, 'w', encoding='utf-8') as f:
-                f.write(html)
+            self._write_report(stock_code, stats, output_path)
             
             log.success(f"HTML 리포트 생성 완료: {output_path}")
             return True
@@ -486,6 +425,117 @@ class DataAnalyzer:
             log.error(f"리포트 생성 오류: {e}")
             return False
     
+    def generate_full_export(
+        self,
+        stock_code: str,
+        start_date: datetime,
+        end_date: datetime,
+        output_dir: str
+    ) -> Dict[str, bool]:
+        """
+        CSV, Excel, HTML 리포트를 한 번의 데이터 조회로 모두 생성
+        
+        Args:
+            stock_code: 종목 코드
+            start_date: 시작 날짜
+            end_date: 종료 날짜
+            output_dir: 출력 디렉토리
+            
+        Returns:
+            형식별 성공 여부 {'csv': bool, 'excel': bool, 'report': bool}
+        """
+        results = {'csv': False, 'excel': False, 'report': False}
+        if not self.enabled:
+            return results
+        
+        try:
+            candles, stats = self._get_candles_and_stats(stock_code, start_date, end_date)
+        except Exception as e:
+            log.error(f"전체 내보내기 조회 오류 ({stock_code}): {e}")
+            return results
+        
+        if not candles:
+            log.warning(f"전체 내보내기 실패: 데이터 없음 ({stock_code})")
+            return results
+        
+        base_path = os.path.join(output_dir, f"{stock_code}_analysis")
+        
+        try:
+            self._write_csv(candles, f"{base_path}.csv")
+            results['csv'] = True
+        except Exception as e:
+            log.error(f"CSV 내보내기 오류: {e}")
+        
+        try:
+            self._write_excel(stock_code, start_date, end_date, candles, stats, f"{base_path}.xlsx")
+            results['excel'] = True
+        except ImportError:
+            log.error("openpyxl이 설치되지 않았습니다. pip install openpyxl")
+        except Exception as e:
+            log.error(f"Excel 내보내기 오류: {e}")
+        
+        if stats:
+            try:
+                self._write_report(stock_code, stats, os.path.join(output_dir, f"{stock_code}_report.html"))
+                results['report'] = True
+            except Exception as e:
+                log.error(f"리포트 생성 오류: {e}")
+        
+        log.success(f"전체 내보내기 완료: {output_dir} ({len(candles)}개, {results})")
+        return results
+    
+    def batch_generate_reports(
+        self,
+        stock_codes: List[str],
+        start_date: datetime,
+        end_date: datetime,
+        output_dir: str,
+        max_workers: Optional[int] = None
+    ) -> Dict[str, bool]:
+        """
+        여러 종목의 HTML 리포트를 프로세스 풀에서 병렬 생성
+        
+        종목별 작업은 서로 독립적이므로 프로세스 단위로 분산합니다.
+        DB 연결은 피클링할 수 없으므로 각 워커가 경로로부터 직접 엽니다.
+        
+        Args:
+            stock_codes: 종목 코드 리스트
+            start_date: 시작 날짜
+            end_date: 종료 날짜
+            output_dir: 리포트 저장 디렉토리
+            max_workers: 최대 프로세스 수 (None이면 CPU 코어 수)
+            
+        Returns:
+            종목 코드별 성공 여부
+        """
+        if not self.enabled or not stock_codes:
+            return {}
+        
+        Path(output_dir).mkdir(parents=True, exist_ok=True)
+        
+        jobs = [
+            (
+                self.database.db_path,
+                self.database.parquet_dir,
+                code,
+                start_date,
+                end_date,
+                os.path.join(output_dir, f"{code}_report.html")
+            )
+            for code in stock_codes
+        ]
+        
+        try:
+            with ProcessPoolExecutor(max_workers=max_workers or os.cpu_count()) as executor:
+                results = list(executor.map(_generate_report_worker, jobs))
+        except Exception as e:
+            log.error(f"일괄 리포트 생성 오류: {e}")
+            return {code: False for code in stock_codes}
+        
+        success_count = sum(results)
+        log.success(f"일괄 리포트 생성 완료: {success_count}/{len(stock_codes)}개 ({output_dir})")
+        return dict(zip(stock_codes, results))
+    
     def print_statistics(
         self,
         stock_code: str,
@@ -525,7 +575,265 @@ class DataAnalyzer:
         print(f"  최대 하락: {stats['max_loss']:+.2f}%")
         print(f"  샤프 비율: {stats['sharpe_ratio']:.2f}")
         print("=" * 70)
+    
+    def _get_candles_and_stats(
+        self,
+        stock_code: str,
+        start_date: datetime,
+        end_date: datetime
+    ) -> Tuple[List[CandleRecord], Optional[Dict]]:
+        """
+        1분봉 조회와 통계 계산을 한 번의 조회로 처리
+        
+        Returns:
+            (1분봉 리스트, 통계 딕셔너리 또는 None)
+        """
+        candles = self.database.get_candles(stock_code, start_date, end_date)
+        return candles, self._compute_statistics(stock_code, candles, start_date, end_date)
+    
+    def _compute_statistics(
+        self,
+        stock_code: str,
+        candles: List[CandleRecord],
+        start_date: datetime,
+        end_date: datetime
+    ) -> Optional[Dict]:
+        """이미 조회한 1분봉 리스트로부터 통계 계산"""
+        if not candles or len(candles) < 2:
+            return None
+        
+        # 기본 통계 + 수익률 평균/변동성(표준편차)/최대 상승·하락
+        # 중간 리스트 없이 1분봉을 한 번만 순회 (수익률은 Welford 방식)
+        first_price = candles[0].close
+        min_price = first_price
+        max_price = first_price
+        price_sum = first_price
+        total_volume = candles[0].volume
+        
+        n_returns = 0
+        avg_return = 0.0
+        m2 = 0.0
+        max_gain = -math.inf
+        max_loss = math.inf
+        prev_price = first_price
+        for i in range(1, len(candles)):
+            candle = candles[i]
+            price = candle.close
+            if price < min_price:
+                min_price = price
+            if price > max_price:
+                max_price = price
+            price_sum += price
+            total_volume += candle.volume
+            
+            ret = (price - prev_price) / prev_price * 100
+            prev_price = price
+            
+            n_returns += 1
+            delta = ret - avg_return
+            avg_return += delta / n_returns
+            m2 += delta * (ret - avg_return)
+            
+            if ret > max_gain:
+                max_gain = ret
+            if ret < max_loss:
+                max_loss = ret
+        
+        avg_price = price_sum / len(candles)
+        volatility = math.sqrt(m2 / n_returns)
+        
+        # 전체 기간 수익률
+        total_return = (prev_price - first_price) / first_price * 100
+        
+        # 일평균 수익률 (1분봉 → 일봉 변환)
+        days = (end_date - start_date).days or 1
+        avg_daily_return = total_return / days
+        
+        # 샤프 비율 (단순화: 무위험 수익률 0 가정)
+        sharpe_ratio = (avg_return / volatility) if volatility > 0 else 0
+        
+        return {
+            'stock_code': stock_code,
+            'candle_count': len(candles),
+            'min_price': min_price,
+            'max_price': max_price,
+            'avg_price': avg_price,
+            'total_volume': total_volume,
+            'total_return': total_return,
+            'avg_daily_return': avg_daily_return,
+            'volatility': volatility,
+            'max_gain': max_gain,
+            'max_loss': max_loss,
+            'sharpe_ratio': sharpe_ratio,
+            'start_date': start_date,
+            'end_date': end_date
+        }
+    
+    def _write_csv(self, candles: List[CandleRecord], output_path: str):
+        """1분봉 리스트를 CSV 파일로 기록 (행을 하나의 버퍼에 모은 뒤 한 번에 기록)"""
+        Path(output_path).parent.mkdir(parents=True, exist_ok=True)
+        
+        timestamps = _format_timestamps([c.timestamp for c in candles])
+        
+        buf = bytearray(_CSV_HEADER)
+        row_fmt = _CSV_ROW_FORMAT
+        for ts_str, candle in zip(timestamps, candles):
+            buf += row_fmt % (
+                ts_str.encode(),
+                candle.stock_code.encode(),
+                candle.open,
+                candle.high,
+                candle.low,
+                candle.close,
+                candle.volume
+            )
+        
+        with open(output_path, 'wb', buffering=1 << 20) as f:
+            f.write(buf)
+    
+    def _write_excel(
+        self,
+        stock_code: str,
+        start_date: datetime,
+        end_date: datetime,
+        candles: List[CandleRecord],
+        stats: Optional[Dict],
+        output_path: str
+    ):
+        """1분봉 리스트와 통계를 Excel 파일로 기록"""
+        from openpyxl import Workbook
+        from openpyxl.cell import WriteOnlyCell
+        from openpyxl.styles import Font, Alignment, PatternFill
+        from openpyxl.utils import get_column_letter
+        
+        # 엑셀 워크북 생성 (write-only: 행을 스트리밍으로 기록)
+        wb = Workbook(write_only=True)
+        
+        # 시트 1: 1분봉 데이터
+        ws_candles = wb.create_sheet("1분봉 데이터")
+        
+        # 헤더
+        headers = ['날짜/시간', '종목코드', '시가', '고가', '저가', '종가', '거래량']
+        
+        # 열 너비 (write-only 시트는 행 기록 전에 설정)
+        for col in range(1, len(headers) + 1):
+            ws_candles.column_dimensions[get_column_letter(col)].width = 15
+        
+        # 헤더 스타일
+        header_font = Font(bold=True, color="FFFFFF")
+        header_fill = PatternFill(start_color="4472C4", end_color="4472C4", fill_type="solid")
+        header_align = Alignment(horizontal="center", vertical="center")
+        
+        header_cells = []
+        for header in headers:
+            cell = WriteOnlyCell(ws_candles, value=header)
+            cell.font = header_font
+            cell.fill = header_fill
+            cell.alignment = header_align
+            header_cells.append(cell)
+        ws_candles.append(header_cells)
+        
+        # 데이터 추가 (열 단위로 추출한 뒤 행으로 묶어 기록)
+        timestamps = _format_timestamps([c.timestamp for c in candles])
+        codes = list(map(attrgetter('stock_code'), candles))
+        opens = list(map(attrgetter('open'), candles))
+        highs = list(map(attrgetter('high'), candles))
+        lows = list(map(attrgetter('low'), candles))
+        closes = list(map(attrgetter('close'), candles))
+        volumes = list(map(attrgetter('volume'), candles))
+        
+        append_row = ws_candles.append
+        for row in zip(timestamps, codes, opens, highs, lows, closes, volumes):
+            append_row(row)
+        
+        # 시트 2: 통계
+        if stats:
+            ws_stats = wb.create_sheet("통계")
+            ws_stats.column_dimensions['A'].width = 20
+            ws_stats.column_dimensions['B'].width = 25
+            
+            stat_rows = [
+                ('항목', '값'),
+                ('종목 코드', stock_code),
+                ('기간', f"{start_date.strftime('%Y-%m-%d')} ~ {end_date.strftime('%Y-%m-%d')}"),
+                (None, None),
+                ('1분봉 개수', stats['candle_count']),
+                ('최저가', f"{stats['min_price']:,.0f}원"),
+                ('최고가', f"{stats['max_price']:,.0f}원"),
+                ('평균가', f"{stats['avg_price']:,.0f}원"),
+                ('총 거래량', f"{stats['total_volume']:,}"),
+                (None, None),
+                ('변동성', f"{stats['volatility']:.2f}%"),
+                ('일평균 수익률', f"{stats['avg_daily_return']:.2f}%"),
+                ('최대 상승', f"{stats['max_gain']:.2f}%"),
+                ('최대 하락', f"{stats['max_loss']:.2f}%"),
+            ]
+            
+            # 스타일
+            label_font = Font(bold=True)
+            label_align = Alignment(horizontal="left")
+            value_align = Alignment(horizontal="right")
+            
+            for label, value in stat_rows:
+                label_cell = WriteOnlyCell(ws_stats, value=label)
+                label_cell.font = label_font
+                label_cell.alignment = label_align
+                value_cell = WriteOnlyCell(ws_stats, value=value)
+                value_cell.alignment = value_align
+                ws_stats.append([label_cell, value_cell])
+        
+        # 파일 저장
+        Path(output_path).parent.mkdir(parents=True, exist_ok=True)
+        wb.save(output_path)
+    
+    def _write_report(self, stock_code: str, stats: Dict, output_path: str):
+        """통계 딕셔너리로 HTML 리포트 파일 기록"""
+        # HTML 생성 (모듈 로드 시 준비된 템플릿에 값만 채움)
+        subs = {
+            'stock_code': stock_code,
+            'start_date': stats['start_date'].strftime('%Y-%m-%d'),
+            'end_date': stats['end_date'].strftime('%Y-%m-%d'),
+            'generated_at': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+            'candle_count': f"{stats['candle_count']:,}",
+            'avg_price': f"{stats['avg_price']:,.0f}",
+            'min_price': f"{stats['min_price']:,.0f}",
+            'max_price': f"{stats['max_price']:,.0f}",
+            'total_return': f"{stats['total_return']:+.2f}",
+            'total_return_class': 'positive' if stats['total_return'] >= 0 else 'negative',
+            'avg_daily_return': f"{stats['avg_daily_return']:+.2f}",
+            'avg_daily_return_class': 'positive' if stats['avg_daily_return'] >= 0 else 'negative',
+            'volatility': f"{stats['volatility']:.2f}",
+            'sharpe_ratio': f"{stats['sharpe_ratio']:.2f}",
+            'max_gain': f"{stats['max_gain']:+.2f}",
+            'max_loss': f"{stats['max_loss']:+.2f}",
+        }
+        html = _REPORT_TEMPLATE.substitute(subs)
+        
+        # 파일 저장 (한 번에 기록)
+        Path(output_path).parent.mkdir(parents=True, exist_ok=True)
+        Path(output_path).write_text(html, encoding='utf-8')
+
 
+def _generate_report_worker(job: tuple) -> bool:
+    """
+    batch_generate_reports용 워커 (프로세스 풀에서 실행)
+    
+    Args:
+        job: (db_path, parquet_dir, stock_code, start_date, end_date, output_path)
+        
+    Returns:
+        성공 여부
+    """
+    from database.database import StockDatabase
+    
+    db_path, parquet_dir, stock_code, start_date, end_date, output_path = job
+    
+    # DB 연결은 워커 프로세스 안에서 새로 연다
+    database = StockDatabase(db_path, parquet_dir)
+    try:
+        return DataAnalyzer(database).generate_report(stock_code, start_date, end_date, output_path)
+    finally:
+        database.close()
 
 if __name__ == "__main__":
     # 테스트 코드
@@ -565,6 +873,7 @@ if __name__ == "__main__":
         })
     
     db.save_candles_batch(test_candles)
+    db.flush_sync()
     print(f"   {len(test_candles)}개 1분봉 저장 완료")
     
     # 기간 설정
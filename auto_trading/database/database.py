@@ -20,16 +20,214 @@ db.save_candle('005930', datetime.now(), 75000, 75500, 74800, 75300, 1000000)
 candles = db.get_candles('005930', start_date, end_date)
 """
 
+import glob
 import os
 import sqlite3
+from contextlib import contextmanager
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterator, List, NamedTuple, Optional, Tuple
+import queue
+import shutil
 import threading
+import time
 import csv
+import itertools
+import struct
+
+import numpy as np
+import pandas as pd
 
 from utils.logger import log
 
+# DuckDB (선택적 - 32비트 Python 미지원, 없으면 SQLite로만 분석 쿼리 수행)
+try:
+    import duckdb
+    DUCKDB_AVAILABLE = True
+except ImportError:
+    DUCKDB_AVAILABLE = False
+
+
+# epoch 초 → 로컬 날짜(YYYYMMDD) / 로컬 자정 epoch 초 (SQL 식, {ts}에 열 이름)
+_SQL_LOCAL_DATE = "CAST(strftime('%Y%m%d', {ts}, 'unixepoch', 'localtime') AS INTEGER)"
+_SQL_LOCAL_DAY_START = (
+    "CAST(strftime('%s', {ts}, 'unixepoch', 'localtime', 'start of day', 'utc') AS INTEGER)"
+)
+
+# 자주 실행하는 쿼리 (문자열이 고정되어야 연결의 prepared statement 캐시에 재사용됨)
+# 행 값은 _candle_row()에서 정규화한 그대로 저장 (최신 1분봉 캐시와 같은 값)
+_SQL_INSERT_CANDLE = """
+    INSERT OR REPLACE INTO candles
+    (stock_code, timestamp, open, high, low, close, volume)
+    VALUES (?, ?, ?, ?, ?, ?, ?)
+"""
+
+_SQL_SELECT_RANGE = """
+    SELECT stock_code, timestamp, open, high, low, close, volume
+    FROM candles
+    WHERE stock_code = ?
+      AND timestamp >= ?
+      AND timestamp <= ?
+    ORDER BY timestamp ASC
+"""
+
+_SQL_SELECT_RANGE_VALUES = """
+    SELECT timestamp, open, high, low, close, volume
+    FROM candles
+    WHERE stock_code = ?
+      AND timestamp >= ?
+      AND timestamp <= ?
+    ORDER BY timestamp ASC
+"""
+
+_SQL_SELECT_LATEST = """
+    SELECT stock_code, timestamp, open, high, low, close, volume
+    FROM candles
+    WHERE stock_code = ?
+    ORDER BY timestamp DESC
+    LIMIT 1
+"""
+
+_SQL_SELECT_LATEST_ALL = """
+    SELECT c.stock_code, c.timestamp, c.open, c.high, c.low, c.close, c.volume
+    FROM candles c
+    JOIN (
+        SELECT stock_code, MAX(timestamp) AS timestamp
+        FROM candles
+        GROUP BY stock_code
+    ) latest USING (stock_code, timestamp)
+"""
+
+_SQL_SELECT_STOCKS = """
+    SELECT DISTINCT stock_code
+    FROM candles
+    ORDER BY stock_code
+"""
+
+_SQL_DAILY_STATS = """
+    SELECT
+        SUM(n) as candle_count,
+        MIN(lo) as min_price,
+        MAX(hi) as max_price,
+        SUM(sum_close) as close_sum,
+        SUM(sum_vol) as total_volume,
+        MIN(first_ts) as first_time,
+        MAX(last_ts) as last_time
+    FROM candles_daily
+    WHERE stock_code = ?
+      AND date >= ?
+"""
+
+# 하루치 [00:00, 다음날 00:00) 반열린 구간 (PK 범위 스캔)
+_SQL_SELECT_DAY = """
+    SELECT timestamp, open, high, low, close, volume
+    FROM candles
+    WHERE stock_code = ?
+      AND timestamp >= ?
+      AND timestamp < ?
+    ORDER BY timestamp
+"""
+
+_SQL_SELECT_DAY_CSV = """
+    SELECT stock_code, datetime(timestamp, 'unixepoch', 'localtime'),
+           open, high, low, close, volume
+    FROM candles
+    WHERE stock_code = ?
+      AND timestamp >= ?
+      AND timestamp < ?
+    ORDER BY timestamp
+"""
+
+# WITHOUT ROWID 테이블이므로 PK로 삭제 대상 지정
+_SQL_DELETE_CHUNK = """
+    DELETE FROM candles
+    WHERE (stock_code, timestamp) IN (
+        SELECT stock_code, timestamp
+        FROM candles
+        WHERE timestamp < ?
+        LIMIT ?
+    )
+"""
+
+_SQL_DELETE_DAY = """
+    DELETE FROM candles
+    WHERE stock_code = ?
+      AND timestamp >= ?
+      AND timestamp < ?
+"""
+
+_SQL_SELECT_ARCHIVE = "SELECT blob FROM candles_archive WHERE stock_code = ? AND date = ?"
+
+_SQL_INSERT_ARCHIVE = """
+    INSERT OR REPLACE INTO candles_archive (stock_code, date, blob)
+    VALUES (?, ?, ?)
+"""
+
+# 보관 1분봉 레코드 (고정 폭 24바이트, 리틀 엔디언)
+# timestamp(uint32, epoch 초) + open/high/low/close(float32) + volume(uint32)
+_ARCHIVE_RECORD_FORMAT = 'IffffI'
+_ARCHIVE_DTYPE = np.dtype([
+    ('t', '<u4'), ('o', '<f4'), ('h', '<f4'), ('l', '<f4'), ('c', '<f4'), ('v', '<u4')
+])
+
+# 보관 테이블로 옮긴 (종목, 기준일)은 candles에 1분봉이 없으므로 기존 집계를 그대로 둠
+# (보관 BLOB도 기준일 것은 삭제하지 않아 집계와 원본이 계속 일치)
+_SQL_DELETE_DAILY_BEFORE = """
+    DELETE FROM candles_daily
+    WHERE date < ?
+       OR (date = ? AND NOT EXISTS (
+              SELECT 1 FROM candles_archive a
+              WHERE a.stock_code = candles_daily.stock_code AND a.date = candles_daily.date))
+"""
+
+_SQL_REBUILD_DAILY_DAY = f"""
+    INSERT INTO candles_daily
+    (stock_code, date, n, lo, hi, sum_close, sum_vol, first_ts, last_ts)
+    SELECT stock_code, ?1, COUNT(*), MIN(low), MAX(high), SUM(close),
+           SUM(volume), MIN(timestamp), MAX(timestamp)
+    FROM candles
+    WHERE timestamp >= ?2
+      AND timestamp < {_SQL_LOCAL_DAY_START.format(ts='?2')} + 86400
+      AND NOT EXISTS (
+          SELECT 1 FROM candles_archive a
+          WHERE a.stock_code = candles.stock_code AND a.date = ?1)
+    GROUP BY stock_code
+"""
+
+
+def _candle_row(stock_code: str, ts: int, open_price, high, low, close, volume) -> tuple:
+    """
+    저장용 1분봉 행 (가격은 소수 둘째 자리로 반올림, 거래량은 정수)
+    
+    소수부가 없는 REAL 값은 SQLite가 디스크에 정수로 작게 저장합니다.
+    쓰기 대기열과 최신 1분봉 캐시에 같은 튜플을 사용해 조회 결과가 어긋나지 않도록 합니다.
+    """
+    return (
+        stock_code,
+        ts,
+        round(float(open_price), 2),
+        round(float(high), 2),
+        round(float(low), 2),
+        round(float(close), 2),
+        int(volume)
+    )
+
+
+class CandleRecord(NamedTuple):
+    """
+    조회된 1분봉 레코드 (불변)
+    
+    딕셔너리 대신 튜플 기반이라 행당 메모리가 작고 필드 접근이 빠릅니다.
+    딕셔너리가 필요하면 _asdict()를 사용하세요.
+    """
+    stock_code: str
+    timestamp: datetime
+    open: float
+    high: float
+    low: float
+    close: float
+    volume: int
+
 
 class StockDatabase:
     """
@@ -37,13 +235,28 @@ class StockDatabase:
     
     SQLite를 사용하여 시계열 데이터를 효율적으로 저장하고 조회합니다.
     32비트/64비트 Python 모두 지원합니다.
+    
+    DuckDB가 설치되어 있으면 마감된 거래일을 Parquet 파티션
+    (date=YYYY-MM-DD/stock_code=XXXXXX)으로 내보내고, 통계 쿼리는
+    Parquet(DuckDB) + 최근 구간(SQLite)으로 나누어 처리합니다.
     """
     
+    # 백그라운드 쓰기 스레드 설정
+    WRITE_QUEUE_MAX = 10000     # 쓰기 대기열 최대 항목 수 (가득 차면 저장 요청을 버림)
+    WRITE_BATCH_ROWS = 1000     # 한 트랜잭션에 모으는 최대 행 수
+    WRITE_BATCH_WAIT_SEC = 0.2  # 첫 항목 이후 배치를 모으는 최대 시간
+    
+    # 읽기 전용 연결 풀 크기 (쓰기 연결은 1개)
+    READER_POOL_SIZE = 4
+    
+    # cleanup_old_data 트랜잭션당 삭제 행 수
+    CLEANUP_CHUNK_ROWS = 50000
+    
     def __init__(self, db_path: str = "data/stocks.db", parquet_dir: str = "data/parquet"):
         """
         Args:
             db_path: SQLite 데이터베이스 파일 경로
-            parquet_dir: CSV 파일 저장 디렉토리 (Parquet 대신 CSV 사용)
+            parquet_dir: CSV/Parquet 내보내기 디렉토리
         """
         self.db_path = db_path
         self.parquet_dir = parquet_dir
@@ -57,52 +270,306 @@ class StockDatabase:
         self.backup_dir = os.path.join(parquet_dir, "backups")
         Path(self.backup_dir).mkdir(parents=True, exist_ok=True)
         
-        # 스레드 로컬 연결 (멀티스레드 지원)
-        self._local = threading.local()
+        # 쓰기 연결 1개 + 읽기 전용 연결 풀 (WAL 모드에서 읽기가 쓰기를 기다리지 않음)
+        self._writer = self._open_connection()
+        self._writer_lock = threading.Lock()
         
         # 테이블 초기화
         self._init_tables()
         
+        # 인메모리 DB는 연결마다 별도 DB이므로 읽기도 쓰기 연결을 사용
+        self._read_pool: "queue.Queue[sqlite3.Connection]" = queue.Queue()
+        if db_path != ':memory:':
+            for _ in range(self.READER_POOL_SIZE):
+                self._read_pool.put(self._open_connection(read_only=True))
+        
+        # 종목별 최신 1분봉 캐시 {종목코드: (timestamp, open, high, low, close, volume)}
+        # 매매 루프의 최신가 조회가 SQLite를 거치지 않도록 저장 시점에 갱신
+        self._last: Dict[str, tuple] = {}
+        self._last_lock = threading.Lock()
+        self._warm_latest_cache()
+        
+        # 분석 쿼리용 DuckDB (인메모리, 스레드마다 cursor()로 분리 사용)
+        self._duck = duckdb.connect(':memory:') if DUCKDB_AVAILABLE else None
+        
+        # 쓰기 대기열 + 백그라운드 쓰기 스레드
+        # 저장 호출은 대기열에 넣고 바로 반환하며, 쓰기 스레드가 모아서 한 트랜잭션으로 기록
+        # 항목: 행 튜플 / 행 리스트(배치) / threading.Event(flush_sync 요청) / None(종료)
+        self._wq: queue.Queue = queue.Queue(maxsize=self.WRITE_QUEUE_MAX)
+        self._closed = False
+        self._dropped_rows = 0  # 대기열이 가득 차 버린 1분봉 수 (누적)
+        self._writer_thread = threading.Thread(
+            target=self._writer_loop,
+            name="StockDatabaseWriter",
+            daemon=True
+        )
+        self._writer_thread.start()
+        
         log.success(f"✅ 데이터베이스 초기화 완료: {db_path}")
     
-    def _get_connection(self):
-        """스레드별 독립적인 SQLite 연결 반환"""
-        if not hasattr(self._local, 'conn') or self._local.conn is None:
-            self._local.conn = sqlite3.connect(
-                self.db_path,
-                check_same_thread=False,
-                timeout=30.0
-            )
-            # Row factory 설정 (딕셔너리처럼 접근 가능)
-            self._local.conn.row_factory = sqlite3.Row
-        return self._local.conn
+    def _open_connection(self, read_only: bool = False) -> sqlite3.Connection:
+        """
+        SQLite 연결 생성 (여러 스레드에서 공유하므로 check_same_thread=False)
+        
+        isolation_level=None(자동 커밋)으로 열어 sqlite3 모듈의 암묵적 BEGIN을 끄고,
+        쓰기는 _transaction()에서 BEGIN IMMEDIATE ~ COMMIT으로 직접 묶습니다.
+        """
+        conn = sqlite3.connect(
+            self.db_path,
+            check_same_thread=False,
+            timeout=30.0,
+            isolation_level=None,
+            cached_statements=256
+        )
+        self._apply_pragmas(conn)
+        if read_only:
+            conn.execute("PRAGMA query_only=1")
+        # row_factory 없이 기본 튜플로 조회 (행마다 Row 객체를 만들지 않도록 인덱스로만 접근)
+        return conn
+    
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        """쓰기 잠금을 잡고 쓰기 연결에서 BEGIN IMMEDIATE ~ COMMIT (예외 시 ROLLBACK)"""
+        with self._writer_lock:
+            conn = self._writer
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield conn
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("COMMIT")
+    
+    @contextmanager
+    def _reader(self) -> Iterator[sqlite3.Connection]:
+        """읽기 전용 연결을 풀에서 빌려 쓰고 반환"""
+        if self.db_path == ':memory:':
+            with self._writer_lock:
+                yield self._writer
+            return
+        
+        conn = self._read_pool.get()
+        try:
+            yield conn
+        finally:
+            self._read_pool.put(conn)
+    
+    def _apply_pragmas(self, conn: sqlite3.Connection):
+        """
+        연결 성능 설정 (PRAGMA)
+        
+        WAL 모드에서는 1분봉 쓰기 중에도 읽기가 막히지 않고,
+        synchronous=NORMAL로 커밋마다 fsync하지 않습니다.
+        """
+        # 새 DB는 증분 VACUUM 모드로 생성 (DB 파일이 만들어지기 전, WAL 전환보다 먼저)
+        # 기존 DB에는 영향 없음 - full_vacuum() 시 전환
+        conn.execute("PRAGMA auto_vacuum=INCREMENTAL")
+        if self.db_path != ':memory:':
+            conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.execute("PRAGMA cache_size=-65536")        # 64 MiB
+        conn.execute("PRAGMA mmap_size=268435456")      # 256 MiB
+        conn.execute("PRAGMA wal_autocheckpoint=1000")
+        conn.execute("PRAGMA busy_timeout=30000")
+        conn.execute("PRAGMA foreign_keys=ON")
     
     def _init_tables(self):
         """테이블 생성 및 인덱스 설정"""
-        conn = self._get_connection()
-        cursor = conn.cursor()
+        conn = self._writer
+        
+        # 이전 버전 테이블 변환 (TEXT 타임스탬프 → INTEGER, rowid 테이블 → WITHOUT ROWID)
+        self._migrate_text_to_int_timestamps(conn)
+        self._rebuild_without_rowid(conn)
         
         # OHLCV 1분봉 테이블
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS candles (
+        self._create_candles_table(conn, 'candles')
+        
+        # date 열 인덱스 제거 (날짜 조회는 PK의 timestamp 범위로 처리)
+        conn.execute("DROP INDEX IF EXISTS idx_candles_stock_date")
+        
+        # 인덱스 생성 (쿼리 성능 향상)
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_candles_timestamp ON candles(timestamp)")
+        
+        # 일별 집계 테이블 (get_statistics용)
+        self._init_daily_rollup(conn)
+        
+        # 압축 보관 테이블 (종목·날짜별 1분봉을 고정 폭 레코드 BLOB 하나로 저장)
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS candles_archive (
                 stock_code TEXT NOT NULL,
-                timestamp TEXT NOT NULL,
+                date INTEGER NOT NULL,
+                blob BLOB NOT NULL,
+                PRIMARY KEY (stock_code, date)
+            ) WITHOUT ROWID
+        """)
+        
+        log.info("데이터베이스 테이블 초기화 완료")
+    
+    def _init_daily_rollup(self, conn: sqlite3.Connection):
+        """
+        일별 집계 테이블(candles_daily)과 유지 트리거 생성
+        
+        date는 로컬 날짜(YYYYMMDD)이며, 1분봉이 INSERT될 때 트리거가 갱신합니다.
+        INSERT OR REPLACE로 같은 분을 덮어쓰면 BEFORE 트리거가 이전 행을 빼고,
+        이전 행이 최저/최고가였다면 lo/hi를 NULL로 두어 AFTER 트리거가 그날을 다시 계산합니다.
+        (오래된 데이터 삭제 시 집계는 cleanup_old_data에서 직접 맞춥니다)
+        """
+        # 생성/백필을 한 트랜잭션으로 (중간 실패 시 다음 시작에서 다시 백필)
+        with self._transaction():
+            is_new = conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'candles_daily'"
+            ).fetchone() is None
+            
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS candles_daily (
+                    stock_code TEXT NOT NULL,
+                    date INTEGER NOT NULL,
+                    n INTEGER NOT NULL,
+                    lo REAL,
+                    hi REAL,
+                    sum_close REAL NOT NULL,
+                    sum_vol INTEGER NOT NULL,
+                    first_ts INTEGER NOT NULL,
+                    last_ts INTEGER NOT NULL,
+                    PRIMARY KEY (stock_code, date)
+                ) WITHOUT ROWID
+            """)
+            
+            conn.execute(f"""
+                CREATE TRIGGER IF NOT EXISTS candles_daily_replace
+                BEFORE INSERT ON candles
+                BEGIN
+                    UPDATE candles_daily SET
+                        n = n - 1,
+                        lo = CASE WHEN prev.low <= candles_daily.lo THEN NULL ELSE candles_daily.lo END,
+                        hi = CASE WHEN prev.high >= candles_daily.hi THEN NULL ELSE candles_daily.hi END,
+                        sum_close = sum_close - prev.close,
+                        sum_vol = sum_vol - prev.volume
+                    FROM (
+                        SELECT low, high, close, volume
+                        FROM candles
+                        WHERE stock_code = NEW.stock_code
+                          AND timestamp = NEW.timestamp
+                    ) AS prev
+                    WHERE candles_daily.stock_code = NEW.stock_code
+                      AND candles_daily.date = {_SQL_LOCAL_DATE.format(ts='NEW.timestamp')};
+                END
+            """)
+            
+            day_start = _SQL_LOCAL_DAY_START.format(ts='NEW.timestamp')
+            conn.execute(f"""
+                CREATE TRIGGER IF NOT EXISTS candles_daily_insert
+                AFTER INSERT ON candles
+                BEGIN
+                    INSERT INTO candles_daily
+                    (stock_code, date, n, lo, hi, sum_close, sum_vol, first_ts, last_ts)
+                    VALUES (
+                        NEW.stock_code, {_SQL_LOCAL_DATE.format(ts='NEW.timestamp')}, 1,
+                        NEW.low, NEW.high, NEW.close, NEW.volume, NEW.timestamp, NEW.timestamp
+                    )
+                    ON CONFLICT (stock_code, date) DO UPDATE SET
+                        n = n + 1,
+                        lo = CASE WHEN lo IS NULL THEN (
+                            SELECT MIN(low) FROM candles
+                            WHERE stock_code = NEW.stock_code
+                              AND timestamp >= {day_start}
+                              AND timestamp < {day_start} + 86400
+                        ) ELSE min(lo, excluded.lo) END,
+                        hi = CASE WHEN hi IS NULL THEN (
+                            SELECT MAX(high) FROM candles
+                            WHERE stock_code = NEW.stock_code
+                              AND timestamp >= {day_start}
+                              AND timestamp < {day_start} + 86400
+                        ) ELSE max(hi, excluded.hi) END,
+                        sum_close = sum_close + excluded.sum_close,
+                        sum_vol = sum_vol + excluded.sum_vol,
+                        first_ts = min(first_ts, excluded.first_ts),
+                        last_ts = max(last_ts, excluded.last_ts);
+                END
+            """)
+            
+            # 기존 1분봉으로 1회 채우기
+            if is_new:
+                conn.execute(f"""
+                    INSERT INTO candles_daily
+                    (stock_code, date, n, lo, hi, sum_close, sum_vol, first_ts, last_ts)
+                    SELECT stock_code, {_SQL_LOCAL_DATE.format(ts='timestamp')} AS day,
+                           COUNT(*), MIN(low), MAX(high), SUM(close), SUM(volume),
+                           MIN(timestamp), MAX(timestamp)
+                    FROM candles
+                    GROUP BY stock_code, day
+                """)
+    
+    @staticmethod
+    def _create_candles_table(conn: sqlite3.Connection, table_name: str):
+        """
+        1분봉 테이블 생성
+        
+        timestamp는 Unix epoch 초(INTEGER)이며, 복합 PK로 모든 조회가 처리되므로
+        WITHOUT ROWID로 만들어 숨은 rowid B-tree를 두지 않습니다.
+        """
+        conn.execute(f"""
+            CREATE TABLE IF NOT EXISTS {table_name} (
+                stock_code TEXT NOT NULL,
+                timestamp INTEGER NOT NULL,
                 open REAL NOT NULL,
                 high REAL NOT NULL,
                 low REAL NOT NULL,
                 close REAL NOT NULL,
                 volume INTEGER NOT NULL,
-                date TEXT NOT NULL,
                 PRIMARY KEY (stock_code, timestamp)
-            )
+            ) WITHOUT ROWID
         """)
+    
+    def _rebuild_without_rowid(self, conn: sqlite3.Connection):
+        """기존 rowid 1분봉 테이블을 WITHOUT ROWID 테이블로 1회 재구성 (date 열도 함께 제거)"""
+        row = conn.execute(
+            "SELECT sql FROM sqlite_master WHERE type = 'table' AND name = 'candles'"
+        ).fetchone()
+        if row is None or 'WITHOUT ROWID' in row[0].upper():
+            return
         
-        # 인덱스 생성 (쿼리 성능 향상)
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_candles_stock_date ON candles(stock_code, date)")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_candles_timestamp ON candles(timestamp)")
+        log.info("1분봉 테이블 재구성 중 (WITHOUT ROWID)...")
+        with self._transaction():
+            self._create_candles_table(conn, 'candles_new')
+            conn.execute("""
+                INSERT INTO candles_new
+                (stock_code, timestamp, open, high, low, close, volume)
+                SELECT stock_code, timestamp, open, high, low, close, volume
+                FROM candles
+            """)
+            conn.execute("DROP TABLE candles")
+            conn.execute("ALTER TABLE candles_new RENAME TO candles")
         
-        conn.commit()
-        log.info("데이터베이스 테이블 초기화 완료")
+        log.success("1분봉 테이블 재구성 완료 (WITHOUT ROWID)")
+    
+    def _migrate_text_to_int_timestamps(self, conn: sqlite3.Connection):
+        """
+        TEXT 타임스탬프('YYYY-MM-DD HH:MM:SS') 테이블을 INTEGER(epoch 초)로 1회 변환
+        
+        기존 문자열은 로컬 시간이므로 'utc' 수정자로 epoch로 바꿉니다.
+        """
+        columns = {row[1]: row[2].upper() for row in conn.execute("PRAGMA table_info(candles)")}
+        if columns.get('timestamp') != 'TEXT':
+            return
+        
+        log.info("1분봉 테이블 변환 중 (TEXT → INTEGER 타임스탬프)...")
+        with self._transaction():
+            self._create_candles_table(conn, 'candles_new')
+            conn.execute("""
+                INSERT OR REPLACE INTO candles_new
+                (stock_code, timestamp, open, high, low, close, volume)
+                SELECT
+                    stock_code,
+                    CAST(strftime('%s', timestamp, 'utc') AS INTEGER),
+                    open, high, low, close, volume
+                FROM candles
+            """)
+            conn.execute("DROP TABLE candles")
+            conn.execute("ALTER TABLE candles_new RENAME TO candles")
+        
+        log.success("1분봉 테이블 변환 완료 (INTEGER 타임스탬프)")
     
     def save_candle(
         self,
@@ -115,7 +582,7 @@ class StockDatabase:
         volume: int
     ) -> bool:
         """
-        1분봉 데이터 저장
+        1분봉 데이터 저장 (쓰기 대기열에 넣고 바로 반환)
         
         Args:
             stock_code: 종목 코드
@@ -127,73 +594,179 @@ class StockDatabase:
             volume: 거래량
             
         Returns:
-            저장 성공 여부
+            저장 요청 성공 여부
         """
         if not self.enabled:
             return False
         
         try:
-            conn = self._get_connection()
-            cursor = conn.cursor()
-            date = timestamp.strftime('%Y-%m-%d')
-            timestamp_str = timestamp.strftime('%Y-%m-%d %H:%M:%S')
+            ts = int(timestamp.timestamp())
             
-            # INSERT OR REPLACE (중복 시 업데이트)
-            cursor.execute("""
-                INSERT OR REPLACE INTO candles 
-                (stock_code, timestamp, open, high, low, close, volume, date)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-            """, (stock_code, timestamp_str, open_price, high, low, close, volume, date))
+            row = _candle_row(stock_code, ts, open_price, high, low, close, volume)
             
-            conn.commit()
+            # 쓰기 대기열에 추가 (실제 저장은 쓰기 스레드가 일괄 처리)
+            if not self._enqueue(row, 1):
+                return False
+            self._remember_latest((row,))
             return True
             
         except Exception as e:
             log.error(f"1분봉 저장 오류 ({stock_code}): {e}")
             return False
     
+    def _enqueue(self, item, row_count: int) -> bool:
+        """
+        쓰기 대기열에 추가 (대기하지 않음)
+        
+        실시간 데이터 수신(메인) 스레드에서 호출되므로, 쓰기 스레드가 밀려 대기열이 가득 차면
+        기다리지 않고 버립니다. close() 이후에는 종료된 쓰기 스레드 대신 바로 거부합니다.
+        
+        Args:
+            item: 행 튜플 또는 행 리스트
+            row_count: 항목의 행 수 (버린 행 수 집계용)
+            
+        Returns:
+            대기열 추가 여부
+        """
+        if self._closed:
+            log.debug("데이터베이스가 닫혀 1분봉 저장 요청을 무시합니다.")
+            return False
+        
+        try:
+            self._wq.put_nowait(item)
+            return True
+        except queue.Full:
+            # 처음과 이후 1000행마다만 기록 (가득 찬 동안 매 호출 경고 방지)
+            before = self._dropped_rows
+            self._dropped_rows += row_count
+            if before == 0 or before // 1000 != self._dropped_rows // 1000:
+                log.warning(f"⚠️ 쓰기 대기열 가득 참 - 1분봉 저장 요청 버림 (누적 {self._dropped_rows}행)")
+            return False
+    
+    def _remember_latest(self, rows):
+        """저장한 행들로 최신 1분봉 캐시 갱신 (같은 분은 덮어쓰기 - INSERT OR REPLACE와 동일)"""
+        with self._last_lock:
+            last = self._last
+            for row in rows:
+                current = last.get(row[0])
+                if current is None or row[1] >= current[0]:
+                    last[row[0]] = row[1:]
+    
+    def _warm_latest_cache(self):
+        """시작 시 종목별 최신 1분봉으로 캐시 채우기"""
+        try:
+            with self._reader() as conn:
+                rows = conn.execute(_SQL_SELECT_LATEST_ALL).fetchall()
+            self._remember_latest(rows)
+        except Exception as e:
+            log.error(f"최신 1분봉 캐시 초기화 오류: {e}")
+    
+    def flush_sync(self, timeout: Optional[float] = None) -> bool:
+        """
+        지금까지 대기열에 넣은 1분봉이 모두 기록될 때까지 대기
+        
+        Args:
+            timeout: 최대 대기 시간 (초, None이면 무제한)
+            
+        Returns:
+            제한 시간 안에 기록 완료 여부
+        """
+        if self._closed or not self._writer_thread.is_alive():
+            return self._wq.empty()
+        
+        done = threading.Event()
+        try:
+            self._wq.put(done, timeout=timeout)
+        except queue.Full:
+            return False
+        return done.wait(timeout)
+    
+    def _write_rows(self, rows: List[tuple]):
+        """1분봉 행들을 executemany + 단일 트랜잭션으로 저장"""
+        with self._transaction() as conn:
+            # INSERT OR REPLACE (중복 시 업데이트)
+            conn.executemany(_SQL_INSERT_CANDLE, rows)
+    
+    def _writer_loop(self):
+        """
+        쓰기 대기열 처리 (백그라운드 스레드)
+        
+        최대 WRITE_BATCH_ROWS행 또는 WRITE_BATCH_WAIT_SEC초까지 모아 한 트랜잭션으로
+        기록하고, flush_sync 요청이 들어오면 모은 행을 바로 기록한 뒤 알립니다.
+        """
+        stopping = False
+        while not stopping:
+            item = self._wq.get()
+            if item is None:
+                break
+            
+            rows: List[tuple] = []
+            waiters: List[threading.Event] = []
+            deadline = time.monotonic() + self.WRITE_BATCH_WAIT_SEC
+            while True:
+                if isinstance(item, tuple):
+                    rows.append(item)
+                elif isinstance(item, list):
+                    rows.extend(item)
+                else:
+                    waiters.append(item)
+                
+                remaining = deadline - time.monotonic()
+                if waiters or len(rows) >= self.WRITE_BATCH_ROWS or remaining <= 0:
+                    break
+                try:
+                    item = self._wq.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if item is None:
+                    stopping = True
+                    break
+            
+            if rows:
+                try:
+                    self._write_rows(rows)
+                except Exception as e:
+                    log.error(f"1분봉 저장 오류 ({len(rows)}개): {e}")
+            for waiter in waiters:
+                waiter.set()
+    
     def save_candles_batch(self, candles: List[Dict]) -> int:
         """
         여러 1분봉 데이터를 배치로 저장 (고성능)
         
+        쓰기 대기열에 넣고 바로 반환합니다. 기록 완료가 필요하면 flush_sync()를 호출하세요.
+        
         Args:
             candles: 1분봉 데이터 리스트
                     [{'stock_code': str, 'timestamp': datetime, 'open': float, ...}, ...]
+                    (timestamp는 Unix epoch 초(int)도 허용)
         
         Returns:
-            저장된 레코드 수
+            저장 요청한 레코드 수
         """
         if not self.enabled or not candles:
             return 0
         
         try:
-            conn = self._get_connection()
-            cursor = conn.cursor()
-            
-            # 배치 삽입 (매우 빠름)
-            data = []
-            for candle in candles:
-                timestamp_str = candle['timestamp'].strftime('%Y-%m-%d %H:%M:%S')
-                date_str = candle['timestamp'].strftime('%Y-%m-%d')
-                data.append((
-                    candle['stock_code'],
-                    timestamp_str,
-                    candle['open'],
-                    candle['high'],
-                    candle['low'],
-                    candle['close'],
-                    candle['volume'],
-                    date_str
-                ))
-            
-            cursor.executemany("""
-                INSERT OR REPLACE INTO candles 
-                (stock_code, timestamp, open, high, low, close, volume, date)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-            """, data)
-            
-            conn.commit()
-            log.debug(f"배치 저장 완료: {len(candles)}개")
+            # 행 튜플을 한 번의 컴프리헨션으로 생성
+            data = [
+                _candle_row(
+                    c['stock_code'],
+                    ts if isinstance(ts := c['timestamp'], int) else int(ts.timestamp()),
+                    c['open'],
+                    c['high'],
+                    c['low'],
+                    c['close'],
+                    c['volume']
+                )
+                for c in candles
+            ]
+            
+            # 쓰기 대기열에 추가 (실제 저장은 쓰기 스레드가 처리)
+            if not self._enqueue(data, len(data)):
+                return 0
+            self._remember_latest(data)
+            log.debug(f"배치 저장 요청: {len(candles)}개")
             return len(candles)
             
         except Exception as e:
@@ -205,7 +778,7 @@ class StockDatabase:
         stock_code: str,
         start_date: datetime,
         end_date: datetime
-    ) -> List[Dict]:
+    ) -> List[CandleRecord]:
         """
         특정 기간의 1분봉 데이터 조회
         
@@ -215,45 +788,144 @@ class StockDatabase:
             end_date: 종료 시간
             
         Returns:
-            1분봉 데이터 리스트
+            1분봉 레코드(CandleRecord) 리스트
         """
         if not self.enabled:
             return []
         
         try:
-            conn = self._get_connection()
-            cursor = conn.cursor()
+            start_ts = int(start_date.timestamp())
+            end_ts = int(end_date.timestamp())
             
-            start_str = start_date.strftime('%Y-%m-%d %H:%M:%S')
-            end_str = end_date.strftime('%Y-%m-%d %H:%M:%S')
-            
-            cursor.execute("""
-                SELECT stock_code, timestamp, open, high, low, close, volume
-                FROM candles
-                WHERE stock_code = ?
-                  AND timestamp >= ?
-                  AND timestamp <= ?
-                ORDER BY timestamp ASC
-            """, (stock_code, start_str, end_str))
-            
-            candles = []
-            for row in cursor.fetchall():
-                candles.append({
-                    'stock_code': row[0],
-                    'timestamp': datetime.strptime(row[1], '%Y-%m-%d %H:%M:%S'),
-                    'open': row[2],
-                    'high': row[3],
-                    'low': row[4],
-                    'close': row[5],
-                    'volume': row[6]
-                })
-            
-            return candles
+            with self._reader() as conn:
+                rows = conn.execute(_SQL_SELECT_RANGE, (stock_code, start_ts, end_ts)).fetchall()
             
+            fromtimestamp = datetime.fromtimestamp
+            return [
+                CandleRecord(
+                    row[0],
+                    fromtimestamp(row[1]),
+                    row[2],
+                    row[3],
+                    row[4],
+                    row[5],
+                    row[6]
+                )
+                for row in rows
+            ]
+                
         except Exception as e:
             log.error(f"1분봉 조회 오류 ({stock_code}): {e}")
             return []
     
+    def get_candles_df(
+        self,
+        stock_code: str,
+        start_date: datetime,
+        end_date: datetime
+    ) -> Optional[pd.DataFrame]:
+        """
+        특정 기간의 1분봉 데이터를 DataFrame으로 조회 (백테스트/지표 계산용)
+        
+        행 단위 객체를 만들지 않고 열 단위로 받으며, timestamp는
+        epoch 초 열 전체를 한 번에 로컬 시간 datetime64로 변환합니다.
+        
+        Args:
+            stock_code: 종목 코드
+            start_date: 시작 시간
+            end_date: 종료 시간
+            
+        Returns:
+            columns = [stock_code, timestamp, open, high, low, close, volume]
+            (오류 시 None)
+        """
+        if not self.enabled:
+            return None
+        
+        try:
+            with self._reader() as conn:
+                rows = conn.execute(
+                    _SQL_SELECT_RANGE,
+                    (stock_code, int(start_date.timestamp()), int(end_date.timestamp()))
+                ).fetchall()
+            
+            df = pd.DataFrame.from_records(
+                rows, columns=['stock_code', 'timestamp', 'open', 'high', 'low', 'close', 'volume']
+            )
+            local_tz = datetime.now().astimezone().tzinfo
+            df['timestamp'] = (
+                pd.to_datetime(df['timestamp'], unit='s', utc=True)
+                .dt.tz_convert(local_tz)
+                .dt.tz_localize(None)
+            )
+            return df
+                
+        except Exception as e:
+            log.error(f"1분봉 DataFrame 조회 오류 ({stock_code}): {e}")
+            return None
+    
+    def get_candles_arrays(
+        self,
+        stock_code: str,
+        start_date: datetime,
+        end_date: datetime
+    ) -> Optional[Tuple[np.ndarray, ...]]:
+        """
+        특정 기간의 1분봉 데이터를 열별 NumPy 배열로 조회 (지표 계산 커널용)
+        
+        기간의 분 수만큼 배열을 미리 할당하고 fetchmany 블록 단위로 채웁니다.
+        
+        Args:
+            stock_code: 종목 코드
+            start_date: 시작 시간
+            end_date: 종료 시간
+            
+        Returns:
+            (timestamp[int64, epoch 초], open, high, low, close[float64], volume[int64])
+            (오류 시 None)
+        """
+        if not self.enabled:
+            return None
+        
+        try:
+            start_ts = int(start_date.timestamp())
+            end_ts = int(end_date.timestamp())
+            
+            capacity = max(1, (end_ts - start_ts) // 60 + 1)
+            values = np.empty((6, capacity), dtype=np.float64)
+            count = 0
+            
+            with self._reader() as conn:
+                cursor = conn.execute(_SQL_SELECT_RANGE_VALUES, (stock_code, start_ts, end_ts))
+                while True:
+                    rows = cursor.fetchmany(4096)
+                    if not rows:
+                        break
+                    
+                    block = np.array(rows, dtype=np.float64).T
+                    end = count + block.shape[1]
+                    if end > capacity:
+                        capacity = max(end, capacity * 2)
+                        grown = np.empty((6, capacity), dtype=np.float64)
+                        grown[:, :count] = values[:, :count]
+                        values = grown
+                    values[:, count:end] = block
+                    count = end
+            
+            values = values[:, :count]
+            return (
+                values[0].astype(np.int64),
+                values[1],
+                values[2],
+                values[3],
+                values[4],
+                values[5].astype(np.int64)
+            )
+            
+        except Exception as e:
+            log.error(f"1분봉 배열 조회 오류 ({stock_code}): {e}")
+            return None
+    
     def get_latest_candle(self, stock_code: str) -> Optional[Dict]:
         """
         최신 1분봉 데이터 조회
@@ -267,23 +939,27 @@ class StockDatabase:
         if not self.enabled:
             return None
         
+        cached = self._last.get(stock_code)
+        if cached is not None:
+            return {
+                'stock_code': stock_code,
+                'timestamp': datetime.fromtimestamp(cached[0]),
+                'open': cached[1],
+                'high': cached[2],
+                'low': cached[3],
+                'close': cached[4],
+                'volume': cached[5]
+            }
+        
         try:
-            conn = self._get_connection()
-            cursor = conn.cursor()
+            with self._reader() as conn:
+                result = conn.execute(_SQL_SELECT_LATEST, (stock_code,)).fetchone()
             
-            cursor.execute("""
-                SELECT stock_code, timestamp, open, high, low, close, volume
-                FROM candles
-                WHERE stock_code = ?
-                ORDER BY timestamp DESC
-                LIMIT 1
-            """, (stock_code,))
-            
-            result = cursor.fetchone()
             if result:
+                self._remember_latest((result,))
                 return {
                     'stock_code': result[0],
-                    'timestamp': datetime.strptime(result[1], '%Y-%m-%d %H:%M:%S'),
+                    'timestamp': datetime.fromtimestamp(result[1]),
                     'open': result[2],
                     'high': result[3],
                     'low': result[4],
@@ -292,7 +968,7 @@ class StockDatabase:
                 }
             
             return None
-            
+                
         except Exception as e:
             log.error(f"최신 1분봉 조회 오류 ({stock_code}): {e}")
             return None
@@ -307,6 +983,10 @@ class StockDatabase:
         Returns:
             최신 종가 또는 None
         """
+        cached = self._last.get(stock_code)
+        if cached is not None:
+            return cached[4]
+        
         candle = self.get_latest_candle(stock_code)
         return candle['close'] if candle else None
     
@@ -321,17 +1001,9 @@ class StockDatabase:
             return []
         
         try:
-            conn = self._get_connection()
-            cursor = conn.cursor()
-            
-            cursor.execute("""
-                SELECT DISTINCT stock_code
-                FROM candles
-                ORDER BY stock_code
-            """)
-            
-            return [row[0] for row in cursor.fetchall()]
-            
+            with self._reader() as conn:
+                return [row[0] for row in conn.execute(_SQL_SELECT_STOCKS).fetchall()]
+                
         except Exception as e:
             log.error(f"종목 목록 조회 오류: {e}")
             return []
@@ -340,6 +1012,9 @@ class StockDatabase:
         """
         종목 통계 조회
         
+        일 단위 집계 테이블(candles_daily)을 조회하므로 기간은
+        (오늘 - days)일 00:00부터입니다.
+        
         Args:
             stock_code: 종목 코드
             days: 통계 기간 (일)
@@ -351,49 +1026,276 @@ class StockDatabase:
             return None
         
         try:
-            conn = self._get_connection()
-            cursor = conn.cursor()
-            start_date = datetime.now() - timedelta(days=days)
-            start_str = start_date.strftime('%Y-%m-%d %H:%M:%S')
-            
-            cursor.execute("""
-                SELECT 
-                    COUNT(*) as candle_count,
-                    MIN(low) as min_price,
-                    MAX(high) as max_price,
-                    AVG(close) as avg_price,
-                    SUM(volume) as total_volume,
-                    MIN(timestamp) as first_time,
-                    MAX(timestamp) as last_time
-                FROM candles
-                WHERE stock_code = ?
-                  AND timestamp >= ?
-            """, (stock_code, start_str))
+            # 대기열의 1분봉까지 집계에 포함
+            self.flush_sync()
             
-            result = cursor.fetchone()
-            if result and result[0] > 0:
-                return {
-                    'stock_code': stock_code,
-                    'candle_count': result[0],
-                    'min_price': result[1],
-                    'max_price': result[2],
-                    'avg_price': result[3],
-                    'total_volume': result[4],
-                    'first_time': datetime.strptime(result[5], '%Y-%m-%d %H:%M:%S'),
-                    'last_time': datetime.strptime(result[6], '%Y-%m-%d %H:%M:%S'),
-                    'days': days
-                }
+            start_date = (datetime.now() - timedelta(days=days)).replace(
+                hour=0, minute=0, second=0, microsecond=0
+            )
+            start_ts = int(start_date.timestamp())
             
-            return None
+            # Parquet로 내보낸 마감일까지는 DuckDB, 그 이후는 SQLite에서 집계
+            parts = []
+            split_date = start_date
+            last_day = self._latest_parquet_day(stock_code)
+            if last_day is not None:
+                split_date = max(start_date, last_day + timedelta(days=1))
+                if split_date > start_date:
+                    parts.append(self._parquet_statistics(
+                        stock_code, start_ts, int(split_date.timestamp())
+                    ))
+            
+            with self._reader() as conn:
+                parts.append(conn.execute(
+                    _SQL_DAILY_STATS, (stock_code, _yyyymmdd(split_date))
+                ).fetchone())
+            
+            parts = [part for part in parts if part and part[0]]
+            if not parts:
+                return None
+            
+            candle_count = sum(part[0] for part in parts)
+            return {
+                'stock_code': stock_code,
+                'candle_count': candle_count,
+                'min_price': min(part[1] for part in parts),
+                'max_price': max(part[2] for part in parts),
+                'avg_price': sum(part[3] for part in parts) / candle_count,
+                'total_volume': sum(part[4] for part in parts),
+                'first_time': datetime.fromtimestamp(min(part[5] for part in parts)),
+                'last_time': datetime.fromtimestamp(max(part[6] for part in parts)),
+                'days': days
+            }
             
         except Exception as e:
             log.error(f"통계 조회 오류 ({stock_code}): {e}")
             return None
     
+    def archive_day(self, stock_code: str, date: datetime.date) -> int:
+        """
+        지난 거래일의 1분봉을 압축 보관 테이블(candles_archive)로 옮기기
+        
+        하루치 행을 고정 폭 레코드(_ARCHIVE_RECORD_FORMAT) 배열 BLOB 하나로 묶어 저장하고
+        candles에서는 삭제합니다. 일별 집계(candles_daily)는 그대로 두므로 통계에 계속 포함됩니다.
+        가격은 float32로 저장되므로 원 단위 정수 가격이 아니면 오차가 생길 수 있습니다.
+        
+        Args:
+            stock_code: 종목 코드
+            date: 날짜
+            
+        Returns:
+            보관된 1분봉 수
+        """
+        if not self.enabled:
+            return 0
+        
+        try:
+            self.flush_sync()
+            
+            day = _yyyymmdd(date)
+            day_start = int(datetime(date.year, date.month, date.day).timestamp())
+            day_end = day_start + 86400
+            
+            with self._transaction() as conn:
+                rows = conn.execute(_SQL_SELECT_DAY, (stock_code, day_start, day_end)).fetchall()
+                if not rows:
+                    return 0
+                
+                # 이미 보관된 날짜면 합치기 (같은 분은 새 행 우선)
+                archived = conn.execute(_SQL_SELECT_ARCHIVE, (stock_code, day)).fetchone()
+                if archived is not None:
+                    new_ts = {row[0] for row in rows}
+                    old_rows = np.frombuffer(archived[0], dtype=_ARCHIVE_DTYPE).tolist()
+                    rows = sorted([row for row in old_rows if row[0] not in new_ts] + rows)
+                
+                blob = struct.pack(
+                    '<' + _ARCHIVE_RECORD_FORMAT * len(rows),
+                    *itertools.chain.from_iterable(rows)
+                )
+                conn.execute(_SQL_INSERT_ARCHIVE, (stock_code, day, blob))
+                conn.execute(_SQL_DELETE_DAY, (stock_code, day_start, day_end))
+            
+            log.info(f"1분봉 보관 완료: {stock_code} {date} ({len(rows)}개, {len(blob)} bytes)")
+            return len(rows)
+            
+        except Exception as e:
+            log.error(f"1분봉 보관 오류 ({stock_code}, {date}): {e}")
+            return 0
+    
+    def get_archived_candles(self, stock_code: str, date: datetime.date) -> Optional[np.ndarray]:
+        """
+        압축 보관된 하루치 1분봉 조회
+        
+        BLOB을 복사 없이 NumPy 구조화 배열(읽기 전용)로 해석합니다.
+        필드: t(epoch 초), o, h, l, c(float32), v(uint32)
+        
+        Args:
+            stock_code: 종목 코드
+            date: 날짜
+            
+        Returns:
+            구조화 배열 (보관된 데이터가 없으면 빈 배열, 오류 시 None)
+        """
+        if not self.enabled:
+            return None
+        
+        try:
+            with self._reader() as conn:
+                row = conn.execute(_SQL_SELECT_ARCHIVE, (stock_code, _yyyymmdd(date))).fetchone()
+            
+            if row is None:
+                return np.empty(0, dtype=_ARCHIVE_DTYPE)
+            return np.frombuffer(row[0], dtype=_ARCHIVE_DTYPE)
+            
+        except Exception as e:
+            log.error(f"보관 1분봉 조회 오류 ({stock_code}, {date}): {e}")
+            return None
+    
+    def _archived_day_rows(self, stock_code: str, date: datetime.date) -> List[tuple]:
+        """보관된 하루치 1분봉을 (timestamp, open, high, low, close, volume) 행 리스트로 변환"""
+        records = self.get_archived_candles(stock_code, date)
+        return [] if records is None else records.tolist()
+    
+    def _partition_dir(self, stock_code: str, date: datetime.date) -> str:
+        """Parquet 파티션 디렉토리 (date=YYYY-MM-DD/stock_code=XXXXXX)"""
+        return os.path.join(
+            self.parquet_dir,
+            f"date={date.strftime('%Y-%m-%d')}",
+            f"stock_code={stock_code}"
+        )
+    
+    def _parquet_glob(self, stock_code: str) -> str:
+        """종목의 전체 날짜 파티션 Parquet 파일 패턴"""
+        return os.path.join(self.parquet_dir, "date=*", f"stock_code={stock_code}", "*.parquet")
+    
+    def _latest_parquet_day(self, stock_code: str) -> Optional[datetime]:
+        """
+        Parquet로 내보낸 가장 최근 거래일 (없거나 DuckDB 미설치 시 None)
+        
+        마감일은 날짜 순서대로 내보낸다고 가정하고, 그 다음 날부터는 SQLite에서 조회합니다.
+        """
+        if self._duck is None:
+            return None
+        
+        days = [
+            Path(path).parent.parent.name[len("date="):]
+            for path in glob.glob(self._parquet_glob(stock_code))
+        ]
+        if not days:
+            return None
+        return datetime.fromisoformat(max(days))
+    
+    def _parquet_statistics(self, stock_code: str, start_ts: int, end_ts: int) -> tuple:
+        """
+        Parquet 파티션에서 [start_ts, end_ts) 구간 집계 (DuckDB)
+        
+        Returns:
+            (개수, 최저가, 최고가, 종가 합계, 거래량 합계, 첫 시각, 마지막 시각)
+        """
+        cursor = self._duck.cursor()
+        try:
+            return cursor.execute(f"""
+                SELECT COUNT(*), MIN(low), MAX(high), SUM(close),
+                       SUM(volume), MIN(timestamp), MAX(timestamp)
+                FROM read_parquet('{_sql_quote(self._parquet_glob(stock_code))}')
+                WHERE timestamp >= ?
+                  AND timestamp < ?
+            """, [start_ts, end_ts]).fetchone()
+        finally:
+            cursor.close()
+    
+    def export_to_parquet(self, stock_code: str, date: datetime.date) -> bool:
+        """
+        마감된 거래일의 데이터를 Parquet 파티션으로 내보내기 (DuckDB 필요)
+        
+        parquet_dir/date=YYYY-MM-DD/stock_code=XXXXXX/candles.parquet 에 ZSTD 압축으로
+        저장하며, 이후 get_statistics가 해당 날짜를 DuckDB로 집계합니다.
+        
+        Args:
+            stock_code: 종목 코드
+            date: 날짜
+            
+        Returns:
+            내보내기 성공 여부
+        """
+        if not self.enabled:
+            return False
+        
+        if self._duck is None:
+            log.warning("DuckDB 미설치 - Parquet 내보내기 불가 (export_to_csv 사용)")
+            return False
+        
+        try:
+            self.flush_sync()
+            
+            day_start = int(datetime(date.year, date.month, date.day).timestamp())
+            day_end = day_start + 86400
+            with self._reader() as conn:
+                rows = conn.execute(_SQL_SELECT_DAY, (stock_code, day_start, day_end)).fetchall()
+            
+            # 압축 보관된 날짜면 보관 레코드에서 읽기
+            if not rows:
+                rows = self._archived_day_rows(stock_code, date)
+            
+            if not rows:
+                log.warning(f"Parquet 내보내기 대상 없음: {stock_code} {date}")
+                return False
+            
+            partition_dir = self._partition_dir(stock_code, date)
+            Path(partition_dir).mkdir(parents=True, exist_ok=True)
+            filepath = os.path.join(partition_dir, "candles.parquet")
+            
+            # 가격은 float32, 거래량은 uint32로 저장 (열 너비 절반)
+            self._duck_copy(
+                rows,
+                ['timestamp', 'open', 'high', 'low', 'close', 'volume'],
+                filepath,
+                "FORMAT PARQUET, CODEC 'ZSTD'",
+                dtypes={
+                    'timestamp': 'int64',
+                    'open': 'float32',
+                    'high': 'float32',
+                    'low': 'float32',
+                    'close': 'float32',
+                    'volume': 'uint32'
+                }
+            )
+            
+            log.info(f"Parquet 내보내기 완료: {filepath}")
+            return True
+            
+        except Exception as e:
+            log.error(f"Parquet 내보내기 오류 ({stock_code}, {date}): {e}")
+            return False
+    
+    def _duck_copy(
+        self,
+        rows: List[tuple],
+        columns: List[str],
+        filepath: str,
+        options: str,
+        dtypes: Optional[Dict[str, str]] = None
+    ):
+        """조회한 행들을 DuckDB COPY로 파일에 기록 (행 단위 Python 쓰기 없음, dtypes로 열 타입 지정)"""
+        frame = pd.DataFrame.from_records(rows, columns=columns)
+        if dtypes:
+            frame = frame.astype(dtypes)
+        cursor = self._duck.cursor()
+        try:
+            cursor.register('export_rows', frame)
+            cursor.execute(f"""
+                COPY (SELECT * FROM export_rows)
+                TO '{_sql_quote(filepath)}' ({options})
+            """)
+        finally:
+            cursor.close()
+    
     def export_to_csv(self, stock_code: str, date: datetime.date) -> bool:
         """
         특정 날짜의 데이터를 CSV 파일로 내보내기
         
+        DuckDB가 있으면 COPY (FORMAT CSV)로 기록하고, 없으면 csv.writer를 사용합니다.
+        
         Args:
             stock_code: 종목 코드
             date: 날짜
@@ -405,8 +1307,7 @@ class StockDatabase:
             return False
         
         try:
-            conn = self._get_connection()
-            cursor = conn.cursor()
+            self.flush_sync()
             
             # 월별 폴더 생성
             month_dir = os.path.join(self.parquet_dir, date.strftime("%Y-%m"))
@@ -416,20 +1317,27 @@ class StockDatabase:
             filename = f"{stock_code}_{date.strftime('%Y-%m-%d')}.csv"
             filepath = os.path.join(month_dir, filename)
             
-            # CSV로 내보내기
-            date_str = date.strftime('%Y-%m-%d')
-            cursor.execute("""
-                SELECT stock_code, timestamp, open, high, low, close, volume
-                FROM candles
-                WHERE stock_code = ?
-                  AND date = ?
-                ORDER BY timestamp
-            """, (stock_code, date_str))
+            day_start = int(datetime(date.year, date.month, date.day).timestamp())
+            day_end = day_start + 86400
+            with self._reader() as conn:
+                rows = conn.execute(_SQL_SELECT_DAY_CSV, (stock_code, day_start, day_end)).fetchall()
+            
+            # 압축 보관된 날짜면 보관 레코드에서 읽기
+            if not rows:
+                rows = [
+                    (stock_code, datetime.fromtimestamp(ts).strftime('%Y-%m-%d %H:%M:%S'),
+                     o, h, l, c, v)
+                    for ts, o, h, l, c, v in self._archived_day_rows(stock_code, date)
+                ]
             
-            with open(filepath, 'w', newline='', encoding='utf-8') as f:
-                writer = csv.writer(f)
-                writer.writerow(['stock_code', 'timestamp', 'open', 'high', 'low', 'close', 'volume'])
-                writer.writerows(cursor.fetchall())
+            columns = ['stock_code', 'timestamp', 'open', 'high', 'low', 'close', 'volume']
+            if self._duck is not None:
+                self._duck_copy(rows, columns, filepath, "FORMAT CSV, HEADER")
+            else:
+                with open(filepath, 'w', newline='', encoding='utf-8') as f:
+                    writer = csv.writer(f)
+                    writer.writerow(columns)
+                    writer.writerows(rows)
             
             log.info(f"CSV 내보내기 완료: {filepath}")
             return True
@@ -442,6 +1350,9 @@ class StockDatabase:
         """
         오래된 데이터 삭제
         
+        기준일 이전의 Parquet 날짜 파티션은 디렉토리째 삭제하고, SQLite 1분봉은
+        CLEANUP_CHUNK_ROWS개씩 나누어 트랜잭션마다 쓰기 잠금을 놓아 저장이 끼어들 수 있게 합니다.
+        
         Args:
             days: 보관 기간 (일). 이보다 오래된 데이터 삭제
             
@@ -452,18 +1363,44 @@ class StockDatabase:
             return 0
         
         try:
-            conn = self._get_connection()
-            cursor = conn.cursor()
             cutoff_date = datetime.now() - timedelta(days=days)
-            cutoff_str = cutoff_date.strftime('%Y-%m-%d %H:%M:%S')
+            cutoff_ts = int(cutoff_date.timestamp())
             
-            cursor.execute("""
-                DELETE FROM candles
-                WHERE timestamp < ?
-            """, (cutoff_str,))
+            self._remove_parquet_partitions(cutoff_date)
             
-            deleted_count = cursor.rowcount
-            conn.commit()
+            # 1분봉 청크 삭제
+            deleted_count = 0
+            cutoff_day = _yyyymmdd(cutoff_date)
+            while True:
+                with self._transaction() as conn:
+                    chunk = conn.execute(
+                        _SQL_DELETE_CHUNK, (cutoff_ts, self.CLEANUP_CHUNK_ROWS)
+                    ).rowcount
+                    deleted_count += chunk
+                    
+                    if chunk < self.CLEANUP_CHUNK_ROWS:
+                        # 마지막 청크와 같은 트랜잭션에서 마무리 (커밋 1회)
+                        # 일별 집계: 지난 날짜는 삭제, 기준일은 남은 1분봉으로 다시 계산
+                        # (기준일을 보관 테이블로 옮긴 종목은 기존 집계 유지)
+                        conn.execute(_SQL_DELETE_DAILY_BEFORE, (cutoff_day, cutoff_day))
+                        conn.execute(_SQL_REBUILD_DAILY_DAY, (cutoff_day, cutoff_ts))
+                        conn.execute("DELETE FROM candles_archive WHERE date < ?", (cutoff_day,))
+                        
+                        # 삭제로 생긴 빈 페이지 일부 회수 (전체 VACUUM 대신)
+                        if deleted_count > 0:
+                            self._incremental_vacuum(conn, max(1, deleted_count // 100))
+                        break
+                time.sleep(0.01)
+            
+            # 커밋 후 커진 WAL 파일을 비워 디스크 공간 반환 (트랜잭션 밖에서만 가능)
+            if deleted_count > 0:
+                with self._writer_lock:
+                    self._writer.execute("PRAGMA wal_checkpoint(TRUNCATE)").fetchall()
+            
+            # 삭제된 최신 1분봉은 캐시에서도 제거
+            with self._last_lock:
+                for code in [code for code, row in self._last.items() if row[0] < cutoff_ts]:
+                    del self._last[code]
             
             if deleted_count > 0:
                 log.info(f"오래된 데이터 삭제 완료: {deleted_count}개 ({days}일 이전)")
@@ -474,35 +1411,97 @@ class StockDatabase:
             log.error(f"데이터 삭제 오류: {e}")
             return 0
     
-    def vacuum(self):
-        """데이터베이스 최적화 (공간 회수)"""
+    def _remove_parquet_partitions(self, cutoff_date: datetime):
+        """기준일 이전의 Parquet 날짜 파티션(date=YYYY-MM-DD) 디렉토리 삭제"""
+        cutoff_name = f"date={cutoff_date.strftime('%Y-%m-%d')}"
+        for partition in glob.glob(os.path.join(self.parquet_dir, "date=*")):
+            if os.path.basename(partition) < cutoff_name:
+                shutil.rmtree(partition, ignore_errors=True)
+    
+    def vacuum(self, pages: int = 1000):
+        """
+        데이터베이스 최적화 (빈 페이지 최대 pages개 회수, 증분 VACUUM)
+        
+        DB 전체를 다시 쓰지 않으므로 쓰기를 오래 막지 않습니다.
+        """
         if not self.enabled:
             return
         
         try:
-            conn = self._get_connection()
-            cursor = conn.cursor()
-            cursor.execute("VACUUM")
-            conn.commit()
+            with self._transaction() as conn:
+                self._incremental_vacuum(conn, pages)
             log.info("데이터베이스 최적화 완료")
         except Exception as e:
             log.error(f"데이터베이스 최적화 오류: {e}")
     
+    @staticmethod
+    def _incremental_vacuum(conn: sqlite3.Connection, pages: int):
+        """
+        빈 페이지를 최대 pages개 회수 (진행 중인 트랜잭션 안에서 실행)
+        
+        sqlite3의 execute()는 문장을 한 스텝만 실행하고, incremental_vacuum은
+        스텝마다 1페이지를 회수하므로 필요한 페이지 수만큼 반복합니다.
+        """
+        free_pages = conn.execute("PRAGMA freelist_count").fetchone()[0]
+        for _ in range(min(int(pages), free_pages)):
+            conn.execute("PRAGMA incremental_vacuum")
+    
+    def full_vacuum(self):
+        """
+        전체 VACUUM (관리용 - DB 전체를 다시 쓰므로 그동안 쓰기가 멈춤)
+        
+        증분 VACUUM 모드가 아닌 기존 DB도 이때 증분 모드로 전환됩니다.
+        """
+        if not self.enabled:
+            return
+        
+        try:
+            with self._writer_lock:
+                conn = self._writer
+                conn.execute("PRAGMA auto_vacuum=INCREMENTAL")
+                conn.execute("VACUUM")
+                log.info("데이터베이스 전체 최적화 완료")
+        except Exception as e:
+            log.error(f"데이터베이스 전체 최적화 오류: {e}")
+    
     def close(self):
-        """데이터베이스 연결 종료"""
-        if hasattr(self._local, 'conn') and self._local.conn is not None:
-            try:
-                self._local.conn.close()
-                self._local.conn = None
-                log.info("데이터베이스 연결 종료")
-            except:
-                pass
+        """데이터베이스 연결 종료 (쓰기 대기열의 1분봉 저장 후)"""
+        writer_thread = getattr(self, '_writer_thread', None)
+        if writer_thread is None or self._closed:
+            return
+        self._closed = True
+        
+        # 남은 항목을 모두 기록한 뒤 쓰기 스레드 종료
+        self._wq.put(None)
+        writer_thread.join(timeout=30)
+        
+        if self._duck is not None:
+            self._duck.close()
+            self._duck = None
+        
+        try:
+            while not self._read_pool.empty():
+                self._read_pool.get_nowait().close()
+            self._writer.close()
+            log.info("데이터베이스 연결 종료")
+        except:
+            pass
     
     def __del__(self):
         """소멸자"""
         self.close()
 
 
+def _yyyymmdd(date: datetime) -> int:
+    """날짜 → YYYYMMDD 정수"""
+    return date.year * 10000 + date.month * 100 + date.day
+
+
+def _sql_quote(value: str) -> str:
+    """SQL 문자열 리터럴용 작은따옴표 이스케이프"""
+    return value.replace("'", "''")
+
+
 # 싱글톤 인스턴스 (전역 접근용)
 _db_instance: Optional[StockDatabase] = None
 
@@ -550,6 +1549,7 @@ if __name__ == "__main__":
         test_data.append(candle)
     
     saved_count = db.save_candles_batch(test_data)
+    db.flush_sync()
     print(f"   저장 완료: {saved_count}개")
     
     # 2. 데이터 조회 테스트
@@ -560,7 +1560,7 @@ if __name__ == "__main__":
     candles = db.get_candles('005930', start_date, end_date)
     print(f"   조회 완료: {len(candles)}개")
     if candles:
-        print(f"   최신: {candles[-1]['timestamp']} / {candles[-1]['close']:,}원")
+        print(f"   최신: {candles[-1].timestamp} / {candles[-1].close:,}원")
     
     # 3. 최신 가격 조회 테스트
     print("\n3. 최신 가격 조회 테스트...")
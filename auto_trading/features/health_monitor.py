@@ -15,16 +15,69 @@
 from health_monitor import HealthMonitor
 monitor = HealthMonitor(trading_engine, kiwoom_api)
 monitor.start()
+
+# asyncio 이벤트 루프가 있는 경우 (전용 스레드 없이 실행)
+asyncio.create_task(monitor.run())
 """
 
+import asyncio
+import operator
+import os
+import queue
+import sys
 import time
 import threading
 import psutil
+from collections import deque
 from datetime import datetime, timedelta
-from typing import Optional, Dict, List
+from typing import Callable, Optional, Deque, Dict, List, NamedTuple
 from utils.logger import log
 
 
+class HealthRecord(NamedTuple):
+    """
+    히스토리에 보관하는 헬스 체크 요약 레코드 (불변)
+    
+    전체 결과 딕셔너리 대신 요약에 쓰는 필드만 튜플로 보관해 히스토리 메모리를 줄입니다.
+    """
+    timestamp: float  # Unix epoch 초
+    is_healthy: bool
+    memory_percent: float
+    cpu_percent: float
+
+
+class HealthSample:
+    """
+    헬스 체크 1회 결과
+    
+    __slots__ 객체라 딕셔너리보다 작고 속성 접근이 빠릅니다.
+    딕셔너리가 필요하면 to_dict()를 사용하세요.
+    timestamp는 Unix epoch 초(float)이며, 출력할 때만 datetime으로 변환합니다.
+    """
+    __slots__ = (
+        'timestamp', 'is_healthy', 'issues', 'warnings',
+        'api_connected', 'engine_running',
+        'memory_percent', 'memory_mb', 'cpu_percent', 'num_threads', 'thread_count',
+    )
+    
+    def __init__(self, timestamp: float):
+        self.timestamp = timestamp
+        self.is_healthy = True
+        self.issues: List[str] = []
+        self.warnings: List[str] = []
+        self.api_connected = False
+        self.engine_running = False
+        self.memory_percent = 0.0
+        self.memory_mb = 0.0
+        self.cpu_percent = 0.0
+        self.num_threads = 0
+        self.thread_count = 0
+    
+    def to_dict(self) -> Dict:
+        """필드 이름 → 값 딕셔너리로 변환"""
+        return {name: getattr(self, name) for name in self.__slots__}
+
+
 class HealthMonitor:
     """
     프로그램 헬스 체크 및 모니터링 클래스
@@ -48,14 +101,38 @@ class HealthMonitor:
         self.check_interval = check_interval
         self.enable_auto_recovery = enable_auto_recovery
         
+        # 상태 조회 함수 (API 객체 구조는 실행 중 바뀌지 않으므로 속성 탐색은 생성 시 1회만)
+        if hasattr(kiwoom_api, 'is_connected'):
+            # is_connected는 속성(property)이므로 괄호 없이 접근
+            self._api_connected_getter: Callable = operator.attrgetter('is_connected')
+        else:
+            # 대체 방법: login_event 체크
+            self._api_connected_getter = lambda kiwoom: getattr(kiwoom, 'login_event', None) is not None
+        self._engine_running_getter: Callable = operator.attrgetter('is_running')
+        
         # 모니터링 상태
         self.is_monitoring = False
         self.monitor_thread: Optional[threading.Thread] = None
+        self._stop_event = threading.Event()  # stop() 호출 시 대기 중인 루프를 즉시 깨움
+        
+        # 체크 결과 처리 스레드 (저장/이상 처리/로그로 체크 주기가 밀리지 않도록 분리)
+        # 항목: HealthSample / None(종료)
+        self._sink_queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._sink_thread: Optional[threading.Thread] = None
+        
+        # run()으로 실행 중일 때 stop()이 대기를 깨우는 데 사용 (이벤트 루프, asyncio.Event)
+        self._async_wakeup: Optional[tuple] = None
         
         # 헬스 체크 결과
-        self.last_check_time: Optional[datetime] = None
-        self.check_history: List[Dict] = []
-        self.max_history = 1000  # 최대 히스토리 개수
+        self.last_check_time: Optional[float] = None  # Unix epoch 초
+        self.max_history = 1000  # 최대 히스토리 개수 (넘치면 가장 오래된 결과부터 자동 삭제)
+        self.check_history: Deque[HealthRecord] = deque(maxlen=self.max_history)
+        self.last_full_result: Optional[HealthSample] = None  # 마지막 체크의 전체 결과
+        
+        # 최근 10회 정상 여부와 정상 횟수 (저장 시점에 갱신해 요약 조회는 O(1))
+        self._recent_healthy: Deque[bool] = deque(maxlen=10)
+        self._recent_healthy_count = 0
+        self._recent_health_rate = 0.0
         
         # 에러 카운트
         self.consecutive_errors = 0
@@ -70,7 +147,47 @@ class HealthMonitor:
         self.recovery_attempts = 0
         self.max_recovery_attempts = 3
         
-        log.info(f"헬스 모니터 초기화 완료 (체크 간격: {check_interval}초)")
+        # 같은 이슈 반복 횟수 (장애가 계속될 때 이상 감지 배너를 매번 출력하지 않도록)
+        self._last_issues_key: Optional[tuple] = None
+        self._same_issue_count = 0
+        self.issue_log_every = 10  # 같은 이슈는 이 횟수마다 한 줄 요약만 출력
+        
+        # check_health 로그도 같은 방식으로 반복 억제 (체크하는 스레드에서만 변경)
+        self._api_down_count = 0
+        self._last_check_key: Optional[tuple] = None
+        self._same_check_count = 0
+        
+        # 카운터 변경은 잠금 안에서 하고, 다른 스레드는 공개된 스냅샷을 읽음
+        # (딕셔너리 통째 교체는 원자적이라 값이 섞여 보이지 않음)
+        self._counter_lock = threading.Lock()
+        self._counters_snapshot: Dict[str, int] = {}
+        self._publish_counters()
+        
+        # 상태 전환 이벤트 전달 (결과 처리 스레드 → 요약 조회 스레드)
+        # 정상↔이상이 바뀔 때만 기록하고, 아무도 조회하지 않아도 최근 max_events개만 보관
+        # 항목: ('unhealthy' / 'recovered', 발생 시각 Unix epoch 초)
+        self.max_events = 100
+        self._events: Deque[tuple] = deque(maxlen=self.max_events)
+        self._in_unhealthy_state = False
+        
+        # 현재 프로세스 핸들 (체크마다 새로 만들지 않고 재사용)
+        self._proc = psutil.Process(os.getpid())
+        # CPU 사용률 기준점 설정 (첫 cpu_percent 호출은 항상 0.0 반환)
+        self._proc.cpu_percent(interval=None)
+        # 전체 물리 메모리 (바뀌지 않으므로 1회만 조회, 메모리 사용률 계산용)
+        self._total_ram = psutil.virtual_memory().total
+        
+        # 리소스 측정 최소 간격 (초) - 이보다 자주 체크하면 마지막 측정값 재사용
+        self._min_psutil_interval = 1.0
+        self._last_psutil_ts = 0.0
+        self._last_psutil_snapshot: Dict = {}
+        
+        # Python 스레드 수 확인 간격 (초) - 천천히 변하는 값이라 체크 간격과 무관하게 10분마다
+        self._thread_check_interval = 600.0
+        self._last_thread_check_ts: Optional[float] = None
+        self._thread_count = 0
+        
+        log.info("헬스 모니터 초기화 완료 (체크 간격: {}초)", check_interval)
     
     def start(self):
         """헬스 모니터링 시작"""
@@ -79,6 +196,13 @@ class HealthMonitor:
             return
         
         self.is_monitoring = True
+        self._stop_event.clear()
+        self._sink_thread = threading.Thread(
+            target=self._sink_loop,
+            daemon=True,
+            name="HealthMonitorSink"
+        )
+        self._sink_thread.start()
         self.monitor_thread = threading.Thread(
             target=self._monitoring_loop,
             daemon=True,
@@ -90,8 +214,17 @@ class HealthMonitor:
     def stop(self):
         """헬스 모니터링 중지"""
         self.is_monitoring = False
+        self._stop_event.set()
+        if self._async_wakeup is not None:
+            loop, wakeup = self._async_wakeup
+            loop.call_soon_threadsafe(wakeup.set)
         if self.monitor_thread and self.monitor_thread.is_alive():
             self.monitor_thread.join(timeout=5)
+        
+        # 남은 결과를 처리한 뒤 결과 처리 스레드 종료
+        if self._sink_thread and self._sink_thread.is_alive():
+            self._sink_queue.put(None)
+            self._sink_thread.join(timeout=5)
         log.info("🏥 헬스 모니터링 중지")
     
     def _monitoring_loop(self):
@@ -100,205 +233,426 @@ class HealthMonitor:
         
         while self.is_monitoring:
             try:
-                # 헬스 체크 수행
-                health_result = self.check_health()
-                
-                # 결과 저장
-                self._save_health_result(health_result)
-                
-                # 이상 감지 시 처리
-                if not health_result['is_healthy']:
-                    self._handle_unhealthy(health_result)
-                else:
-                    # 정상이면 에러 카운트 리셋
-                    self.consecutive_errors = 0
+                # 헬스 체크 수행 (안정 상태면 빠른 체크, 이상이 보이면 상세 체크)
+                # 결과 저장/이상 처리는 결과 처리 스레드에 넘김
+                self._sink_queue.put(self._fast_check() or self.check_health())
                 
-                # 대기
-                time.sleep(self.check_interval)
+                # 대기 (stop() 호출 시 즉시 종료)
+                if self._stop_event.wait(self.check_interval):
+                    break
                 
             except Exception as e:
-                log.error(f"헬스 모니터링 중 오류: {e}")
-                self.consecutive_errors += 1
-                self.total_errors += 1
+                log.error("헬스 모니터링 중 오류: {}", e)
+                self._count_error()
                 
                 if self.consecutive_errors >= self.max_consecutive_errors:
-                    log.error(f"연속 {self.consecutive_errors}회 헬스 체크 실패. 모니터링을 중지합니다.")
+                    log.error("연속 {}회 헬스 체크 실패. 모니터링을 중지합니다.", self.consecutive_errors)
                     break
                 
-                time.sleep(self.check_interval)
+                if self._stop_event.wait(self.check_interval):
+                    break
         
         log.info("헬스 모니터링 루프 종료")
     
-    def check_health(self) -> Dict:
+    async def run(self):
+        """
+        asyncio 이벤트 루프에서 헬스 모니터링 실행 (start() 대신 사용)
+        
+        전용 모니터 스레드 없이 다른 비동기 작업과 함께 돌며, 체크와 결과 처리는
+        이벤트 루프를 막지 않도록 기본 실행기(asyncio.to_thread)에서 수행합니다.
+        stop()을 호출하면 대기 중이어도 바로 종료합니다.
+        """
+        if self.is_monitoring:
+            log.warning("헬스 모니터링이 이미 실행 중입니다.")
+            return
+        
+        self.is_monitoring = True
+        self._stop_event.clear()
+        wakeup = asyncio.Event()
+        self._async_wakeup = (asyncio.get_running_loop(), wakeup)
+        log.success("🏥 헬스 모니터링 시작 (asyncio)")
+        
+        try:
+            while self.is_monitoring:
+                try:
+                    health_result = await asyncio.to_thread(
+                        lambda: self._fast_check() or self.check_health()
+                    )
+                    await asyncio.to_thread(self._process_result, health_result)
+                except Exception as e:
+                    log.error("헬스 모니터링 중 오류: {}", e)
+                    self._count_error()
+                    
+                    if self.consecutive_errors >= self.max_consecutive_errors:
+                        log.error("연속 {}회 헬스 체크 실패. 모니터링을 중지합니다.", self.consecutive_errors)
+                        break
+                
+                # 대기 (stop() 호출 시 즉시 종료)
+                try:
+                    await asyncio.wait_for(wakeup.wait(), timeout=self.check_interval)
+                    break
+                except asyncio.TimeoutError:
+                    pass
+        finally:
+            self.is_monitoring = False
+            self._async_wakeup = None
+            log.info("헬스 모니터링 루프 종료")
+    
+    def _sink_loop(self):
+        """결과 처리 루프 (별도 스레드)"""
+        while True:
+            health_result = self._sink_queue.get()
+            if health_result is None:
+                break
+            
+            try:
+                self._process_result(health_result)
+            except Exception as e:
+                log.error("헬스 체크 결과 처리 중 오류: {}", e)
+    
+    def _process_result(self, health_result: HealthSample):
+        """헬스 체크 결과 저장 및 이상/회복 처리"""
+        # 결과 저장
+        self._save_health_result(health_result)
+        
+        # 이상 감지 시 처리
+        if not health_result.is_healthy:
+            self._handle_unhealthy(health_result)
+        elif self.consecutive_errors > 0:
+            # 정상으로 돌아오면 에러 카운트 리셋
+            with self._counter_lock:
+                self.consecutive_errors = 0
+                self._publish_counters()
+            self._last_issues_key = None
+            self._mark_recovered()
+    
+    def check_health(self) -> HealthSample:
         """
         헬스 체크 수행
         
         Returns:
-            헬스 체크 결과 딕셔너리
+            헬스 체크 결과
         """
-        result = {
-            'timestamp': datetime.now(),
-            'is_healthy': True,
-            'issues': [],
-            'warnings': [],
-            'api_connected': False,
-            'engine_running': False,
-            'memory_percent': 0.0,
-            'cpu_percent': 0.0,
-        }
+        result = HealthSample(time.time())
         
         # 1. API 연결 상태 체크
         try:
-            if hasattr(self.kiwoom, 'is_connected'):
-                # is_connected는 속성(property)이므로 괄호 없이 접근
-                result['api_connected'] = self.kiwoom.is_connected
-            else:
-                # 대체 방법: login_event 체크
-                result['api_connected'] = hasattr(self.kiwoom, 'login_event') and \
-                                         self.kiwoom.login_event is not None
+            result.api_connected = self._api_connected_getter(self.kiwoom)
             
-            if not result['api_connected']:
-                result['is_healthy'] = False
-                result['issues'].append("API 연결 끊김")
-                log.warning("⚠️ 헬스 체크: API 연결 상태 이상")
+            if not result.api_connected:
+                result.is_healthy = False
+                result.issues.append("API 연결 끊김")
+                
+                # 처음 끊겼을 때와 issue_log_every회마다만 출력
+                self._api_down_count += 1
+                if self._api_down_count == 1:
+                    log.warning("⚠️ 헬스 체크: API 연결 상태 이상")
+                elif self._api_down_count % self.issue_log_every == 0:
+                    log.warning("⚠️ 헬스 체크: API 연결 상태 이상 ({}회 연속)", self._api_down_count)
+            else:
+                self._api_down_count = 0
         except Exception as e:
-            result['is_healthy'] = False
-            result['issues'].append(f"API 상태 체크 실패: {e}")
-            log.error(f"API 상태 체크 오류: {e}")
+            result.is_healthy = False
+            result.issues.append(f"API 상태 체크 실패: {e}")
+            log.error("API 상태 체크 오류: {}", e)
         
         # 2. 엔진 실행 상태 체크
         try:
-            result['engine_running'] = self.trading_engine.is_running
+            result.engine_running = self._engine_running_getter(self.trading_engine)
             
-            if not result['engine_running']:
-                result['warnings'].append("자동매매 엔진이 실행되지 않음")
+            if not result.engine_running:
+                result.warnings.append("자동매매 엔진이 실행되지 않음")
                 log.debug("ℹ️ 헬스 체크: 엔진이 실행 중이 아님 (정상일 수 있음)")
         except Exception as e:
-            result['warnings'].append(f"엔진 상태 체크 실패: {e}")
-            log.error(f"엔진 상태 체크 오류: {e}")
+            result.warnings.append(f"엔진 상태 체크 실패: {e}")
+            log.error("엔진 상태 체크 오류: {}", e)
         
-        # 3. 메모리 사용률 체크
+        # 3~5. 프로세스 리소스 체크 (메모리/CPU/스레드)
         try:
-            process = psutil.Process()
-            memory_info = process.memory_info()
-            memory_percent = process.memory_percent()
-            result['memory_percent'] = memory_percent
-            result['memory_mb'] = memory_info.rss / (1024 * 1024)  # MB
-            
-            if memory_percent > self.max_memory_percent:
-                result['warnings'].append(f"메모리 사용률 높음: {memory_percent:.1f}%")
-                log.warning(f"⚠️ 헬스 체크: 메모리 사용률 {memory_percent:.1f}% (임계값: {self.max_memory_percent}%)")
+            resources = self._sample_resources()
+            result.memory_percent = resources['memory_percent']
+            result.memory_mb = resources['memory_mb']
+            result.cpu_percent = resources['cpu_percent']
+            result.num_threads = resources['num_threads']
+            result.thread_count = resources['thread_count']
+        except psutil.NoSuchProcess as e:
+            self._reset_process()
+            result.warnings.append(f"리소스 체크 실패: {e}")
         except Exception as e:
-            result['warnings'].append(f"메모리 체크 실패: {e}")
-            log.error(f"메모리 체크 오류: {e}")
-        
-        # 4. CPU 사용률 체크
-        try:
-            process = psutil.Process()
-            cpu_percent = process.cpu_percent(interval=0.1)
-            result['cpu_percent'] = cpu_percent
-            
-            if cpu_percent > self.max_cpu_percent:
-                result['warnings'].append(f"CPU 사용률 높음: {cpu_percent:.1f}%")
-                log.warning(f"⚠️ 헬스 체크: CPU 사용률 {cpu_percent:.1f}% (임계값: {self.max_cpu_percent}%)")
-        except Exception as e:
-            result['warnings'].append(f"CPU 체크 실패: {e}")
-            log.error(f"CPU 체크 오류: {e}")
-        
-        # 5. 스레드 상태 체크
-        try:
-            thread_count = threading.active_count()
-            result['thread_count'] = thread_count
-            
-            # 스레드가 너무 많으면 경고 (일반적으로 10개 이하)
-            if thread_count > 20:
-                result['warnings'].append(f"스레드 수 많음: {thread_count}개")
-                log.warning(f"⚠️ 헬스 체크: 활성 스레드 {thread_count}개")
-        except Exception as e:
-            result['warnings'].append(f"스레드 체크 실패: {e}")
-            log.error(f"스레드 체크 오류: {e}")
+            result.warnings.append(f"리소스 체크 실패: {e}")
+            log.error("리소스 체크 오류: {}", e)
+        
+        # 3. 메모리 사용률
+        memory_percent = result.memory_percent
+        if memory_percent > self.max_memory_percent:
+            result.warnings.append(f"메모리 사용률 높음: {memory_percent:.1f}%")
+            log.warning("⚠️ 헬스 체크: 메모리 사용률 {:.1f}% (임계값: {}%)", memory_percent, self.max_memory_percent)
+        
+        # 4. CPU 사용률
+        cpu_percent = result.cpu_percent
+        if cpu_percent > self.max_cpu_percent:
+            result.warnings.append(f"CPU 사용률 높음: {cpu_percent:.1f}%")
+            log.warning("⚠️ 헬스 체크: CPU 사용률 {:.1f}% (임계값: {}%)", cpu_percent, self.max_cpu_percent)
+        
+        # 5. 스레드 수 (일반적으로 10개 이하, 너무 많으면 경고)
+        thread_count = result.thread_count
+        if thread_count > 20:
+            result.warnings.append(f"스레드 수 많음: {thread_count}개")
+            log.warning("⚠️ 헬스 체크: 활성 스레드 {}개", thread_count)
         
         # 6. 최종 판정
-        if len(result['issues']) > 0:
-            result['is_healthy'] = False
+        issue_count = len(result.issues)
+        warning_count = len(result.warnings)
+        if issue_count > 0:
+            result.is_healthy = False
         
-        self.last_check_time = result['timestamp']
+        self.last_check_time = result.timestamp
         
         # 정상이면 DEBUG 레벨로, 이상이면 INFO 레벨로
-        if result['is_healthy'] and len(result['warnings']) == 0:
+        # (loguru 인자 포맷: 해당 레벨이 출력되지 않으면 문자열을 만들지 않음)
+        if result.is_healthy and warning_count == 0:
+            self._last_check_key = None
             log.debug(
-                f"✅ 헬스 체크 정상 - "
-                f"API: {'연결' if result['api_connected'] else '끊김'}, "
-                f"엔진: {'실행' if result['engine_running'] else '중지'}, "
-                f"메모리: {result['memory_percent']:.1f}%, "
-                f"CPU: {result['cpu_percent']:.1f}%"
+                "✅ 헬스 체크 정상 - API: {}, 엔진: {}, 메모리: {:.1f}%, CPU: {:.1f}%",
+                '연결' if result.api_connected else '끊김',
+                '실행' if result.engine_running else '중지',
+                result.memory_percent,
+                result.cpu_percent
             )
         else:
-            log.info(
-                f"{'⚠️' if result['is_healthy'] else '❌'} 헬스 체크 - "
-                f"이슈: {len(result['issues'])}개, "
-                f"경고: {len(result['warnings'])}개"
-            )
+            # 직전과 같은 결과(이슈 내용, 경고 개수)면 issue_log_every회마다만 출력
+            check_key = (tuple(result.issues), warning_count)
+            if check_key == self._last_check_key:
+                self._same_check_count += 1
+            else:
+                self._last_check_key = check_key
+                self._same_check_count = 1
+            
+            if self._same_check_count == 1:
+                log.info(
+                    "{} 헬스 체크 - 이슈: {}개, 경고: {}개",
+                    '⚠️' if result.is_healthy else '❌',
+                    issue_count,
+                    warning_count
+                )
+            elif self._same_check_count % self.issue_log_every == 0:
+                log.info(
+                    "{} 헬스 체크 - 이슈: {}개, 경고: {}개 (같은 결과 {}회 연속)",
+                    '⚠️' if result.is_healthy else '❌',
+                    issue_count,
+                    warning_count,
+                    self._same_check_count
+                )
         
         return result
     
-    def _save_health_result(self, result: Dict):
-        """헬스 체크 결과 저장"""
-        self.check_history.append(result)
+    def _fast_check(self) -> Optional[HealthSample]:
+        """
+        빠른 헬스 체크 (직전 체크가 경고 없이 정상이고 연속 에러가 없을 때만 사용)
+        
+        상태 조회와 리소스 측정만 하고 로그는 남기지 않습니다.
+        하나라도 이상하거나 안정 상태가 아니면 None을 반환하며, 이때는 check_health로
+        경고·로그를 포함한 상세 체크를 수행합니다.
+        
+        Returns:
+            헬스 체크 결과 (상세 체크가 필요하면 None)
+        """
+        last = self.last_full_result
+        if self.consecutive_errors > 0 or last is None or not last.is_healthy or last.warnings:
+            return None
         
-        # 히스토리가 너무 길면 오래된 것 삭제
-        if len(self.check_history) > self.max_history:
-            self.check_history = self.check_history[-self.max_history:]
+        try:
+            api_connected = self._api_connected_getter(self.kiwoom)
+            engine_running = self._engine_running_getter(self.trading_engine)
+            resources = self._sample_resources()
+        except Exception:
+            return None
+        
+        if (not api_connected
+                or not engine_running
+                or resources['memory_percent'] > self.max_memory_percent
+                or resources['cpu_percent'] > self.max_cpu_percent
+                or resources['thread_count'] > 20):
+            return None
+        
+        result = HealthSample(time.time())
+        result.api_connected = api_connected
+        result.engine_running = engine_running
+        result.memory_percent = resources['memory_percent']
+        result.memory_mb = resources['memory_mb']
+        result.cpu_percent = resources['cpu_percent']
+        result.num_threads = resources['num_threads']
+        result.thread_count = resources['thread_count']
+        
+        self.last_check_time = result.timestamp
+        return result
     
-    def _handle_unhealthy(self, health_result: Dict):
+    def _sample_resources(self) -> Dict:
+        """
+        프로세스 리소스 측정 (메모리/CPU/스레드 수)
+        
+        직전 측정 후 _min_psutil_interval초가 지나지 않았으면 마지막 측정값을 그대로 반환하므로
+        check_health를 자주 호출해도 psutil 조회 부하가 일정하게 유지됩니다.
+        Python 스레드 수는 _thread_check_interval초마다만 새로 셉니다.
+        
+        Returns:
+            {'memory_percent', 'memory_mb', 'cpu_percent', 'num_threads', 'thread_count'}
+        """
+        now = time.monotonic()
+        if now - self._last_psutil_ts < self._min_psutil_interval:
+            return self._last_psutil_snapshot
+        
+        # oneshot: 프로세스 정보(/proc/<pid>/stat 등)를 한 번 읽어 아래 값들에 모두 재사용
+        with self._proc.oneshot():
+            rss = self._proc.memory_info().rss
+            snapshot = {
+                # memory_percent()는 memory_info()를 다시 호출하므로 RSS로 직접 계산
+                'memory_percent': rss / self._total_ram * 100,
+                'memory_mb': rss / (1024 * 1024),  # MB
+                # 대기 없이 직전 호출 이후(= 체크 간격 동안)의 평균 CPU 사용률을 계산
+                'cpu_percent': self._proc.cpu_percent(interval=None),
+                # OS 스레드 수 (Python 스레드 외에 API/Qt 등 네이티브 스레드 포함)
+                'num_threads': self._proc.num_threads(),
+            }
+        
+        # threading.active_count()는 잠금을 잡고 스레드 목록을 세므로 주기적으로만 확인
+        if (self._last_thread_check_ts is None
+                or now - self._last_thread_check_ts >= self._thread_check_interval):
+            self._thread_count = threading.active_count()
+            self._last_thread_check_ts = now
+        snapshot['thread_count'] = self._thread_count
+        
+        self._last_psutil_snapshot = snapshot
+        self._last_psutil_ts = now
+        return snapshot
+    
+    def _count_error(self):
+        """연속/누적 에러 카운트 1 증가"""
+        with self._counter_lock:
+            self.consecutive_errors += 1
+            self.total_errors += 1
+            self._publish_counters()
+    
+    def _publish_counters(self):
+        """에러/복구 카운터 스냅샷 공개 (_counter_lock 안에서 카운터 변경 직후 호출)"""
+        self._counters_snapshot = {
+            'consecutive_errors': self.consecutive_errors,
+            'total_errors': self.total_errors,
+            'recovery_attempts': self.recovery_attempts,
+        }
+    
+    def _drain_events(self) -> List[tuple]:
+        """대기 중인 상태 전환 이벤트를 모두 꺼내기 (대기하지 않음)"""
+        events = []
+        while True:
+            try:
+                events.append(self._events.popleft())
+            except IndexError:
+                return events
+    
+    def _mark_recovered(self):
+        """이상 상태에서 정상으로 돌아왔으면 회복 이벤트 기록"""
+        if self._in_unhealthy_state:
+            self._in_unhealthy_state = False
+            self._events.append(('recovered', time.time()))
+    
+    def _reset_process(self):
+        """프로세스 핸들 재생성 (fork 등으로 PID가 바뀌어 기존 핸들이 무효가 된 경우)"""
+        log.warning("프로세스 핸들이 무효화되어 다시 생성합니다.")
+        self._proc = psutil.Process(os.getpid())
+        self._proc.cpu_percent(interval=None)
+    
+    def _save_health_result(self, result: HealthSample):
+        """헬스 체크 결과 저장 (deque maxlen으로 오래된 결과는 자동 삭제)"""
+        self.last_full_result = result
+        
+        # 가득 찬 상태면 밀려날 가장 오래된 결과를 정상 횟수에서 빼기
+        if len(self._recent_healthy) == self._recent_healthy.maxlen:
+            self._recent_healthy_count -= self._recent_healthy[0]
+        self._recent_healthy.append(result.is_healthy)
+        self._recent_healthy_count += result.is_healthy
+        self._recent_health_rate = self._recent_healthy_count / len(self._recent_healthy) * 100
+        
+        self.check_history.append(HealthRecord(
+            result.timestamp,
+            result.is_healthy,
+            result.memory_percent,
+            result.cpu_percent
+        ))
+    
+    def _handle_unhealthy(self, health_result: HealthSample):
         """
         이상 감지 시 처리
         
         Args:
             health_result: 헬스 체크 결과
         """
-        self.consecutive_errors += 1
-        self.total_errors += 1
+        self._count_error()
         
-        log.error("=" * 70)
-        log.error("🚨 프로그램 이상 감지!")
-        log.error(f"연속 에러: {self.consecutive_errors}회")
-        log.error(f"이슈: {', '.join(health_result['issues'])}")
-        if health_result['warnings']:
-            log.error(f"경고: {', '.join(health_result['warnings'])}")
-        log.error("=" * 70)
+        # 정상 → 이상으로 바뀔 때만 이벤트 기록 (장애가 계속되는 동안은 쌓지 않음)
+        if not self._in_unhealthy_state:
+            self._in_unhealthy_state = True
+            self._events.append(('unhealthy', health_result.timestamp))
+        
+        # 직전과 같은 이슈면 배너 대신 issue_log_every회마다 한 줄만 출력
+        issues_key = tuple(sorted(health_result.issues))
+        if issues_key == self._last_issues_key:
+            self._same_issue_count += 1
+        else:
+            self._last_issues_key = issues_key
+            self._same_issue_count = 1
+        
+        first_time = self._same_issue_count == 1
+        if first_time:
+            log.error("=" * 70)
+            log.error("🚨 프로그램 이상 감지!")
+            log.error("연속 에러: {}회", self.consecutive_errors)
+            log.error("이슈: {}", ', '.join(health_result.issues))
+            if health_result.warnings:
+                log.error("경고: {}", ', '.join(health_result.warnings))
+            log.error("=" * 70)
+        elif self._same_issue_count % self.issue_log_every == 0:
+            log.error(
+                "🚨 같은 이슈 {}회 연속: {}",
+                self._same_issue_count,
+                ', '.join(health_result.issues)
+            )
         
         # 자동 복구 시도
         if self.enable_auto_recovery and self.recovery_attempts < self.max_recovery_attempts:
             self._attempt_recovery(health_result)
-        else:
+        elif first_time:
             if self.recovery_attempts >= self.max_recovery_attempts:
-                log.error(f"최대 복구 시도 횟수 ({self.max_recovery_attempts}회) 도달. 수동 개입 필요.")
+                log.error("최대 복구 시도 횟수 ({}회) 도달. 수동 개입 필요.", self.max_recovery_attempts)
             else:
                 log.info("자동 복구가 비활성화되어 있습니다.")
     
-    def _attempt_recovery(self, health_result: Dict):
+    def _attempt_recovery(self, health_result: HealthSample):
         """
         자동 복구 시도
         
         Args:
             health_result: 헬스 체크 결과
         """
-        self.recovery_attempts += 1
+        with self._counter_lock:
+            self.recovery_attempts += 1
+            self._publish_counters()
         
         log.warning("=" * 70)
-        log.warning(f"🔧 자동 복구 시도 중... ({self.recovery_attempts}/{self.max_recovery_attempts})")
+        log.warning("🔧 자동 복구 시도 중... ({}/{})", self.recovery_attempts, self.max_recovery_attempts)
         log.warning("=" * 70)
         
         recovery_success = False
         
         # API 연결 끊김 복구
-        if not health_result['api_connected']:
+        if not health_result.api_connected:
             log.info("API 재연결 시도...")
             if self._reconnect_api():
                 log.success("✅ API 재연결 성공")
                 recovery_success = True
-                self.consecutive_errors = 0
+                with self._counter_lock:
+                    self.consecutive_errors = 0
+                    self._publish_counters()
             else:
                 log.error("❌ API 재연결 실패")
         
@@ -308,7 +662,10 @@ class HealthMonitor:
         # - 로그 파일 정리
         
         if recovery_success:
-            self.recovery_attempts = 0  # 성공 시 카운트 리셋
+            with self._counter_lock:
+                self.recovery_attempts = 0  # 성공 시 카운트 리셋
+                self._publish_counters()
+            self._mark_recovered()
             log.success("🎉 자동 복구 성공!")
         else:
             log.error("🚨 자동 복구 실패")
@@ -329,7 +686,7 @@ class HealthMonitor:
                 log.warning("kiwoom_api.py에 reconnect() 메서드가 없습니다.")
                 return False
         except Exception as e:
-            log.error(f"API 재연결 중 오류: {e}")
+            log.error("API 재연결 중 오류: {}", e)
             return False
     
     def get_health_summary(self) -> Dict:
@@ -339,56 +696,69 @@ class HealthMonitor:
         Returns:
             요약 정보 딕셔너리
         """
-        if not self.check_history:
+        if not self.check_history or self.last_full_result is None:
             return {
                 'status': 'no_data',
                 'message': '아직 헬스 체크 이력이 없습니다.'
             }
         
-        # 최근 10개 체크 결과 분석
-        recent_checks = self.check_history[-10:]
-        healthy_count = sum(1 for c in recent_checks if c['is_healthy'])
-        health_rate = (healthy_count / len(recent_checks)) * 100
+        latest = self.last_full_result
+        counters = self._counters_snapshot
         
-        latest = self.check_history[-1]
+        # 마지막 조회 이후 발생한 상태 전환 (이벤트 종류, 발생 시각)
+        events = self._drain_events()
         
         return {
-            'status': 'healthy' if latest['is_healthy'] else 'unhealthy',
-            'last_check': latest['timestamp'],
-            'health_rate': health_rate,
-            'consecutive_errors': self.consecutive_errors,
-            'total_errors': self.total_errors,
-            'recovery_attempts': self.recovery_attempts,
-            'api_connected': latest['api_connected'],
-            'engine_running': latest['engine_running'],
-            'memory_percent': latest.get('memory_percent', 0),
-            'cpu_percent': latest.get('cpu_percent', 0),
-            'thread_count': latest.get('thread_count', 0),
+            'status': 'healthy' if latest.is_healthy else 'unhealthy',
+            'last_check': latest.timestamp,  # Unix epoch 초
+            'health_rate': self._recent_health_rate,  # 최근 10회 정상 비율
+            'consecutive_errors': counters['consecutive_errors'],
+            'total_errors': counters['total_errors'],
+            'recovery_attempts': counters['recovery_attempts'],
+            'events': events,
+            'api_connected': latest.api_connected,
+            'engine_running': latest.engine_running,
+            'memory_percent': latest.memory_percent,
+            'cpu_percent': latest.cpu_percent,
+            'thread_count': latest.thread_count,
+            'num_threads': latest.num_threads,
         }
     
     def print_health_summary(self):
-        """헬스 체크 요약 출력"""
+        """헬스 체크 요약 출력 (전체 내용을 한 번에 기록)"""
         summary = self.get_health_summary()
         
         if summary['status'] == 'no_data':
             print(summary['message'])
             return
         
-        print("=" * 70)
-        print("🏥 헬스 체크 요약")
-        print("=" * 70)
-        print(f"상태: {'✅ 정상' if summary['status'] == 'healthy' else '❌ 이상'}")
-        print(f"마지막 체크: {summary['last_check'].strftime('%Y-%m-%d %H:%M:%S')}")
-        print(f"건강률 (최근 10회): {summary['health_rate']:.1f}%")
-        print(f"연속 에러: {summary['consecutive_errors']}회")
-        print(f"총 에러: {summary['total_errors']}회")
-        print(f"복구 시도: {summary['recovery_attempts']}회")
-        print(f"\nAPI 연결: {'✅' if summary['api_connected'] else '❌'}")
-        print(f"엔진 실행: {'✅' if summary['engine_running'] else '⏸️'}")
-        print(f"메모리 사용률: {summary['memory_percent']:.1f}%")
-        print(f"CPU 사용률: {summary['cpu_percent']:.1f}%")
-        print(f"활성 스레드: {summary['thread_count']}개")
-        print("=" * 70)
+        lines = [
+            "=" * 70,
+            "🏥 헬스 체크 요약",
+            "=" * 70,
+            f"상태: {'✅ 정상' if summary['status'] == 'healthy' else '❌ 이상'}",
+            f"마지막 체크: {datetime.fromtimestamp(summary['last_check']).strftime('%Y-%m-%d %H:%M:%S')}",
+            f"건강률 (최근 10회): {summary['health_rate']:.1f}%",
+            f"연속 에러: {summary['consecutive_errors']}회",
+            f"총 에러: {summary['total_errors']}회",
+            f"복구 시도: {summary['recovery_attempts']}회",
+            f"\nAPI 연결: {'✅' if summary['api_connected'] else '❌'}",
+            f"엔진 실행: {'✅' if summary['engine_running'] else '⏸️'}",
+            f"메모리 사용률: {summary['memory_percent']:.1f}%",
+            f"CPU 사용률: {summary['cpu_percent']:.1f}%",
+            f"활성 스레드: {summary['thread_count']}개 (OS 스레드: {summary['num_threads']}개)",
+        ]
+        
+        # 마지막 조회 이후 상태 전환 (요약 조회 시 꺼내지므로 여기서 함께 출력)
+        if summary['events']:
+            lines.append("\n상태 전환:")
+            for kind, timestamp in summary['events']:
+                label = '❌ 이상 발생' if kind == 'unhealthy' else '✅ 정상 회복'
+                lines.append(f"  {datetime.fromtimestamp(timestamp).strftime('%H:%M:%S')} {label}")
+        
+        lines.append("=" * 70)
+        sys.stdout.write("\n".join(lines) + "\n")
+        sys.stdout.flush()
 
 
 if __name__ == "__main__":
@@ -420,11 +790,11 @@ if __name__ == "__main__":
     # 헬스 체크 1회 실행
     print("1. 즉시 헬스 체크:")
     result = monitor.check_health()
-    print(f"  - 결과: {'정상' if result['is_healthy'] else '이상'}")
-    print(f"  - API 연결: {result['api_connected']}")
-    print(f"  - 엔진 실행: {result['engine_running']}")
-    print(f"  - 메모리: {result['memory_percent']:.1f}%")
-    print(f"  - CPU: {result['cpu_percent']:.1f}%\n")
+    print(f"  - 결과: {'정상' if result.is_healthy else '이상'}")
+    print(f"  - API 연결: {result.api_connected}")
+    print(f"  - 엔진 실행: {result.engine_running}")
+    print(f"  - 메모리: {result.memory_percent:.1f}%")
+    print(f"  - CPU: {result.cpu_percent:.1f}%\n")
     
     # 모니터링 시작
     print("2. 지속적 모니터링 시작 (10초간):")
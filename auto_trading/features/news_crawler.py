@@ -27,15 +27,21 @@ news_list = crawler.get_latest_news('005930')  # 삼성전자 뉴스
 crawler.start_auto_update(interval=300)  # 5분마다 자동 갱신
 """
 
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
 from datetime import datetime, timedelta
+import heapq
+import operator
 import threading
 import time
 import re
-from collections import defaultdict
+from collections import OrderedDict
+from urllib.parse import urljoin
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed, TimeoutError as FuturesTimeoutError
 
 try:
     import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
     from bs4 import BeautifulSoup
     REQUESTS_AVAILABLE = True
 except ImportError:
@@ -43,11 +49,49 @@ except ImportError:
     print("⚠️  requests, beautifulsoup4가 설치되지 않았습니다.")
     print("   pip install requests beautifulsoup4")
 
+# lxml이 있으면 C 기반 파서 사용 (없으면 내장 html.parser)
+try:
+    import lxml
+    HTML_PARSER = 'lxml'
+except ImportError:
+    HTML_PARSER = 'html.parser'
+
+# brotli 디코더가 있으면 응답 압축에 br 허용 (urllib3가 자동 해제)
+try:
+    import brotli
+    BROTLI_AVAILABLE = True
+except ImportError:
+    try:
+        import brotlicffi
+        BROTLI_AVAILABLE = True
+    except ImportError:
+        BROTLI_AVAILABLE = False
+
+# 셀렉터가 검증된 경우 BeautifulSoup 트리 없이 lxml로 바로 선택 (선택적)
+try:
+    import lxml.html
+    from lxml.cssselect import CSSSelector
+    LXML_CSS_AVAILABLE = True
+except ImportError:
+    LXML_CSS_AVAILABLE = False
+
+# 종목명 다중 매칭용 Aho-Corasick 오토마톤 (선택적)
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
 from utils.logger import log
 
 
 class NewsItem:
-    """뉴스 아이템 클래스"""
+    """
+    뉴스 아이템 클래스
+    
+    캐시에 많이 쌓이므로 __slots__로 인스턴스별 __dict__를 없앴습니다.
+    """
+    __slots__ = ('title', 'content', 'date', 'source', 'url', 'related_stocks')
     
     def __init__(
         self,
@@ -83,11 +127,32 @@ class NewsItem:
 class NewsCrawler:
     """뉴스 크롤러 클래스"""
     
+    # 다음 금융 시장 구분 휴리스틱: 코드 앞 두 자리가 00~05면 KOSPI
+    _KOSPI_PREFIXES = frozenset(f'{i:02d}' for i in range(6))
+    
     def __init__(self):
-        self.news_cache: Dict[str, List[NewsItem]] = defaultdict(list)
+        # 뉴스 캐시 (LRU): cache_key -> (monotonic 시각, 뉴스 리스트, 요청 max_count)
+        self.news_cache: 'OrderedDict[str, tuple]' = OrderedDict()
+        self._cache_max = 256  # 최대 캐시 종목 수
+        self._cache_max_age = 3600  # get_cached_news 유효 시간 (초)
         self.last_update_time = None
         self.is_running = False
         self.update_thread = None
+        self._stop_event = threading.Event()
+        
+        # 소스별 병렬 수집용 스레드 풀 (최초 사용 시 생성)
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._executor_lock = threading.Lock()
+        self._executor_workers = 4  # reserve_workers()로 늘어남
+        self.fetch_timeout = 15
+        
+        # 단기 캐시 + 진행 중 요청 공유 (같은 종목 중복 요청 방지)
+        self._cache_ttl = 60
+        self._inflight: Dict[str, tuple] = {}  # cache_key -> (Future, 요청 max_count)
+        self._cache_lock = threading.Lock()
+        
+        # HTTP 세션 (keep-alive로 소스별 TCP/TLS 연결 재사용)
+        self._session = self._create_session() if REQUESTS_AVAILABLE else None
         
         # 종목명-코드 매핑 (주요 종목)
         self.stock_name_map = {
@@ -106,6 +171,12 @@ class NewsCrawler:
         # 역 매핑 (코드 -> 이름)
         self.stock_code_map = {v: k for k, v in self.stock_name_map.items()}
         
+        # 제목 한 번 스캔으로 모든 종목명을 찾는 매처
+        self._stock_matcher = self._build_stock_matcher()
+        
+        # 컴파일된 lxml CSS 셀렉터 캐시
+        self._css_selectors: Dict[str, 'CSSSelector'] = {}
+        
         # 🆕 패턴 학습기 (자동 보정)
         try:
             from news_pattern_learner import NewsPatternLearner
@@ -118,10 +189,32 @@ class NewsCrawler:
         # 🆕 뉴스 모니터링 콜백 (GUI에 상태 전달)
         self.monitoring_callback = None
         
+        # 소스별 크롤링 설정
+        # - label: 로그 표시 이름, brand: NewsItem.source 값
+        # - base_url: 상대 링크를 절대 주소로 바꿀 기준 주소
+        # - enabled: get_latest_news 수집 대상 여부
+        self._sources = {
+            'naver': {
+                'label': '네이버',
+                'brand': '네이버금융',
+                'default_selector': '.newsList .articleSubject',
+                'url_builder': self._naver_news_url,
+                'base_url': 'https://finance.naver.com',
+                'enabled': True,
+            },
+            'daum': {
+                'label': '다음',
+                'brand': '다음금융',
+                'default_selector': '.news_list .link_news',
+                'url_builder': self._daum_news_url,
+                'base_url': 'https://finance.daum.net',
+                'enabled': False,  # 현재 URL 문제로 비활성화
+            },
+        }
+        
         # 소스별 통계
         self.source_stats = {
-            'naver': {'success': 0, 'total': 0},
-            'daum': {'success': 0, 'total': 0}
+            name: {'success': 0, 'total': 0} for name in self._sources
         }
         
         if not REQUESTS_AVAILABLE:
@@ -129,6 +222,54 @@ class NewsCrawler:
         else:
             log.info("뉴스 크롤러 초기화 완료")
     
+    @staticmethod
+    def _create_session() -> 'requests.Session':
+        """연결 풀과 재시도가 설정된 HTTP 세션 생성"""
+        session = requests.Session()
+        session.headers.update({
+            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+            'Accept-Encoding': 'gzip, deflate, br' if BROTLI_AVAILABLE else 'gzip, deflate',
+        })
+        
+        adapter = HTTPAdapter(
+            pool_connections=8,
+            pool_maxsize=16,
+            max_retries=Retry(total=2, backoff_factor=0.3)
+        )
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        return session
+    
+    def _build_stock_matcher(self):
+        """종목명 매처 생성 (Aho-Corasick, 없으면 단일 정규식)"""
+        if AHOCORASICK_AVAILABLE:
+            automaton = ahocorasick.Automaton()
+            for stock_name, code in self.stock_name_map.items():
+                automaton.add_word(stock_name, code)
+            automaton.make_automaton()
+            return automaton
+        
+        # 긴 이름 우선 (짧은 이름이 긴 이름의 접두어일 때 가려지지 않도록)
+        names = sorted(self.stock_name_map, key=len, reverse=True)
+        return re.compile('|'.join(map(re.escape, names)))
+    
+    def _find_related_stocks(self, title: str) -> List[str]:
+        """
+        제목에 등장하는 종목 코드 찾기
+        
+        Args:
+            title: 뉴스 제목
+        
+        Returns:
+            종목 코드 리스트 (등장 순서, 중복 제거)
+        """
+        if AHOCORASICK_AVAILABLE:
+            codes = (code for _, code in self._stock_matcher.iter(title))
+        else:
+            name_map = self.stock_name_map
+            codes = (name_map[name] for name in self._stock_matcher.findall(title))
+        return list(dict.fromkeys(codes))
+    
     def set_monitoring_callback(self, callback):
         """
         뉴스 모니터링 콜백 설정
@@ -155,6 +296,135 @@ class NewsCrawler:
             except Exception as e:
                 log.debug(f"모니터링 콜백 오류: {e}")
     
+    def _select_fast(self, content: bytes, source_name: str, charset: Optional[str]) -> list:
+        """
+        최적 셀렉터로 lxml 트리에서 바로 선택 (빠른 경로)
+        
+        패턴 학습기가 수렴한 평상시에는 BeautifulSoup 트리를 만들지 않습니다.
+        
+        Args:
+            content: 응답 본문 (바이트)
+            source_name: 뉴스 소스
+            charset: 헤더에 명시된 charset (없으면 None)
+        
+        Returns:
+            lxml 요소 리스트 (사용 불가하거나 결과가 없으면 빈 리스트)
+        """
+        if not (LXML_CSS_AVAILABLE and self.pattern_learner):
+            return []
+        
+        try:
+            selector = self.pattern_learner.get_best_selector(source_name)
+            compiled = self._css_selectors.get(selector)
+            if compiled is None:
+                compiled = self._css_selectors[selector] = CSSSelector(selector)
+            
+            parser = lxml.html.HTMLParser(encoding=charset) if charset else None
+            elements = compiled(lxml.html.fromstring(content, parser=parser))
+            if elements:
+                self.pattern_learner.record_success(source_name, selector)
+            return elements
+        except Exception as e:
+            log.debug(f"lxml 빠른 경로 실패 ({source_name}): {e}")
+            return []
+    
+    @staticmethod
+    def _read_lxml_item(item) -> tuple:
+        """lxml 요소에서 (링크, 제목) 추출"""
+        return item.get('href', ''), item.text_content().strip()
+    
+    @staticmethod
+    def _read_soup_item(item) -> tuple:
+        """BeautifulSoup 태그에서 (링크, 제목) 추출 (lxml 경로와 같은 공백 처리)"""
+        return item.attrs.get('href', ''), item.text.strip()
+    
+    def _select_with_fallback(
+        self,
+        soup: 'BeautifulSoup',
+        source_name: str,
+        default_selector: str,
+        stock_code: str = None
+    ) -> tuple:
+        """
+        뉴스 요소 선택 (패턴 학습기 기반 자동 보정)
+        
+        최적 셀렉터로 먼저 선택하고, 결과가 없으면 동작하는 대체 셀렉터를 탐색합니다.
+        
+        Args:
+            soup: BeautifulSoup 객체
+            source_name: 뉴스 소스 ('naver', 'daum')
+            default_selector: 패턴 학습기가 없을 때 사용할 셀렉터
+            stock_code: 종목 코드 (모니터링 로그용)
+        
+        Returns:
+            (뉴스 요소 리스트, 사용한 셀렉터) - 모든 셀렉터 실패 시 ([], 최적 셀렉터)
+        """
+        learner = self.pattern_learner
+        if not learner:
+            # 패턴 학습기 없으면 기본 셀렉터 사용
+            return soup.select(default_selector), default_selector
+        
+        label = self._sources[source_name]['label']
+        log_monitor = self._log_to_monitor
+        stock_code = stock_code or ""
+        
+        # 1. 최적 셀렉터 가져오기
+        best_selector = learner.get_best_selector(source_name)
+        news_items = soup.select(best_selector)
+        if news_items:
+            learner.record_success(source_name, best_selector)
+            return news_items, best_selector
+        
+        # 2. 결과 없으면 다른 셀렉터 시도
+        log_monitor(
+            f"[{label}] 기본 셀렉터 실패, 대체 셀렉터 시도 중...",
+            "warning", stock_code, source_name
+        )
+        
+        working_selector = learner.find_working_selector(source_name, soup)
+        if not working_selector:
+            learner.record_failure(source_name, best_selector)
+            log_monitor(f"[{label}] 모든 셀렉터 실패", "error", stock_code, source_name)
+            return [], best_selector
+        
+        news_items = soup.select(working_selector)
+        learner.record_success(source_name, working_selector)
+        log_monitor(
+            f"[{label}] 대체 셀렉터 성공: {working_selector} ({len(news_items)}개)",
+            "success", stock_code, source_name
+        )
+        return news_items, working_selector
+    
+    @staticmethod
+    def _declared_charset(response) -> Optional[str]:
+        """Content-Type 헤더에 명시된 charset 반환 (없으면 None)"""
+        content_type = response.headers.get('Content-Type', '')
+        _, found, charset = content_type.partition('charset=')
+        if not found:
+            return None
+        return charset.split(';', 1)[0].strip(' "\'') or None
+    
+    def _naver_news_url(self, stock_code: str = None) -> str:
+        """네이버 금융 뉴스 URL"""
+        if stock_code:
+            return f"https://finance.naver.com/item/news.naver?code={stock_code}"
+        return "https://finance.naver.com/news/news_list.naver?mode=LSS2D&section_id=101&section_id2=258"
+    
+    def _daum_news_url(self, stock_code: str = None) -> str:
+        """다음 금융 뉴스 URL (시장 구분자 처리)"""
+        if not stock_code:
+            return "https://finance.daum.net/news"
+        
+        # 종목 코드 정리 (A, Q 접두사 제거)
+        clean_code = stock_code.lstrip('AQ')
+        
+        # 시장 구분자 결정 (KOSPI: A, KOSDAQ: Q)
+        # 간단한 휴리스틱: 앞 두 자리가 00~05면 KOSPI(A), 그 외는 KOSDAQ(Q)로 추정
+        # 더 정확한 방법은 키움 API로 시장 구분 조회
+        market_prefix = 'A' if clean_code[:2] in self._KOSPI_PREFIXES else 'Q'
+        
+        return f"https://finance.daum.net/quotes/{market_prefix}{clean_code}#news"
+    
     def crawl_naver_finance_news(
         self,
         stock_code: str = None,
@@ -170,132 +440,7 @@ class NewsCrawler:
         Returns:
             뉴스 리스트
         """
-        if not REQUESTS_AVAILABLE:
-            return []
-        
-        news_list = []
-        source_name = "naver"
-        self.source_stats[source_name]['total'] += 1
-        
-        try:
-            # 네이버 금융 뉴스 URL
-            if stock_code:
-                url = f"https://finance.naver.com/item/news.naver?code={stock_code}"
-            else:
-                url = "https://finance.naver.com/news/news_list.naver?mode=LSS2D&section_id=101&section_id2=258"
-            
-            self._log_to_monitor(f"[네이버] 뉴스 조회 시작", "info", stock_code or "", source_name)
-            
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-            }
-            
-            response = requests.get(url, headers=headers, timeout=10)
-            response.raise_for_status()
-            
-            soup = BeautifulSoup(response.text, 'html.parser')
-            
-            # 🆕 패턴 학습기를 사용한 자동 보정
-            news_items = []
-            used_selector = '.newsList .articleSubject'  # 기본 셀렉터
-            
-            if self.pattern_learner:
-                # 1. 최적 셀렉터 가져오기
-                best_selector = self.pattern_learner.get_best_selector(source_name)
-                news_items = soup.select(best_selector)
-                used_selector = best_selector
-                
-                # 2. 결과 없으면 다른 셀렉터 시도
-                if not news_items or len(news_items) == 0:
-                    self._log_to_monitor(
-                        f"[네이버] 기본 셀렉터 실패, 대체 셀렉터 시도 중...", 
-                        "warning", stock_code or "", source_name
-                    )
-                    
-                    working_selector = self.pattern_learner.find_working_selector(source_name, soup)
-                    
-                    if working_selector:
-                        news_items = soup.select(working_selector)
-                        used_selector = working_selector
-                        self.pattern_learner.record_success(source_name, working_selector)
-                        self._log_to_monitor(
-                            f"[네이버] 대체 셀렉터 성공: {working_selector} ({len(news_items)}개)",
-                            "success", stock_code or "", source_name
-                        )
-                    else:
-                        self.pattern_learner.record_failure(source_name, best_selector)
-                        self._log_to_monitor(
-                            f"[네이버] 모든 셀렉터 실패",
-                            "error", stock_code or "", source_name
-                        )
-                        return []
-                else:
-                    # 성공 기록
-                    self.pattern_learner.record_success(source_name, best_selector)
-            else:
-                # 패턴 학습기 없으면 기본 셀렉터 사용
-                news_items = soup.select(used_selector)
-            
-            # 뉴스 파싱
-            for item in news_items[:max_count]:
-                try:
-                    link = item.get('href', '')
-                    if not link.startswith('http'):
-                        link = 'https://finance.naver.com' + link
-                    
-                    title = item.get_text(strip=True)
-                    
-                    if not title:  # 빈 제목은 건너뛰기
-                        continue
-                    
-                    content = title
-                    news_date = datetime.now()
-                    
-                    related_stocks = []
-                    if stock_code:
-                        related_stocks = [stock_code]
-                    else:
-                        for stock_name, code in self.stock_name_map.items():
-                            if stock_name in title:
-                                related_stocks.append(code)
-                    
-                    news_item = NewsItem(
-                        title=title,
-                        content=content,
-                        date=news_date,
-                        source='네이버금융',
-                        url=link,
-                        related_stocks=related_stocks
-                    )
-                    
-                    news_list.append(news_item)
-                    
-                    # 수집 성공 로그
-                    self._log_to_monitor(
-                        f"[네이버] {title[:40]}...",
-                        "info", stock_code or "", source_name
-                    )
-                    
-                except Exception as e:
-                    log.debug(f"뉴스 아이템 파싱 오류: {e}")
-                    continue
-            
-            if news_list:
-                self.source_stats[source_name]['success'] += 1
-                log.info(f"✅ 네이버 금융 뉴스 {len(news_list)}개 수집 완료 (셀렉터: {used_selector})")
-                self._log_to_monitor(
-                    f"[네이버] 수집 완료: {len(news_list)}개",
-                    "success", stock_code or "", source_name
-                )
-            
-        except Exception as e:
-            log.error(f"❌ 네이버 금융 뉴스 크롤링 오류: {e}")
-            self._log_to_monitor(
-                f"[네이버] 크롤링 오류: {str(e)}",
-                "error", stock_code or "", source_name
-            )
-        
-        return news_list
+        return self._crawl_source('naver', stock_code, max_count)
     
     def crawl_daum_finance_news(
         self,
@@ -309,132 +454,116 @@ class NewsCrawler:
             stock_code: 종목 코드
             max_count: 최대 수집 개수
         
+        Returns:
+            뉴스 리스트
+        """
+        return self._crawl_source('daum', stock_code, max_count)
+    
+    def _crawl_source(
+        self,
+        source_name: str,
+        stock_code: str = None,
+        max_count: int = 10
+    ) -> List[NewsItem]:
+        """
+        소스 공통 크롤링 (조회 → 셀렉터 자동 보정 → 파싱 → 통계)
+        
+        Args:
+            source_name: 뉴스 소스 ('naver', 'daum')
+            stock_code: 종목 코드 (None이면 전체 뉴스)
+            max_count: 최대 수집 개수
+        
         Returns:
             뉴스 리스트
         """
         if not REQUESTS_AVAILABLE:
             return []
         
+        source = self._sources[source_name]
+        label = source['label']
+        brand = source['brand']
+        base_url = source['base_url']
+        monitor_code = stock_code or ""
+        
         news_list = []
-        source_name = "daum"
-        self.source_stats[source_name]['total'] += 1
+        stats = self.source_stats[source_name]
+        stats['total'] += 1
         
         try:
-            # 다음 금융 뉴스 URL (시장 구분자 처리)
-            if stock_code:
-                # 종목 코드 정리 (A, Q 접두사 제거)
-                clean_code = stock_code.lstrip('AQ')
-                
-                # 시장 구분자 결정 (KOSPI: A, KOSDAQ: Q)
-                # 간단한 휴리스틱: 코드가 000000~999999면 KOSPI(A), 그 외는 확인 필요
-                # 더 정확한 방법은 키움 API로 시장 구분 조회
-                if clean_code.startswith(('00', '01', '02', '03', '04', '05')):
-                    market_prefix = 'A'  # KOSPI
-                else:
-                    market_prefix = 'Q'  # KOSDAQ (추정)
-                
-                url = f"https://finance.daum.net/quotes/{market_prefix}{clean_code}#news"
-            else:
-                url = "https://finance.daum.net/news"
-            
-            self._log_to_monitor(f"[다음] 뉴스 조회 시작: {url}", "info", stock_code or "", source_name)
-            
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
-            }
+            url = source['url_builder'](stock_code)
+            self._log_to_monitor(f"[{label}] 뉴스 조회 시작: {url}", "info", monitor_code, source_name)
             
-            response = requests.get(url, headers=headers, timeout=10)
+            # (연결 3초, 읽기 7초) 타임아웃
+            response = self._session.get(url, timeout=(3, 7))
             response.raise_for_status()
             
-            soup = BeautifulSoup(response.text, 'html.parser')
-            
-            # 🆕 패턴 학습기를 사용한 자동 보정
-            news_items = []
-            used_selector = '.news_list .link_news'  # 기본 셀렉터
+            charset = self._declared_charset(response)
             
-            if self.pattern_learner:
-                best_selector = self.pattern_learner.get_best_selector(source_name)
-                news_items = soup.select(best_selector)
-                used_selector = best_selector
-                
-                if not news_items or len(news_items) == 0:
-                    self._log_to_monitor(
-                        f"[다음] 기본 셀렉터 실패, 대체 셀렉터 시도 중...",
-                        "warning", stock_code or "", source_name
-                    )
-                    
-                    working_selector = self.pattern_learner.find_working_selector(source_name, soup)
-                    
-                    if working_selector:
-                        news_items = soup.select(working_selector)
-                        used_selector = working_selector
-                        self.pattern_learner.record_success(source_name, working_selector)
-                        self._log_to_monitor(
-                            f"[다음] 대체 셀렉터 성공: {working_selector} ({len(news_items)}개)",
-                            "success", stock_code or "", source_name
-                        )
-                    else:
-                        self.pattern_learner.record_failure(source_name, best_selector)
-                        self._log_to_monitor(
-                            f"[다음] 모든 셀렉터 실패",
-                            "error", stock_code or "", source_name
-                        )
-                        return []
-                else:
-                    self.pattern_learner.record_success(source_name, best_selector)
+            # 1. 빠른 경로: 검증된 셀렉터로 lxml 트리에서 바로 선택
+            news_items = self._select_fast(response.content, source_name, charset)
+            if news_items:
+                used_selector = self.pattern_learner.get_best_selector(source_name)
+                read_item = self._read_lxml_item
             else:
-                news_items = soup.select(used_selector)
+                # 2. 원본 바이트를 그대로 파싱 (헤더에 charset이 있으면 인코딩 추측 생략)
+                soup = BeautifulSoup(response.content, HTML_PARSER, from_encoding=charset)
+                
+                # 🆕 패턴 학습기를 사용한 자동 보정
+                news_items, used_selector = self._select_with_fallback(
+                    soup, source_name, source['default_selector'], stock_code
+                )
+                if not news_items:
+                    return []
+                read_item = self._read_soup_item
             
             # 뉴스 파싱
             for item in news_items[:max_count]:
                 try:
-                    link = item.get('href', '')
-                    title = item.get_text(strip=True)
+                    href, title = read_item(item)
+                    link = urljoin(base_url, href)  # 절대 주소는 그대로 유지
                     
-                    if not title:
+                    if not title:  # 빈 제목은 건너뛰기
                         continue
                     
-                    related_stocks = []
                     if stock_code:
                         related_stocks = [stock_code]
                     else:
-                        for stock_name, code in self.stock_name_map.items():
-                            if stock_name in title:
-                                related_stocks.append(code)
+                        related_stocks = self._find_related_stocks(title)
                     
-                    news_item = NewsItem(
+                    news_list.append(NewsItem(
                         title=title,
                         content=title,
                         date=datetime.now(),
-                        source='다음금융',
+                        source=brand,
                         url=link,
                         related_stocks=related_stocks
-                    )
-                    
-                    news_list.append(news_item)
-                    
-                    self._log_to_monitor(
-                        f"[다음] {title[:40]}...",
-                        "info", stock_code or "", source_name
-                    )
+                    ))
                     
                 except Exception as e:
                     log.debug(f"뉴스 아이템 파싱 오류: {e}")
                     continue
             
+            # 모니터에는 최신 제목 한 줄만 (행 높이가 고정이라 여러 줄은 잘림), 전체 제목은 디버그 로그
+            if news_list:
+                log.debug("[{}] 수집 제목: {}", label, " | ".join(news.title for news in news_list))
+                preview = f"[{label}] {news_list[0].title[:40]}..."
+                if len(news_list) > 1:
+                    preview += f" 외 {len(news_list) - 1}건"
+                self._log_to_monitor(preview, "info", monitor_code, source_name)
+            
             if news_list:
-                self.source_stats[source_name]['success'] += 1
-                log.info(f"✅ 다음 금융 뉴스 {len(news_list)}개 수집 완료 (셀렉터: {used_selector})")
+                stats['success'] += 1
+                log.info(f"✅ {label} 금융 뉴스 {len(news_list)}개 수집 완료 (셀렉터: {used_selector})")
                 self._log_to_monitor(
-                    f"[다음] 수집 완료: {len(news_list)}개",
-                    "success", stock_code or "", source_name
+                    f"[{label}] 수집 완료: {len(news_list)}개",
+                    "success", monitor_code, source_name
                 )
             
         except Exception as e:
-            log.error(f"❌ 다음 금융 뉴스 크롤링 오류: {e}")
+            log.error(f"❌ {label} 금융 뉴스 크롤링 오류: {e}")
             self._log_to_monitor(
-                f"[다음] 크롤링 오류: {str(e)}",
-                "error", stock_code or "", source_name
+                f"[{label}] 크롤링 오류: {str(e)}",
+                "error", monitor_code, source_name
             )
         
         return news_list
@@ -454,32 +583,97 @@ class NewsCrawler:
         Returns:
             뉴스 리스트
         """
-        all_news = []
+        cache_key = stock_code or 'all'
+        
+        with self._cache_lock:
+            # 1. TTL 이내에 충분한 개수로 수집한 결과가 있으면 재사용
+            cached = self.news_cache.get(cache_key)
+            if (cached and time.monotonic() - cached[0] < self._cache_ttl
+                    and cached[2] >= max_count):
+                self.news_cache.move_to_end(cache_key)
+                return cached[1][:max_count]
+            
+            # 2. 같은 종목을 충분한 개수로 수집 중인 호출이 있으면 그 결과를 공유
+            #    (더 적게 수집 중이면 따로 수집하고, 이후 호출은 이쪽 결과를 공유)
+            inflight = self._inflight.get(cache_key)
+            owner = inflight is None or inflight[1] < max_count
+            if owner:
+                future = Future()
+                self._inflight[cache_key] = (future, max_count)
+            else:
+                future = inflight[0]
+        
+        if not owner:
+            return future.result()[:max_count]
         
-        # 네이버 금융 (예외 처리)
         try:
-            naver_news = self.crawl_naver_finance_news(stock_code, max_count // 2)
-            all_news.extend(naver_news)
+            news_list, complete = self._fetch_latest_news(stock_code, max_count)
+            
+            # 시간 초과로 일부 소스가 빠진 결과는 캐시하지 않음 (다음 호출에서 다시 수집)
+            if complete:
+                with self._cache_lock:
+                    # 동시에 더 많은 개수로 수집한 최신 결과가 이미 있으면 덮어쓰지 않음
+                    now = time.monotonic()
+                    cached = self.news_cache.get(cache_key)
+                    if not (cached and now - cached[0] < self._cache_ttl and cached[2] > max_count):
+                        self.news_cache[cache_key] = (now, news_list, max_count)
+                        self.news_cache.move_to_end(cache_key)
+                        while len(self.news_cache) > self._cache_max:
+                            self.news_cache.popitem(last=False)
+                        self.last_update_time = datetime.now()
+            
+            future.set_result(news_list)
+            return news_list
         except Exception as e:
-            log.debug(f"네이버 뉴스 수집 실패 ({stock_code}): {e}")
-        
-        # 다음 금융 (예외 처리) - 현재 URL 문제로 비활성화
-        # try:
-        #     daum_news = self.crawl_daum_finance_news(stock_code, max_count // 2)
-        #     all_news.extend(daum_news)
-        # except Exception as e:
-        #     log.debug(f"다음 뉴스 수집 실패 ({stock_code}): {e}")
+            future.set_exception(e)
+            raise
+        finally:
+            with self._cache_lock:
+                # 더 많은 개수를 요청한 호출이 대신 등록했으면 그대로 둠
+                inflight = self._inflight.get(cache_key)
+                if inflight is not None and inflight[0] is future:
+                    del self._inflight[cache_key]
+    
+    def _fetch_latest_news(
+        self,
+        stock_code: str,
+        max_count: int
+    ) -> Tuple[List[NewsItem], bool]:
+        """
+        모든 소스에서 뉴스 수집 (캐시 미사용)
         
-        # 날짜순 정렬 (최신순)
-        if all_news:
-            all_news.sort(key=lambda x: x.date, reverse=True)
+        Args:
+            stock_code: 종목 코드 (None이면 전체)
+            max_count: 최대 개수
         
-        # 캐시에 저장
-        cache_key = stock_code or 'all'
-        self.news_cache[cache_key] = all_news[:max_count]
-        self.last_update_time = datetime.now()
+        Returns:
+            (날짜순(최신순) 정렬된 뉴스 리스트, 모든 소스가 시간 안에 끝났는지 여부)
+        """
+        all_news = []
+        complete = True
+        
+        # 활성화된 소스의 HTTP 요청을 동시에 보내 전체 대기 시간을 가장 느린 소스 기준으로 단축
+        # (풀 조회와 제출을 같은 잠금 안에서 해야 close()와 겹쳐도 종료된 풀에 제출하지 않음)
+        with self._executor_lock:
+            executor = self._get_executor()
+            futures = {
+                executor.submit(self._crawl_source, name, stock_code, max_count // 2): name
+                for name, source in self._sources.items() if source['enabled']
+            }
         
-        return all_news[:max_count]
+        try:
+            for future in as_completed(futures, timeout=self.fetch_timeout):
+                try:
+                    all_news.extend(future.result())
+                except Exception as e:
+                    log.debug(f"{futures[future]} 뉴스 수집 실패 ({stock_code}): {e}")
+        except FuturesTimeoutError:
+            complete = False
+            pending = [source for future, source in futures.items() if not future.done()]
+            log.warning(f"⚠️  뉴스 수집 시간 초과 ({stock_code}): {', '.join(pending)}")
+        
+        # 최신순 상위 max_count개만 선택 (전체 정렬 불필요)
+        return heapq.nlargest(max_count, all_news, key=operator.attrgetter('date')), complete
     
     def get_cached_news(
         self,
@@ -492,10 +686,51 @@ class NewsCrawler:
             stock_code: 종목 코드
         
         Returns:
-            뉴스 리스트
+            뉴스 리스트 (없거나 유효 시간이 지났으면 빈 리스트)
         """
         cache_key = stock_code or 'all'
-        return self.news_cache.get(cache_key, [])
+        
+        with self._cache_lock:
+            cached = self.news_cache.get(cache_key)
+            if not cached:
+                return []
+            
+            if time.monotonic() - cached[0] > self._cache_max_age:
+                del self.news_cache[cache_key]
+                return []
+            
+            self.news_cache.move_to_end(cache_key)
+            return cached[1]
+    
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """소스별 병렬 수집용 스레드 풀 반환 (없으면 생성, _executor_lock 안에서 호출)"""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self._executor_workers, thread_name_prefix="NewsCrawler"
+            )
+        return self._executor
+    
+    def reserve_workers(self, concurrent_calls: int):
+        """
+        get_latest_news를 동시에 concurrent_calls개 호출해도 소스 요청이 풀에서 대기하지 않도록
+        스레드 풀 크기 확보 (호출 수 x 활성 소스 수, 줄이지는 않음)
+        
+        Args:
+            concurrent_calls: 동시에 get_latest_news를 호출할 스레드 수
+        """
+        enabled = sum(1 for source in self._sources.values() if source['enabled'])
+        workers = concurrent_calls * max(enabled, 1)
+        
+        with self._executor_lock:
+            if workers <= self._executor_workers:
+                return
+            
+            self._executor_workers = workers
+            # 기존 풀은 이미 제출된 작업만 마치고 종료, 이후 호출은 새 크기로 다시 생성
+            # (제출은 항상 _executor_lock 안에서 하므로 종료된 풀에 제출하지 않음)
+            if self._executor is not None:
+                self._executor.shutdown(wait=False)
+                self._executor = None
     
     def start_auto_update(self, interval: int = 300):
         """
@@ -509,6 +744,7 @@ class NewsCrawler:
             return
         
         self.is_running = True
+        self._stop_event.clear()
         
         def update_loop():
             log.info(f"🔄 뉴스 자동 갱신 시작 (간격: {interval}초)")
@@ -518,16 +754,12 @@ class NewsCrawler:
                     # 전체 뉴스 갱신
                     self.get_latest_news(max_count=20)
                     log.info(f"✅ 뉴스 자동 갱신 완료: {datetime.now().strftime('%H:%M:%S')}")
-                    
-                    # 대기
-                    for _ in range(interval):
-                        if not self.is_running:
-                            break
-                        time.sleep(1)
-                    
                 except Exception as e:
                     log.error(f"❌ 뉴스 자동 갱신 오류: {e}")
-                    time.sleep(interval)
+                
+                # 대기 (중지 요청 시 즉시 종료)
+                if self._stop_event.wait(timeout=interval):
+                    break
             
             log.info("🛑 뉴스 자동 갱신 중지")
         
@@ -540,12 +772,27 @@ class NewsCrawler:
             return
         
         self.is_running = False
+        self._stop_event.set()
         
         if self.update_thread:
             self.update_thread.join(timeout=5)
         
         log.info("뉴스 자동 갱신이 중지되었습니다.")
     
+    def close(self):
+        """
+        자동 갱신 중지 및 스레드 풀 정리
+        
+        스레드 풀은 전략 등 다른 get_latest_news 호출도 함께 쓰므로 자동 갱신 중지와
+        별도로 여기서만 종료합니다. 이후 get_latest_news를 호출하면 다시 생성됩니다.
+        """
+        self.stop_auto_update()
+        
+        with self._executor_lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False)
+                self._executor = None
+    
     def get_statistics(self) -> Dict:
         """
         통계 정보 반환
@@ -553,11 +800,13 @@ class NewsCrawler:
         Returns:
             통계 딕셔너리
         """
-        total_news = sum(len(news_list) for news_list in self.news_cache.values())
+        with self._cache_lock:
+            cached_stocks = list(self.news_cache.keys())
+            total_news = sum(len(entry[1]) for entry in self.news_cache.values())
         
         return {
             'total_news': total_news,
-            'cached_stocks': list(self.news_cache.keys()),
+            'cached_stocks': cached_stocks,
             'last_update': self.last_update_time.isoformat() if self.last_update_time else None,
             'is_running': self.is_running
         }
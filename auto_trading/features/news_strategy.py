@@ -17,17 +17,207 @@
 [사용 방법]
 strategy = NewsBasedStrategy(news_crawler, sentiment_analyzer)
 signal = strategy.generate_signal(stock_code)
+
+# asyncio 이벤트 루프에서 (수집은 동시에, 분석은 실행기에서)
+signals = await strategy.agenerate_signals(stock_codes, holdings)
 """
 
-from typing import Dict, Optional
+from typing import Dict, List, Optional
 from enum import Enum
+from pathlib import Path
+import asyncio
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import bisect
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+
+import numpy as np
 
 from features.news_crawler import NewsCrawler
 from features.sentiment_analyzer import SentimentAnalyzer
+from features.scheduler import TradingScheduler
 from core.strategies import SignalType, BaseStrategy
 from utils.logger import log
 
 
+# 신호 강도 구간표: |점수| < 30 → 0.2, 30~49 → 0.4, 50~69 → 0.6, 70~99 → 0.8, 100 → 1.0
+_STRENGTH_THRESHOLDS = (30, 50, 70, 100)
+_STRENGTH_VALUES = (0.2, 0.4, 0.6, 0.8, 1.0)
+_STRENGTH_THRESHOLDS_ARR = np.array(_STRENGTH_THRESHOLDS, dtype=np.int16)
+_STRENGTH_VALUES_ARR = np.array(_STRENGTH_VALUES, dtype=np.float64)
+
+# 신호 정수 코드 (SignalType 값은 문자열이라 내부 판단/집계는 정수로 하고 반환 시 변환)
+_BUY = 1
+_SELL = -1
+_HOLD = 0
+_SIGNAL_CODES = {SignalType.BUY: _BUY, SignalType.SELL: _SELL, SignalType.HOLD: _HOLD}
+_SIGNAL_TYPES = {code: signal for signal, code in _SIGNAL_CODES.items()}
+
+# 기술+뉴스 통합 판단표: [기술 판단, 뉴스 신호, 뉴스 강도 구간] -> (최종 신호, 뉴스 사유)
+# 인덱스는 신호 코드 + 1 (매도=0, 관망=1, 매수=2), 강도 구간은 < 0.5, 0.5~0.6, >= 0.6
+_NEWS_STRENGTH_BUCKETS = (0.5, 0.6)
+_NEWS_STRENGTH_BUCKETS_ARR = np.array(_NEWS_STRENGTH_BUCKETS)
+_NEWS_NONE, _NEWS_AGREE, _NEWS_LEAD, _NEWS_CONFLICT = 0, 1, 2, 3
+_NEWS_REASONS = (None, "뉴스 동의", "뉴스 주도", "뉴스 상충")
+
+_S, _H, _B = _SELL + 1, _HOLD + 1, _BUY + 1
+
+# 기본: 기술 판단 유지, 뉴스 사유 없음
+_FUSION_SIGNAL = np.repeat(np.array([_SELL, _HOLD, _BUY], dtype=np.int8), 9).reshape(3, 3, 3)
+_FUSION_OUTCOME = np.zeros((3, 3, 3), dtype=np.int8)
+
+# 뉴스가 기술 분석과 같은 방향이면 강화
+_FUSION_OUTCOME[_B, _B, :] = _NEWS_AGREE
+_FUSION_OUTCOME[_S, _S, :] = _NEWS_AGREE
+
+# 기술 분석이 관망일 때: 강한 뉴스(>= 0.6)는 뉴스 우선, 0.5~0.6은 상충(관망 유지)
+_FUSION_SIGNAL[_H, _B, 2] = _BUY
+_FUSION_SIGNAL[_H, _S, 2] = _SELL
+_FUSION_OUTCOME[_H, _B, 2] = _NEWS_LEAD
+_FUSION_OUTCOME[_H, _S, 2] = _NEWS_LEAD
+_FUSION_OUTCOME[_H, _B, 1] = _NEWS_CONFLICT
+_FUSION_OUTCOME[_H, _S, 1] = _NEWS_CONFLICT
+
+# 뉴스가 반대 방향이고 강도 >= 0.5면 관망으로 약화
+_FUSION_SIGNAL[_B, _S, 1:] = _HOLD
+_FUSION_SIGNAL[_S, _B, 1:] = _HOLD
+_FUSION_OUTCOME[_B, _S, 1:] = _NEWS_CONFLICT
+_FUSION_OUTCOME[_S, _B, 1:] = _NEWS_CONFLICT
+
+
+# 감성 분석 디스크 캐시 형식 버전 (집계 방식이 바뀌면 올려서 이전 결과 무효화)
+_SENTIMENT_CACHE_VERSION = 1
+
+
+class _SentimentDiskCache:
+    """
+    뉴스 묶음별 감성 분석 결과를 SQLite 파일에 저장하는 LRU 캐시
+    
+    같은 기사 묶음이 다시 들어오면 (재시작 후 포함) 재분석 없이 결과를 돌려줍니다.
+    오류가 나면 경고만 남기고 캐시를 끈 채로 계속 동작합니다.
+    """
+    
+    # IN (...) 한 번에 넣는 키 수 (SQLite 변수 개수 제한 이하)
+    QUERY_CHUNK = 500
+    
+    def __init__(self, path: str, namespace: str, max_rows: int = 50000, ttl: float = 86400):
+        """
+        Args:
+            path: SQLite 파일 경로
+            namespace: 키에 섞을 분석기 식별 문자열 (키워드 사전이 바뀌면 다른 키)
+            max_rows: 최대 저장 행 수 (초과 시 가장 오래 안 쓴 결과부터 삭제)
+            ttl: 결과 유효 시간 (초)
+        """
+        self.path = path
+        self.max_rows = max_rows
+        self.ttl = ttl
+        self._namespace = namespace.encode('utf-8')
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        
+        try:
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(path, check_same_thread=False, timeout=5.0, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS sentiment_cache (
+                    key TEXT PRIMARY KEY,
+                    analysis TEXT NOT NULL,
+                    saved_at REAL NOT NULL,
+                    used_at REAL NOT NULL
+                )
+            """)
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_sentiment_used ON sentiment_cache(used_at)")
+            # 만료된 결과는 시작할 때 정리
+            conn.execute("DELETE FROM sentiment_cache WHERE saved_at < ?", (time.time() - ttl,))
+            self._conn = conn
+        except (sqlite3.Error, OSError) as e:
+            log.warning("감성 분석 캐시 비활성화 ({}): {}", path, e)
+    
+    def key(self, news_list: list) -> str:
+        """뉴스 묶음(제목+본문, 순서 포함) 해시 키"""
+        digest = hashlib.blake2b(self._namespace, digest_size=16)
+        for news in news_list:
+            title, content = SentimentAnalyzer._news_text(news)
+            digest.update(b'\x1e')
+            digest.update((title or '').encode('utf-8'))
+            digest.update(b'\x1f')
+            digest.update((content or '').encode('utf-8'))
+        return digest.hexdigest()
+    
+    def get_many(self, keys: List[str]) -> Dict[str, Dict]:
+        """
+        저장된 분석 결과 조회 (찾은 항목은 사용 시각 갱신)
+        
+        Returns:
+            키 -> 분석 결과 (없거나 만료된 키는 빠짐)
+        """
+        if self._conn is None or not keys:
+            return {}
+        
+        now = time.time()
+        found = {}
+        try:
+            with self._lock:
+                for start in range(0, len(keys), self.QUERY_CHUNK):
+                    chunk = keys[start:start + self.QUERY_CHUNK]
+                    rows = self._conn.execute(
+                        f"SELECT key, analysis FROM sentiment_cache "
+                        f"WHERE key IN ({','.join('?' * len(chunk))}) AND saved_at >= ?",
+                        (*chunk, now - self.ttl)
+                    ).fetchall()
+                    for key, analysis in rows:
+                        found[key] = json.loads(analysis)
+                
+                if found:
+                    self._conn.executemany(
+                        "UPDATE sentiment_cache SET used_at = ? WHERE key = ?",
+                        [(now, key) for key in found]
+                    )
+        except (sqlite3.Error, ValueError) as e:
+            log.warning("감성 분석 캐시 조회 실패: {}", e)
+            return {}
+        
+        return found
+    
+    def set_many(self, items: Dict[str, Dict]):
+        """분석 결과 저장 (최대 행 수를 넘으면 가장 오래 안 쓴 결과부터 삭제)"""
+        if self._conn is None or not items:
+            return
+        
+        now = time.time()
+        try:
+            with self._lock:
+                conn = self._conn
+                conn.execute("BEGIN")
+                try:
+                    conn.executemany(
+                        "INSERT OR REPLACE INTO sentiment_cache (key, analysis, saved_at, used_at) "
+                        "VALUES (?, ?, ?, ?)",
+                        [
+                            (key, json.dumps(analysis, ensure_ascii=False), now, now)
+                            for key, analysis in items.items()
+                        ]
+                    )
+                    excess = conn.execute("SELECT COUNT(*) FROM sentiment_cache").fetchone()[0] - self.max_rows
+                    if excess > 0:
+                        conn.execute(
+                            "DELETE FROM sentiment_cache WHERE key IN "
+                            "(SELECT key FROM sentiment_cache ORDER BY used_at LIMIT ?)",
+                            (excess,)
+                        )
+                    conn.execute("COMMIT")
+                except BaseException:
+                    conn.execute("ROLLBACK")
+                    raise
+        except sqlite3.Error as e:
+            log.warning("감성 분석 캐시 저장 실패: {}", e)
+
+
 class NewsBasedStrategy(BaseStrategy):
     """뉴스 기반 매매 전략"""
     
@@ -37,7 +227,8 @@ class NewsBasedStrategy(BaseStrategy):
         sentiment_analyzer: SentimentAnalyzer,
         buy_threshold: int = 30,  # 매수 신호 임계값
         sell_threshold: int = -30,  # 매도 신호 임계값
-        min_news_count: int = 3  # 최소 뉴스 개수
+        min_news_count: int = 3,  # 최소 뉴스 개수
+        sentiment_cache_path: Optional[str] = "data/news_sentiment.db"  # None이면 디스크 캐시 미사용
     ):
         super().__init__("뉴스 감성")
         self.news_crawler = news_crawler
@@ -46,9 +237,23 @@ class NewsBasedStrategy(BaseStrategy):
         self.sell_threshold = sell_threshold
         self.min_news_count = min_news_count
         
+        # 종목별 뉴스 캐시: stock_code -> (monotonic 시각, 뉴스 리스트)
+        # 장중에는 15분, 장외에는 하루 동안 재사용
+        self._news_cache: Dict[str, tuple] = {}
+        self._news_cache_max = 2048
+        self.market_news_ttl = 900
+        self.off_market_news_ttl = 86400
+        
+        # 뉴스 묶음별 감성 분석 결과 디스크 캐시 (재시작/다른 종목에서 같은 기사 묶음이면 재분석 생략)
+        self._sentiment_cache = None
+        if sentiment_cache_path:
+            self._sentiment_cache = _SentimentDiskCache(
+                sentiment_cache_path, self._analyzer_fingerprint(sentiment_analyzer)
+            )
+        
         log.info(
-            f"뉴스 기반 전략 초기화: "
-            f"매수 임계값 {buy_threshold}, 매도 임계값 {sell_threshold}"
+            "뉴스 기반 전략 초기화: 매수 임계값 {}, 매도 임계값 {}",
+            buy_threshold, sell_threshold
         )
     
     def generate_signal_for_stock(
@@ -66,68 +271,278 @@ class NewsBasedStrategy(BaseStrategy):
         Returns:
             신호 정보 딕셔너리
         """
-        try:
-            # 뉴스 가져오기 (캐시 우선)
-            news_list = self.news_crawler.get_cached_news(stock_code)
-            
-            # 뉴스가 없거나 부족하면 새로 가져오기
-            if len(news_list) < self.min_news_count:
-                log.debug(f"뉴스 부족 - 새로 가져오기: {stock_code}")
-                news_list = self.news_crawler.get_latest_news(stock_code, max_count=20)
+        return self.generate_signals_for_stocks(
+            [stock_code], {stock_code: is_holding}
+        )[stock_code]
+    
+    def generate_signals_for_stocks(
+        self,
+        stock_codes: List[str],
+        holdings: Optional[Dict[str, bool]] = None
+    ) -> Dict[str, Dict]:
+        """
+        여러 종목의 뉴스 기반 신호를 한 번에 생성
+        
+        뉴스를 종목별로 모은 뒤 감성 분석은 한 번의 배치로 수행합니다.
+        
+        Args:
+            stock_codes: 종목 코드 리스트
+            holdings: 종목별 보유 여부 (없으면 모두 미보유)
+        
+        Returns:
+            종목 코드 -> 신호 정보 딕셔너리
+        """
+        # 1. 종목별 뉴스 수집
+        fetched = {}
+        for stock_code in stock_codes:
+            try:
+                fetched[stock_code] = self._get_news(stock_code)
+            except Exception as e:
+                fetched[stock_code] = e
+        
+        # 2. 감성 분석 및 신호 결정
+        return self._signals_from_news(stock_codes, fetched, holdings)
+    
+    async def agenerate_signal_for_stock(
+        self,
+        stock_code: str,
+        is_holding: bool = False
+    ) -> Dict:
+        """
+        특정 종목의 뉴스 기반 신호 생성 (asyncio 버전)
+        
+        Args:
+            stock_code: 종목 코드
+            is_holding: 현재 보유 중 여부
+        
+        Returns:
+            신호 정보 딕셔너리
+        """
+        results = await self.agenerate_signals([stock_code], {stock_code: is_holding})
+        return results[stock_code]
+    
+    async def agenerate_signals(
+        self,
+        stock_codes: List[str],
+        holdings: Optional[Dict[str, bool]] = None,
+        max_concurrency: int = 32
+    ) -> Dict[str, Dict]:
+        """
+        여러 종목의 뉴스 기반 신호 생성 (asyncio 버전)
+        
+        크롤러가 동기식이므로 종목별 수집은 기본 실행기(asyncio.to_thread)에서
+        동시에 돌리고, 감성 분석 배치도 실행기에서 수행해 이벤트 루프를 막지 않습니다.
+        
+        Args:
+            stock_codes: 종목 코드 리스트
+            holdings: 종목별 보유 여부 (없으면 모두 미보유)
+            max_concurrency: 동시 수집 최대 종목 수 (같은 사이트에 몰리지 않도록)
+        
+        Returns:
+            종목 코드 -> 신호 정보 딕셔너리
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+        
+        async def fetch(stock_code: str):
+            async with semaphore:
+                return await asyncio.to_thread(self._get_news, stock_code)
+        
+        # 1. 종목별 뉴스 동시 수집 (예외는 종목별 결과로 받음)
+        gathered = await asyncio.gather(
+            *(fetch(stock_code) for stock_code in stock_codes),
+            return_exceptions=True
+        )
+        
+        # 2. 감성 분석 및 신호 결정
+        return await asyncio.to_thread(
+            self._signals_from_news, stock_codes, dict(zip(stock_codes, gathered)), holdings
+        )
+    
+    def _signals_from_news(
+        self,
+        stock_codes: List[str],
+        fetched: Dict[str, object],
+        holdings: Optional[Dict[str, bool]] = None
+    ) -> Dict[str, Dict]:
+        """
+        수집된 뉴스로 종목별 신호 생성 (감성 분석은 한 번의 배치)
+        
+        Args:
+            stock_codes: 종목 코드 리스트
+            fetched: 종목 코드 -> 뉴스 리스트 또는 수집 중 발생한 예외
+            holdings: 종목별 보유 여부 (없으면 모두 미보유)
+        
+        Returns:
+            종목 코드 -> 신호 정보 딕셔너리
+        """
+        holdings = holdings or {}
+        results: Dict[str, Dict] = {}
+        news_by_stock: Dict[str, list] = {}
+        
+        for stock_code in stock_codes:
+            news_list = fetched[stock_code]
+            if isinstance(news_list, Exception):
+                log.error("뉴스 신호 생성 오류 ({}): {}", stock_code, news_list)
+                results[stock_code] = self._error_result(news_list)
+                continue
             
             # 여전히 부족하면 중립
             if len(news_list) < self.min_news_count:
-                return {
+                results[stock_code] = {
                     'signal': SignalType.HOLD,
                     'strength': 0.0,
                     'reason': f'뉴스 부족 ({len(news_list)}개)',
                     'news_score': 0
                 }
-            
-            # 뉴스 감성 분석
-            analysis = self.sentiment_analyzer.analyze_news_list(news_list)
-            average_score = analysis['average_score']
-            
-            # 신호 생성
-            signal = SignalType.HOLD
-            reason = f"뉴스 점수: {average_score:+d}/100"
-            
-            # 매수 신호
-            if average_score >= self.buy_threshold:
-                signal = SignalType.BUY
-                reason = (
-                    f"긍정 뉴스 ({analysis['positive_count']}개), "
-                    f"점수: {average_score:+d}/100"
-                )
-            
-            # 매도 신호 (보유 중일 때만)
-            elif is_holding and average_score <= self.sell_threshold:
-                signal = SignalType.SELL
-                reason = (
-                    f"부정 뉴스 ({analysis['negative_count']}개), "
-                    f"점수: {average_score:+d}/100"
+            else:
+                news_by_stock[stock_code] = news_list
+        
+        # 뉴스 감성 분석 (배치)
+        if news_by_stock:
+            try:
+                analyses = self._analyze_news_lists(list(news_by_stock.values()))
+                decisions = [
+                    self._decide_signal(analysis, holdings.get(stock_code, False))
+                    for stock_code, analysis in zip(news_by_stock, analyses)
+                ]
+                
+                # 신호 강도 계산 (0.0 ~ 1.0, 전 종목 한 번에)
+                strengths = self._strengths_for_codes(
+                    [analysis['average_score'] for analysis in analyses],
+                    np.array([code for code, _ in decisions], dtype=np.int8)
                 )
-            
-            # 신호 강도 계산 (0.0 ~ 1.0)
-            strength = self.calculate_strength(average_score, signal)
-            
-            return {
-                'signal': signal,
-                'strength': strength,
-                'reason': reason,
-                'news_score': average_score,
-                'news_count': len(news_list),
-                'analysis': analysis
-            }
-            
-        except Exception as e:
-            log.error(f"뉴스 신호 생성 오류 ({stock_code}): {e}")
-            return {
-                'signal': SignalType.HOLD,
-                'strength': 0.0,
-                'reason': f'분석 오류: {e}',
-                'news_score': 0
-            }
+                
+                for (stock_code, news_list), analysis, (code, reason), strength in zip(
+                    news_by_stock.items(), analyses, decisions, strengths
+                ):
+                    results[stock_code] = {
+                        'signal': _SIGNAL_TYPES[code],
+                        'strength': float(strength),
+                        'reason': reason,
+                        'news_score': analysis['average_score'],
+                        'news_count': len(news_list),
+                        'analysis': analysis
+                    }
+            except Exception as e:
+                log.error("뉴스 감성 배치 분석 오류 ({}종목): {}", len(news_by_stock), e)
+                for stock_code in news_by_stock:
+                    results[stock_code] = self._error_result(e)
+        
+        return {stock_code: results[stock_code] for stock_code in stock_codes}
+    
+    def _analyze_news_lists(self, news_lists: List[list]) -> List[Dict]:
+        """
+        종목별 뉴스 리스트 감성 분석 (디스크 캐시에 없는 묶음만 배치 분석)
+        
+        Args:
+            news_lists: 종목별 뉴스 리스트
+        
+        Returns:
+            리스트별 종합 분석 결과 (입력 순서와 동일)
+        """
+        cache = self._sentiment_cache
+        if cache is None:
+            return self.sentiment_analyzer.analyze_news_batch(news_lists)
+        
+        keys = [cache.key(news_list) for news_list in news_lists]
+        cached = cache.get_many(keys)
+        
+        missing = [i for i, key in enumerate(keys) if key not in cached]
+        if missing:
+            fresh = self.sentiment_analyzer.analyze_news_batch(
+                [news_lists[i] for i in missing]
+            )
+            stored = {keys[i]: analysis for i, analysis in zip(missing, fresh)}
+            cache.set_many(stored)
+            cached.update(stored)
+        
+        return [cached[key] for key in keys]
+    
+    @staticmethod
+    def _analyzer_fingerprint(sentiment_analyzer: SentimentAnalyzer) -> str:
+        """감성 분석기 키워드 사전 식별 문자열 (사전이 바뀌면 캐시 키도 바뀜)"""
+        return repr((
+            _SENTIMENT_CACHE_VERSION,
+            type(sentiment_analyzer).__name__,
+            [
+                getattr(sentiment_analyzer, name, None)
+                for name in ('positive_keywords', 'negative_keywords',
+                             'intensifiers', 'downtoners', 'negations')
+            ]
+        ))
+    
+    def _get_news(self, stock_code: str) -> list:
+        """
+        종목 뉴스 가져오기 (전략 캐시 → 크롤러 캐시 → 새로 수집)
+        
+        Args:
+            stock_code: 종목 코드
+        
+        Returns:
+            뉴스 리스트
+        """
+        now = time.monotonic()
+        ttl = self.market_news_ttl if TradingScheduler.is_market_hours() else self.off_market_news_ttl
+        
+        cached = self._news_cache.get(stock_code)
+        if cached and now - cached[0] <= ttl:
+            return cached[1]
+        
+        news_list = self.news_crawler.get_cached_news(stock_code)
+        
+        # 뉴스가 없거나 부족하면 새로 가져오기
+        if len(news_list) < self.min_news_count:
+            log.debug("뉴스 부족 - 새로 가져오기: {}", stock_code)
+            news_list = self.news_crawler.get_latest_news(stock_code, max_count=20)
+        
+        # 충분히 모인 경우만 캐시 (부족하면 다음 주기에 다시 시도)
+        if len(news_list) >= self.min_news_count:
+            self._news_cache.pop(stock_code, None)
+            self._news_cache[stock_code] = (now, news_list)
+            if len(self._news_cache) > self._news_cache_max:
+                # 가장 오래전에 저장한 종목 제거
+                del self._news_cache[next(iter(self._news_cache))]
+        
+        return news_list
+    
+    def _decide_signal(self, analysis: Dict, is_holding: bool) -> tuple:
+        """
+        감성 분석 결과로 신호와 사유 결정
+        
+        Args:
+            analysis: 감성 분석 결과
+            is_holding: 현재 보유 중 여부
+        
+        Returns:
+            (신호 코드 _BUY/_SELL/_HOLD, 사유 문자열)
+        """
+        average_score = analysis['average_score']
+        
+        # 매수 신호
+        if average_score >= self.buy_threshold:
+            return _BUY, (
+                f"긍정 뉴스 ({analysis['positive_count']}개), "
+                f"점수: {average_score:+d}/100"
+            )
+        
+        # 매도 신호 (보유 중일 때만)
+        if is_holding and average_score <= self.sell_threshold:
+            return _SELL, (
+                f"부정 뉴스 ({analysis['negative_count']}개), "
+                f"점수: {average_score:+d}/100"
+            )
+        
+        return _HOLD, f"뉴스 점수: {average_score:+d}/100"
+    
+    @staticmethod
+    def _error_result(error: Exception) -> Dict:
+        """분석 오류 시 중립 신호"""
+        return {
+            'signal': SignalType.HOLD,
+            'strength': 0.0,
+            'reason': f'분석 오류: {error}',
+            'news_score': 0
+        }
     
     def calculate_strength(self, score: int, signal: SignalType) -> float:
         """
@@ -143,20 +558,32 @@ class NewsBasedStrategy(BaseStrategy):
         if signal == SignalType.HOLD:
             return 0.0
         
-        # 절대값 사용
-        abs_score = abs(score)
-        
-        # 30 ~ 100 범위를 0.0 ~ 1.0으로 매핑
-        if abs_score >= 100:
-            return 1.0
-        elif abs_score >= 70:
-            return 0.8
-        elif abs_score >= 50:
-            return 0.6
-        elif abs_score >= 30:
-            return 0.4
-        else:
-            return 0.2
+        # 절대값 구간 → 강도 (구간표 참조)
+        return _STRENGTH_VALUES[bisect.bisect_right(_STRENGTH_THRESHOLDS, abs(score))]
+    
+    def calculate_strength_batch(self, scores: list, signals: list) -> np.ndarray:
+        """
+        여러 종목의 신호 강도를 한 번에 계산
+        
+        Args:
+            scores: 종목별 뉴스 점수 (-100 ~ +100)
+            signals: 종목별 신호 타입
+        
+        Returns:
+            종목별 신호 강도 배열 (0.0 ~ 1.0, 관망은 0.0)
+        """
+        codes = np.array([_SIGNAL_CODES[signal] for signal in signals], dtype=np.int8)
+        return self._strengths_for_codes(scores, codes)
+    
+    @staticmethod
+    def _strengths_for_codes(scores: list, codes: np.ndarray) -> np.ndarray:
+        """점수와 신호 코드 배열로 강도 계산 (관망 코드는 0.0)"""
+        abs_scores = np.abs(np.asarray(scores, dtype=np.int16))
+        strengths = _STRENGTH_VALUES_ARR[
+            np.searchsorted(_STRENGTH_THRESHOLDS_ARR, abs_scores, side='right')
+        ]
+        strengths[codes == _HOLD] = 0.0
+        return strengths
     
     def generate_signal(self, prices: list) -> SignalType:
         """
@@ -214,10 +641,23 @@ class NewsEnhancedMultiStrategy:
         self.min_technical_signals = min_technical_signals
         self.news_weight = news_weight
         
+        # 종목별 기술적 분석 결과 캐시: stock_code -> (가격 키, 결과)
+        # 뉴스는 새 봉보다 자주 갱신되므로 가격이 같으면 재계산하지 않음
+        self._tech_cache: Dict[str, tuple] = {}
+        
+        # 종목별 전략 상태: stock_code -> (가격 키, 전략별 update() 상태)
+        # 새 봉이 1개만 추가되면 전략이 직전 상태에서 새 봉만 반영
+        self._strategy_states: Dict[str, tuple] = {}
+        
+        # 종목별 최근 뉴스 점수: stock_code -> (점수, 만료 monotonic 시각)
+        # 기술 분석이 관망이고 최근 뉴스가 중립이면 뉴스 수집/분석 생략
+        self._news_hint_cache: Dict[str, tuple] = {}
+        self.news_hint_ttl = 300
+        self.neutral_news_score = 20
+        
         log.info(
-            f"뉴스 통합 전략 초기화: "
-            f"기술 전략 {len(technical_strategies)}개, "
-            f"뉴스 가중치 {news_weight}"
+            "뉴스 통합 전략 초기화: 기술 전략 {}개, 뉴스 가중치 {}",
+            len(technical_strategies), news_weight
         )
     
     def generate_signal(
@@ -238,63 +678,332 @@ class NewsEnhancedMultiStrategy:
             신호 정보 딕셔너리
         """
         # 1. 기술적 분석 신호
-        technical_buy_count = 0
-        technical_sell_count = 0
+        technical = self._technical_signals(prices, stock_code)
+        
+        # 2. 뉴스 기반 신호 (결과를 바꿀 수 없는 경우 생략)
+        skip_reason = self._news_skip_reason(
+            stock_code, technical, TradingScheduler.is_after_market_close()
+        )
+        if skip_reason:
+            news_result = self._skipped_news_result(stock_code, skip_reason)
+        else:
+            news_result = self.news_strategy.generate_signal_for_stock(stock_code, is_holding)
+            self._remember_news(stock_code, news_result)
+        
+        return self._combine(technical, news_result)
+    
+    def generate_signals(
+        self,
+        stock_prices: Dict[str, list],
+        holdings: Optional[Dict[str, bool]] = None,
+        max_workers: int = 32,
+        politeness_delay_ms: int = 100
+    ) -> Dict[str, Dict]:
+        """
+        여러 종목의 통합 신호를 한 번에 생성
+        
+        뉴스가 부족한 종목은 스레드 풀에서 동시에 수집하고,
+        감성 분석은 한 번의 배치로 수행합니다.
+        뉴스가 결과를 바꿀 수 없는 종목은 수집/분석을 생략합니다.
+        
+        Args:
+            stock_prices: 종목 코드 -> 가격 리스트
+            holdings: 종목별 보유 여부 (없으면 모두 미보유)
+            max_workers: 뉴스 수집 최대 동시 스레드 수
+            politeness_delay_ms: 요청 시작 간격 (같은 사이트에 몰리지 않도록)
+        
+        Returns:
+            종목 코드 -> 신호 정보 딕셔너리
+        """
+        stock_codes = list(stock_prices)
+        
+        # 1. 기술적 분석
+        technicals = [
+            self._technical_signals(prices, stock_code)
+            for stock_code, prices in stock_prices.items()
+        ]
+        
+        # 2. 뉴스가 결과를 바꿀 수 있는 종목만 추림
+        after_close = TradingScheduler.is_after_market_close()
+        news_results: Dict[str, Dict] = {}
+        news_codes = []
+        for stock_code, technical in zip(stock_codes, technicals):
+            skip_reason = self._news_skip_reason(stock_code, technical, after_close)
+            if skip_reason:
+                news_results[stock_code] = self._skipped_news_result(stock_code, skip_reason)
+            else:
+                news_codes.append(stock_code)
+        
+        if news_codes:
+            # 뉴스가 부족한 종목만 동시에 수집
+            self._prefetch_news(news_codes, max_workers, politeness_delay_ms)
+            
+            # 뉴스 기반 신호 (감성 분석 배치)
+            fetched = self.news_strategy.generate_signals_for_stocks(news_codes, holdings)
+            for stock_code, news_result in fetched.items():
+                self._remember_news(stock_code, news_result)
+            news_results.update(fetched)
+        
+        # 3. 통합 판단 (판단표를 전 종목 한 번에 조회)
+        indices = np.array(
+            [
+                self._fusion_index(technical, news_results[stock_code])
+                for technical, stock_code in zip(technicals, stock_codes)
+            ],
+            dtype=np.intp
+        ).reshape(-1, 3)
+        finals = _FUSION_SIGNAL[indices[:, 0], indices[:, 1], indices[:, 2]]
+        outcomes = _FUSION_OUTCOME[indices[:, 0], indices[:, 1], indices[:, 2]]
+        
+        return {
+            stock_code: self._combine(
+                technical, news_results[stock_code], int(final), int(outcome)
+            )
+            for stock_code, technical, final, outcome in zip(
+                stock_codes, technicals, finals, outcomes
+            )
+        }
+    
+    def _news_skip_reason(self, stock_code: str, technical: Dict, after_close: bool) -> Optional[str]:
+        """
+        뉴스 수집/분석을 생략할 사유 (생략하지 않으면 None)
+        
+        - 장 마감 후: 다음 개장 전까지 뉴스로 판단을 바꿀 일이 없음
+        - 기술 분석이 관망이고 최근 뉴스 점수가 중립: 약한 뉴스는 관망을 뒤집지 못함
+        """
+        if after_close:
+            return "장 마감 후"
+        
+        if self._technical_decision(technical) != _HOLD:
+            return None
+        
+        hint = self._news_hint_cache.get(stock_code)
+        if hint and hint[1] > time.monotonic() and abs(hint[0]) < self.neutral_news_score:
+            return f"최근 점수 중립: {hint[0]:+d}"
+        return None
+    
+    def _skipped_news_result(self, stock_code: str, skip_reason: str) -> Dict:
+        """뉴스를 생략한 종목의 중립 뉴스 신호"""
+        hint = self._news_hint_cache.get(stock_code)
+        return {
+            'signal': SignalType.HOLD,
+            'strength': 0.0,
+            'reason': f'뉴스 생략 ({skip_reason})',
+            'news_score': hint[0] if hint else 0
+        }
+    
+    def _remember_news(self, stock_code: str, news_result: Dict):
+        """실제로 분석한 뉴스 점수만 힌트로 보관 (오류/뉴스 부족 결과는 제외)"""
+        if 'analysis' in news_result:
+            self._news_hint_cache[stock_code] = (
+                news_result['news_score'], time.monotonic() + self.news_hint_ttl
+            )
+    
+    def _prefetch_news(
+        self,
+        stock_codes: List[str],
+        max_workers: int,
+        politeness_delay_ms: int
+    ):
+        """
+        캐시 뉴스가 부족한 종목의 뉴스를 동시에 수집 (크롤러 캐시에 저장됨)
+        
+        Args:
+            stock_codes: 종목 코드 리스트
+            max_workers: 최대 동시 스레드 수
+            politeness_delay_ms: 요청 시작 간격 (밀리초)
+        """
+        news_strategy = self.news_strategy
+        crawler = news_strategy.news_crawler
+        missing = [
+            code for code in stock_codes
+            if len(crawler.get_cached_news(code)) < news_strategy.min_news_count
+        ]
+        if not missing:
+            return
+        
+        delay = politeness_delay_ms / 1000.0
+        workers = min(max_workers, len(missing))
+        
+        # get_latest_news는 크롤러 스레드 풀로 소스 요청을 보내므로, 풀이 작으면
+        # 선수집 스레드 수와 무관하게 동시 요청 수가 풀 크기로 제한됨
+        if hasattr(crawler, 'reserve_workers'):
+            crawler.reserve_workers(workers)
+        
+        def fetch(index: int, stock_code: str):
+            # 요청 시작 시각은 배치 시작 기준 index * delay
+            # (작업 시작 기준으로 자면 워커가 바쁠 때 대기가 누적됨)
+            if index and delay:
+                wait = start + index * delay - time.monotonic()
+                if wait > 0:
+                    time.sleep(wait)
+            return crawler.get_latest_news(stock_code, max_count=20)
+        
+        with ThreadPoolExecutor(
+            max_workers=workers,
+            thread_name_prefix="NewsPrefetch"
+        ) as executor:
+            start = time.monotonic()
+            futures = {
+                executor.submit(fetch, index, code): code
+                for index, code in enumerate(missing)
+            }
+            for future in as_completed(futures):
+                try:
+                    future.result()
+                except Exception as e:
+                    log.debug("뉴스 선수집 실패 ({}): {}", futures[future], e)
+    
+    def _technical_signals(self, prices: list, stock_code: Optional[str] = None) -> Dict:
+        """
+        기술적 분석 전략별 신호 계산
+        
+        가격이 그대로면 캐시 결과를 재사용하고, 직전 가격에 새 봉 1개만 추가됐으면
+        전략별 update()에 직전 상태를 넘겨 새 봉만 반영합니다.
+        
+        Args:
+            prices: 가격 리스트
+            stock_code: 종목 코드 (None이면 캐시 미사용)
+        
+        Returns:
+            {'signals': 전략명 -> 신호/강도, 'strengths': 전략별 강도 배열,
+             'buy_count': 매수 수, 'sell_count': 매도 수}
+        """
+        strategies = self.technical_strategies
+        n = len(strategies)
+        
+        price_key = None
+        prev_states = None
+        if stock_code is not None:
+            price_key = (len(prices), hash(tuple(prices)))
+            cached = self._tech_cache.get(stock_code)
+            if cached and cached[0] == price_key:
+                return cached[1]
+            
+            # 직전 호출 가격 + 새 봉 1개인 경우에만 이전 상태 이어받기
+            saved = self._strategy_states.get(stock_code)
+            if (
+                saved and len(saved[1]) == n and
+                saved[0] == (len(prices) - 1, hash(tuple(prices[:-1])))
+            ):
+                prev_states = saved[1]
+        
+        states = [None] * n
+        
+        def evaluate(index: int, strategy) -> tuple:
+            update = getattr(strategy, 'update', None)
+            if update is None:
+                return strategy.generate_signal(prices), strategy.get_signal_strength(prices)
+            signal, strength, states[index] = update(
+                prices, prev_states[index] if prev_states else None
+            )
+            return signal, strength
+        
+        # 전략별 신호 코드/강도를 병렬 배열에 채움 (오류 전략은 관망/0으로 남음)
+        sigs = np.zeros(n, dtype=np.int8)
+        strengths = np.zeros(n, dtype=np.float64)
         technical_signals = {}
         
-        for strategy in self.technical_strategies:
-            try:
-                signal = strategy.generate_signal(prices)
-                strength = strategy.get_signal_strength(prices)
-                
-                technical_signals[strategy.name] = {
-                    'signal': signal,
-                    'strength': strength
-                }
-                
-                if signal == SignalType.BUY:
-                    technical_buy_count += 1
-                elif signal == SignalType.SELL:
-                    technical_sell_count += 1
-                    
-            except Exception as e:
-                log.error(f"기술 전략 '{strategy.name}' 오류: {e}")
+        i = 0
+        try:
+            # 정상 경로: 전략별 예외 처리 없이 한 번에 계산
+            for i, strategy in enumerate(strategies):
+                signal, strength = evaluate(i, strategy)
+                technical_signals[strategy.name] = {'signal': signal, 'strength': strength}
+                sigs[i] = _SIGNAL_CODES.get(signal, _HOLD)
+                strengths[i] = strength
+        except Exception as e:
+            log.error("기술 전략 '{}' 오류: {}", strategies[i].name, e)
+            
+            # 오류 난 전략은 건너뛰고 남은 전략만 하나씩 보호하며 계산
+            for j in range(i + 1, n):
+                strategy = strategies[j]
+                try:
+                    signal, strength = evaluate(j, strategy)
+                except Exception as e:
+                    log.error("기술 전략 '{}' 오류: {}", strategy.name, e)
+                    continue
+                technical_signals[strategy.name] = {'signal': signal, 'strength': strength}
+                sigs[j] = _SIGNAL_CODES.get(signal, _HOLD)
+                strengths[j] = strength
+        
+        technical = {
+            'signals': technical_signals,
+            'strengths': strengths,
+            'buy_count': int((sigs == _BUY).sum()),
+            'sell_count': int((sigs == _SELL).sum())
+        }
+        
+        # 종목당 최신 가격 기준 결과/상태 하나만 유지
+        if price_key is not None:
+            self._tech_cache[stock_code] = (price_key, technical)
+            self._strategy_states[stock_code] = (price_key, states)
         
-        # 2. 뉴스 기반 신호
-        news_result = self.news_strategy.generate_signal_for_stock(stock_code, is_holding)
-        news_signal = news_result['signal']
+        return technical
+    
+    def _technical_decision(self, technical: Dict) -> int:
+        """기술적 분석 판단 코드 (최소 신호 수 이상이면 매수 우선)"""
+        if technical['buy_count'] >= self.min_technical_signals:
+            return _BUY
+        if technical['sell_count'] >= self.min_technical_signals:
+            return _SELL
+        return _HOLD
+    
+    def _fusion_index(self, technical: Dict, news_result: Dict) -> tuple:
+        """통합 판단표 인덱스 (기술 판단, 뉴스 신호, 뉴스 강도 구간)"""
+        return (
+            self._technical_decision(technical) + 1,
+            _SIGNAL_CODES[news_result['signal']] + 1,
+            bisect.bisect_right(_NEWS_STRENGTH_BUCKETS, news_result['strength'])
+        )
+    
+    def _combine(
+        self,
+        technical: Dict,
+        news_result: Dict,
+        final_signal: Optional[int] = None,
+        outcome: Optional[int] = None
+    ) -> Dict:
+        """
+        기술적 분석과 뉴스 신호를 통합
+        
+        Args:
+            technical: _technical_signals() 결과
+            news_result: 뉴스 기반 신호 정보
+            final_signal: 판단표에서 미리 조회한 최종 신호 코드 (없으면 여기서 조회)
+            outcome: 판단표에서 미리 조회한 뉴스 사유 코드
+        
+        Returns:
+            신호 정보 딕셔너리
+        """
+        technical_signals = technical['signals']
+        
+        news_signal = _SIGNAL_CODES[news_result['signal']]
         news_strength = news_result['strength']
         news_score = news_result['news_score']
         
-        # 3. 통합 판단
-        final_signal = SignalType.HOLD
+        # 통합 판단 (판단표 조회, 반환 시 SignalType 변환)
+        if final_signal is None:
+            index = self._fusion_index(technical, news_result)
+            final_signal = int(_FUSION_SIGNAL[index])
+            outcome = int(_FUSION_OUTCOME[index])
+        
         reason_parts = []
         
         # 기술적 분석 결과
-        if technical_buy_count >= self.min_technical_signals:
-            final_signal = SignalType.BUY
+        technical_decision = self._technical_decision(technical)
+        if technical_decision == _BUY:
             reason_parts.append(
-                f"기술 분석 매수 {technical_buy_count}/{len(self.technical_strategies)}"
+                f"기술 분석 매수 {technical['buy_count']}/{len(self.technical_strategies)}"
             )
-        elif technical_sell_count >= self.min_technical_signals:
-            final_signal = SignalType.SELL
+        elif technical_decision == _SELL:
             reason_parts.append(
-                f"기술 분석 매도 {technical_sell_count}/{len(self.technical_strategies)}"
+                f"기술 분석 매도 {technical['sell_count']}/{len(self.technical_strategies)}"
             )
         
         # 뉴스 신호 반영
-        if news_signal != SignalType.HOLD:
-            # 뉴스가 기술 분석과 같은 방향이면 강화
-            if news_signal == final_signal:
-                reason_parts.append(f"뉴스 동의 (점수: {news_score:+d})")
-            # 뉴스가 강한 신호이고 기술 분석이 약하면 뉴스 우선
-            elif news_strength >= 0.6 and final_signal == SignalType.HOLD:
-                final_signal = news_signal
-                reason_parts.append(f"뉴스 주도 (점수: {news_score:+d})")
-            # 뉴스가 반대 방향이면 약화
-            elif news_signal != final_signal and news_strength >= 0.5:
-                final_signal = SignalType.HOLD
-                reason_parts.append(f"뉴스 상충 (점수: {news_score:+d})")
+        if outcome != _NEWS_NONE:
+            reason_parts.append(f"{_NEWS_REASONS[outcome]} (점수: {news_score:+d})")
         
         # 이유 조합
         if not reason_parts:
@@ -303,9 +1012,7 @@ class NewsEnhancedMultiStrategy:
             reason = ", ".join(reason_parts)
         
         # 신호 강도 계산
-        total_strength = 0.0
-        for sig in technical_signals.values():
-            total_strength += sig['strength']
+        total_strength = float(technical['strengths'].sum())
         
         if news_signal == final_signal:
             total_strength += news_strength * self.news_weight
@@ -313,7 +1020,7 @@ class NewsEnhancedMultiStrategy:
         avg_strength = total_strength / (len(self.technical_strategies) + self.news_weight)
         
         return {
-            'signal': final_signal,
+            'signal': _SIGNAL_TYPES[final_signal],
             'strength': avg_strength,
             'reason': reason,
             'technical_signals': technical_signals,
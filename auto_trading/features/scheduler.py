@@ -10,11 +10,12 @@ Windows 작업 스케줄러와 연동하여 프로그램을 자동으로 시작/
 - 실행 시간 로깅
 """
 
+import functools
 import sys
 import time
 import threading
-from datetime import datetime, time as dt_time
-from typing import Optional, Callable
+from datetime import date, datetime, time as dt_time
+from typing import Optional, Callable, Dict, Tuple
 from utils.logger import log
 
 
@@ -31,6 +32,12 @@ class TradingScheduler:
     AUTO_START_TIME = dt_time(8, 30)      # 08:30 (자동 시작)
     AUTO_STOP_TIME = dt_time(16, 0)       # 16:00 (자동 종료)
     
+    # 같은 시각을 자정 이후 초로 표현 (판정은 정수 비교, 위 dt_time은 표시/로그용)
+    MARKET_OPEN_SEC = 9 * 3600            # 32400
+    MARKET_CLOSE_SEC = 15 * 3600 + 1800   # 55800
+    AUTO_START_SEC = 8 * 3600 + 1800      # 30600
+    AUTO_STOP_SEC = 16 * 3600             # 57600
+    
     def __init__(
         self,
         enable_auto_shutdown: bool = True,
@@ -47,6 +54,7 @@ class TradingScheduler:
         self.shutdown_callback = shutdown_callback
         self.is_running = False
         self.scheduler_thread = None
+        self._stop_event = threading.Event()
         
         log.info(f"자동매매 스케줄러 초기화 (자동 종료: {self.enable_auto_shutdown})")
     
@@ -57,6 +65,7 @@ class TradingScheduler:
             return
         
         self.is_running = True
+        self._stop_event.clear()
         self.scheduler_thread = threading.Thread(target=self._scheduler_loop, daemon=True)
         self.scheduler_thread.start()
         log.success("자동매매 스케줄러 시작")
@@ -65,31 +74,45 @@ class TradingScheduler:
         """스케줄러 중지"""
         if self.is_running:
             self.is_running = False
+            self._stop_event.set()
             if self.scheduler_thread and self.scheduler_thread.is_alive():
                 self.scheduler_thread.join(timeout=5)
             log.info("자동매매 스케줄러 중지")
     
+    def _seconds_until_stop(self) -> float:
+        """자동 종료 시간까지 남은 초 (이미 지났으면 0)"""
+        now = datetime.now()
+        stop_dt = datetime.combine(now.date(), self.AUTO_STOP_TIME)
+        return max(0.0, (stop_dt - now).total_seconds())
+    
     def _scheduler_loop(self):
-        """스케줄러 메인 루프"""
+        """스케줄러 메인 루프 (자동 종료 시간까지 한 번만 대기)"""
         log.info("스케줄러 루프 시작")
         
-        while self.is_running:
-            try:
-                current_time = datetime.now().time()
-                
-                # 1분마다 체크
-                if self.enable_auto_shutdown:
-                    # 자동 종료 시간 체크
-                    if current_time >= self.AUTO_STOP_TIME:
-                        log.warning(f"자동 종료 시간 도달 ({self.AUTO_STOP_TIME})")
-                        self._execute_shutdown()
+        try:
+            # 자동 종료 시각을 monotonic 기준 마감(ns)으로 한 번만 계산 (벽시계 조정에 영향 없음)
+            deadline_ns = time.monotonic_ns() + int(self._seconds_until_stop() * 1e9)
+            
+            while True:
+                remaining_ns = deadline_ns - time.monotonic_ns()
+                if remaining_ns <= 0:
+                    # 벽시계 확인 (대기 중 시계가 뒤로 조정됐으면 남은 만큼 다시 대기)
+                    seconds_left = self._seconds_until_stop()
+                    if seconds_left <= 1.0:
                         break
+                    deadline_ns = time.monotonic_ns() + int(seconds_left * 1e9)
+                    continue
                 
-                time.sleep(60)  # 1분마다 체크
+                # stop() 호출 시 즉시 깨어나 종료
+                if self._stop_event.wait(timeout=remaining_ns / 1e9):
+                    return
+            
+            if self.enable_auto_shutdown:
+                log.warning(f"자동 종료 시간 도달 ({self.AUTO_STOP_TIME})")
+                self._execute_shutdown()
                 
-            except Exception as e:
-                log.error(f"스케줄러 루프 오류: {e}")
-                time.sleep(60)
+        except Exception as e:
+            log.error(f"스케줄러 루프 오류: {e}")
     
     def _execute_shutdown(self):
         """자동 종료 실행"""
@@ -113,6 +136,17 @@ class TradingScheduler:
             log.error(f"자동 종료 중 오류: {e}")
             sys.exit(1)
     
+    @staticmethod
+    def _snapshot() -> Tuple[int, int]:
+        """
+        현재 시각 스냅샷 (datetime.now() 1회 호출)
+        
+        Returns:
+            (자정 이후 초, 요일 - 월요일 0 ~ 일요일 6)
+        """
+        now = datetime.now()
+        return now.hour * 3600 + now.minute * 60 + now.second, now.weekday()
+    
     @staticmethod
     def is_market_hours() -> bool:
         """
@@ -121,12 +155,11 @@ class TradingScheduler:
         Returns:
             거래 시간 여부
         """
-        current_time = datetime.now().time()
-        is_weekday = datetime.now().weekday() < 5  # 월~금 (0~4)
+        sec_of_day, weekday = TradingScheduler._snapshot()
         
         return (
-            is_weekday and
-            TradingScheduler.MARKET_OPEN_TIME <= current_time <= TradingScheduler.MARKET_CLOSE_TIME
+            weekday < 5 and  # 월~금 (0~4)
+            TradingScheduler.MARKET_OPEN_SEC <= sec_of_day <= TradingScheduler.MARKET_CLOSE_SEC
         )
     
     @staticmethod
@@ -137,10 +170,9 @@ class TradingScheduler:
         Returns:
             개장 전 여부
         """
-        current_time = datetime.now().time()
-        is_weekday = datetime.now().weekday() < 5
+        sec_of_day, weekday = TradingScheduler._snapshot()
         
-        return is_weekday and current_time < TradingScheduler.MARKET_OPEN_TIME
+        return weekday < 5 and sec_of_day < TradingScheduler.MARKET_OPEN_SEC
     
     @staticmethod
     def is_after_market_close() -> bool:
@@ -150,10 +182,9 @@ class TradingScheduler:
         Returns:
             마감 후 여부
         """
-        current_time = datetime.now().time()
-        is_weekday = datetime.now().weekday() < 5
+        sec_of_day, weekday = TradingScheduler._snapshot()
         
-        return is_weekday and current_time > TradingScheduler.MARKET_CLOSE_TIME
+        return weekday < 5 and sec_of_day > TradingScheduler.MARKET_CLOSE_SEC
     
     @staticmethod
     def get_market_status() -> str:
@@ -163,19 +194,41 @@ class TradingScheduler:
         Returns:
             시장 상태 문자열
         """
+        # 상태 경계(09:00, 15:30)가 분 단위라 같은 분 안에서는 결과가 같음
         now = datetime.now()
-        current_time = now.time()
-        is_weekday = now.weekday() < 5
+        return _cached_status(now.date(), now.hour, now.minute)
+    
+    @staticmethod
+    def market_snapshot() -> Dict:
+        """
+        시장 시간 판정을 한 시점 기준으로 모두 반환
         
-        if not is_weekday:
-            return "주말 (휴장)"
+        여러 판정을 연달아 확인할 때 사용하면 datetime.now()를 한 번만 호출하고,
+        경계 시각(예: 15:30)에서도 판정끼리 어긋나지 않습니다.
         
-        if current_time < TradingScheduler.MARKET_OPEN_TIME:
-            return "개장 전"
-        elif current_time < TradingScheduler.MARKET_CLOSE_TIME:
-            return "거래 중"
+        Returns:
+            {'is_market_hours', 'is_before_market_open', 'is_after_market_close', 'status'}
+        """
+        sec_of_day, weekday = TradingScheduler._snapshot()
+        is_weekday = weekday < 5
+        open_sec = TradingScheduler.MARKET_OPEN_SEC
+        close_sec = TradingScheduler.MARKET_CLOSE_SEC
+        
+        if not is_weekday:
+            status = "주말 (휴장)"
+        elif sec_of_day < open_sec:
+            status = "개장 전"
+        elif sec_of_day < close_sec:
+            status = "거래 중"
         else:
-            return "마감 후"
+            status = "마감 후"
+        
+        return {
+            'is_market_hours': is_weekday and open_sec <= sec_of_day <= close_sec,
+            'is_before_market_open': is_weekday and sec_of_day < open_sec,
+            'is_after_market_close': is_weekday and sec_of_day > close_sec,
+            'status': status
+        }
     
     @staticmethod
     def print_schedule_info():
@@ -191,6 +244,21 @@ class TradingScheduler:
         log.info("=" * 70)
 
 
+@functools.lru_cache(maxsize=4)
+def _cached_status(day: date, hour: int, minute: int) -> str:
+    """(날짜, 시, 분)별 시장 상태 (GUI 타이머 등 잦은 호출은 분당 한 번만 계산)"""
+    if day.weekday() >= 5:
+        return "주말 (휴장)"
+    
+    sec_of_day = hour * 3600 + minute * 60
+    if sec_of_day < TradingScheduler.MARKET_OPEN_SEC:
+        return "개장 전"
+    elif sec_of_day < TradingScheduler.MARKET_CLOSE_SEC:
+        return "거래 중"
+    else:
+        return "마감 후"
+
+
 if __name__ == "__main__":
     """테스트 코드"""
     
@@ -198,10 +266,11 @@ if __name__ == "__main__":
     TradingScheduler.print_schedule_info()
     
     print("\n시장 시간 체크:")
-    print(f"  - 거래 시간: {TradingScheduler.is_market_hours()}")
-    print(f"  - 개장 전: {TradingScheduler.is_before_market_open()}")
-    print(f"  - 마감 후: {TradingScheduler.is_after_market_close()}")
-    print(f"  - 현재 상태: {TradingScheduler.get_market_status()}")
+    snapshot = TradingScheduler.market_snapshot()
+    print(f"  - 거래 시간: {snapshot['is_market_hours']}")
+    print(f"  - 개장 전: {snapshot['is_before_market_open']}")
+    print(f"  - 마감 후: {snapshot['is_after_market_close']}")
+    print(f"  - 현재 상태: {snapshot['status']}")
     
     print("\n스케줄러 테스트 (10초 후 종료):")
     
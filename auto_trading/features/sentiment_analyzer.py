@@ -25,9 +25,41 @@ from typing import Dict, List, Tuple
 from collections import defaultdict
 import re
 
+import numpy as np
+
+# numba가 있으면 점수 집계를 JIT 컴파일 (없으면 numpy로 그대로 실행)
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    
+    def njit(*args, **kwargs):
+        """numba 미설치 시 대체 데코레이터 (함수를 그대로 반환)"""
+        return lambda func: func
+
 from utils.logger import log
 
 
+@njit(cache=True)
+def _aggregate_scores(scores, pos_threshold, neg_threshold):
+    """
+    뉴스 점수 배열 집계
+    
+    Args:
+        scores: 뉴스별 점수 배열 (np.int16, -100 ~ +100)
+        pos_threshold: 긍정 판정 하한
+        neg_threshold: 부정 판정 상한
+    
+    Returns:
+        (점수 합계, 긍정 개수, 부정 개수)
+    """
+    total = scores.sum()
+    positive_count = (scores >= pos_threshold).sum()
+    negative_count = (scores <= neg_threshold).sum()
+    return total, positive_count, negative_count
+
+
 class SentimentAnalyzer:
     """감성 분석기 클래스"""
     
@@ -244,12 +276,7 @@ class SentimentAnalyzer:
             분석 결과 딕셔너리
         """
         # 제목 분석
-        if hasattr(news_item, 'title'):
-            title = news_item.title
-            content = news_item.content
-        else:
-            title = news_item.get('title', '')
-            content = news_item.get('content', '')
+        title, content = self._news_text(news_item)
         
         title_score = self.analyze_text(title)
         content_score = self.analyze_text(content)
@@ -276,6 +303,13 @@ class SentimentAnalyzer:
             'sentiment': sentiment
         }
     
+    @staticmethod
+    def _news_text(news_item) -> Tuple[str, str]:
+        """뉴스 아이템에서 (제목, 본문) 추출 (NewsItem 객체 또는 딕셔너리)"""
+        if hasattr(news_item, 'title'):
+            return news_item.title, news_item.content
+        return news_item.get('title', ''), news_item.get('content', '')
+    
     def analyze_news_list(self, news_list: List) -> Dict:
         """
         뉴스 리스트 전체 분석
@@ -286,7 +320,47 @@ class SentimentAnalyzer:
         Returns:
             종합 분석 결과
         """
-        if not news_list:
+        return self.analyze_news_batch([news_list])[0]
+    
+    def analyze_news_batch(self, news_lists: List[List]) -> List[Dict]:
+        """
+        여러 뉴스 리스트(종목별)를 한 번에 분석
+        
+        같은 기사가 여러 종목 리스트에 들어 있으면 한 번만 채점합니다.
+        
+        Args:
+            news_lists: 종목별 NewsItem 리스트의 리스트
+        
+        Returns:
+            리스트별 종합 분석 결과 (입력 순서와 동일)
+        """
+        score_cache: Dict[Tuple[str, str], int] = {}
+        results = []
+        
+        for news_list in news_lists:
+            scores = []
+            for news in news_list:
+                key = self._news_text(news)
+                score = score_cache.get(key)
+                if score is None:
+                    score = score_cache[key] = self.analyze_news(news)['final_score']
+                scores.append(score)
+            
+            results.append(self._summarize_scores(scores))
+        
+        return results
+    
+    def _summarize_scores(self, scores: List[int]) -> Dict:
+        """
+        뉴스별 점수를 종합 분석 결과로 집계
+        
+        Args:
+            scores: 뉴스별 최종 점수 리스트
+        
+        Returns:
+            종합 분석 결과
+        """
+        if not scores:
             return {
                 'average_score': 0,
                 'positive_count': 0,
@@ -295,25 +369,17 @@ class SentimentAnalyzer:
                 'sentiment': '중립'
             }
         
-        scores = []
-        positive_count = 0
-        negative_count = 0
-        neutral_count = 0
-        
-        for news in news_list:
-            result = self.analyze_news(news)
-            score = result['final_score']
-            scores.append(score)
-            
-            if score >= 10:
-                positive_count += 1
-            elif score <= -10:
-                negative_count += 1
-            else:
-                neutral_count += 1
+        # 점수는 -100 ~ +100 범위라 int16 버퍼로 집계
+        count = len(scores)
+        total, positive_count, negative_count = _aggregate_scores(
+            np.fromiter(scores, dtype=np.int16, count=count), 10, -10
+        )
+        positive_count = int(positive_count)
+        negative_count = int(negative_count)
+        neutral_count = count - positive_count - negative_count
         
         # 평균 점수
-        average_score = int(sum(scores) / len(scores))
+        average_score = int(int(total) / count)
         
         # 전체 감성
         if average_score >= 20:
@@ -332,7 +398,7 @@ class SentimentAnalyzer:
             'positive_count': positive_count,
             'negative_count': negative_count,
             'neutral_count': neutral_count,
-            'total_count': len(news_list),
+            'total_count': len(scores),
             'sentiment': overall_sentiment,
             'scores': scores
         }
@@ -260,8 +260,8 @@ class ChartWidget(QWidget):
                 for candle in candles:
                     self.update_price_data(
                         stock_code,
-                        candle['close'],
-                        candle['timestamp']
+                        candle.close,
+                        candle.timestamp
                     )
                 
                 print(f"✅ {stock_code} 히스토리 로드: {len(candles)}개 1분봉 (최근 {days}일)")
@@ -19,16 +19,98 @@ dialog.exec_()
 
 from PyQt5.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QLabel,
-    QPushButton, QLineEdit, QTableWidget, QTableWidgetItem,
+    QPushButton, QLineEdit, QTableView,
     QGroupBox, QFormLayout, QRadioButton, QButtonGroup,
     QSpinBox, QMessageBox, QComboBox
 )
-from PyQt5.QtCore import Qt, QTimer
+from PyQt5.QtCore import Qt, QTimer, QAbstractTableModel, QModelIndex
 from PyQt5.QtGui import QFont, QColor
-from typing import Dict, Optional
+from typing import Dict, List, Optional
 from utils.logger import log
 
 
+class HoldingsModel(QAbstractTableModel):
+    """
+    보유 종목 테이블 모델
+    
+    셀 아이템을 미리 만들지 않고, 화면에 보이는 셀만 data()에서 그때그때 포맷합니다.
+    """
+    
+    HEADERS = ["종목코드", "종목명", "수량", "평균가"]
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows: List[Dict] = []
+    
+    def set_rows(self, holdings: List[Dict]):
+        """보유 종목 전체 교체"""
+        self.beginResetModel()
+        self._rows = list(holdings)
+        self.endResetModel()
+    
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._rows)
+    
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.HEADERS)
+    
+    def data(self, index, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole or not index.isValid():
+            return None
+        
+        holding = self._rows[index.row()]
+        column = index.column()
+        if column == 0:
+            return holding.get('code', '-')
+        if column == 1:
+            return holding.get('name', '-')
+        if column == 2:
+            return str(holding.get('quantity', 0))
+        return f"{holding.get('avg_price', 0):,}"
+    
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.HEADERS[section]
+        return super().headerData(section, orientation, role)
+
+
+class OrderbookModel(QAbstractTableModel):
+    """
+    호가 테이블 모델 (매도 5단계 + 매수 5단계, 10행 x 3열 고정)
+    
+    호가 단계별 실시간 데이터는 아직 연결되지 않아 가격/수량은 "-"로 표시합니다.
+    """
+    
+    HEADERS = ["구분", "가격", "수량"]
+    LEVELS = 5
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        # 행: [구분, 가격, 수량] (가격/수량이 None이면 "-")
+        self._rows = (
+            [[f"매도{self.LEVELS - i}", None, None] for i in range(self.LEVELS)] +
+            [[f"매수{i + 1}", None, None] for i in range(self.LEVELS)]
+        )
+    
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._rows)
+    
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.HEADERS)
+    
+    def data(self, index, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole or not index.isValid():
+            return None
+        
+        value = self._rows[index.row()][index.column()]
+        return "-" if value is None else value
+    
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.HEADERS[section]
+        return super().headerData(section, orientation, role)
+
+
 class ManualTradingDialog(QDialog):
     """수동 거래 다이얼로그"""
     
@@ -39,18 +121,22 @@ class ManualTradingDialog(QDialog):
         self.current_stock_name = None
         self.current_price = 0
         
+        # 마지막으로 표시한 보유 종목 (코드, 수량, 평균가) - 같으면 테이블 갱신 생략
+        self._holdings_signature = None
+        
         self.setWindowTitle("수동 거래")
         self.setMinimumWidth(700)
         self.setMinimumHeight(800)
         
+        # 보유 종목 갱신 타이머 (체결 알림이 몰려도 150ms 안의 알림은 한 번만 조회)
+        self.update_timer = QTimer(self)
+        self.update_timer.setSingleShot(True)
+        self.update_timer.setInterval(150)
+        self.update_timer.timeout.connect(self.update_display)
+        
         self.init_ui()
         self.setup_realtime_callback()
         self.load_holdings()
-        
-        # 실시간 업데이트 타이머 (1초마다)
-        self.update_timer = QTimer()
-        self.update_timer.timeout.connect(self.update_display)
-        self.update_timer.start(1000)
     
     def init_ui(self):
         """UI 초기화"""
@@ -129,24 +215,12 @@ class ManualTradingDialog(QDialog):
         group = QGroupBox("호가 정보")
         layout = QVBoxLayout()
         
-        # 호가 테이블
-        self.orderbook_table = QTableWidget()
-        self.orderbook_table.setColumnCount(3)
-        self.orderbook_table.setHorizontalHeaderLabels(["구분", "가격", "수량"])
-        self.orderbook_table.setRowCount(10)  # 매도5 + 매수5
+        # 호가 테이블 (매도5 + 매수5, 초기값 "-")
+        self.orderbook_model = OrderbookModel(self)
+        self.orderbook_table = QTableView()
+        self.orderbook_table.setModel(self.orderbook_model)
         self.orderbook_table.setMaximumHeight(300)
         
-        # 초기 데이터
-        for i in range(5):
-            self.orderbook_table.setItem(i, 0, QTableWidgetItem(f"매도{5-i}"))
-            self.orderbook_table.setItem(i, 1, QTableWidgetItem("-"))
-            self.orderbook_table.setItem(i, 2, QTableWidgetItem("-"))
-        
-        for i in range(5, 10):
-            self.orderbook_table.setItem(i, 0, QTableWidgetItem(f"매수{i-4}"))
-            self.orderbook_table.setItem(i, 1, QTableWidgetItem("-"))
-            self.orderbook_table.setItem(i, 2, QTableWidgetItem("-"))
-        
         layout.addWidget(self.orderbook_table)
         
         # 체결 강도
@@ -161,9 +235,9 @@ class ManualTradingDialog(QDialog):
         group = QGroupBox("보유 종목")
         layout = QVBoxLayout()
         
-        self.holdings_table = QTableWidget()
-        self.holdings_table.setColumnCount(4)
-        self.holdings_table.setHorizontalHeaderLabels(["종목코드", "종목명", "수량", "평균가"])
+        self.holdings_model = HoldingsModel(self)
+        self.holdings_table = QTableView()
+        self.holdings_table.setModel(self.holdings_model)
         self.holdings_table.setMaximumHeight(150)
         
         layout.addWidget(self.holdings_table)
@@ -302,9 +376,16 @@ class ManualTradingDialog(QDialog):
     
     def setup_realtime_callback(self):
         """실시간 데이터 콜백 설정"""
-        # kiwoom_api의 실시간 콜백에 이 다이얼로그를 연결
-        # 실제로는 kiwoom_api의 _on_receive_real_data에서 처리
-        pass
+        # 시세는 kiwoom_api의 _on_receive_real_data에서 처리
+        # 보유 종목은 주기적으로 조회하지 않고 체결/잔고 변경 알림이 올 때만 갱신
+        callbacks = getattr(self.kiwoom, 'callbacks', None)
+        if callbacks is not None:
+            callbacks['positions_changed'] = self.on_positions_changed
+    
+    def on_positions_changed(self):
+        """체결/잔고 변경 알림 (이미 갱신 대기 중이면 합쳐서 한 번만 조회)"""
+        if not self.update_timer.isActive():
+            self.update_timer.start()
     
     def update_quote_display(self, stock_info: Dict):
         """시세 정보 표시 업데이트"""
@@ -335,19 +416,22 @@ class ManualTradingDialog(QDialog):
         try:
             holdings = self.kiwoom.get_holdings()
             
-            self.holdings_table.setRowCount(len(holdings))
+            # 보유 내역이 그대로면 테이블 아이템을 다시 만들지 않음
+            signature = tuple(
+                (holding.get('code'), holding.get('quantity'), holding.get('avg_price'))
+                for holding in holdings
+            )
+            if signature == self._holdings_signature:
+                return
+            self._holdings_signature = signature
             
-            for row, holding in enumerate(holdings):
-                self.holdings_table.setItem(row, 0, QTableWidgetItem(holding.get('code', '-')))
-                self.holdings_table.setItem(row, 1, QTableWidgetItem(holding.get('name', '-')))
-                self.holdings_table.setItem(row, 2, QTableWidgetItem(str(holding.get('quantity', 0))))
-                self.holdings_table.setItem(row, 3, QTableWidgetItem(f"{holding.get('avg_price', 0):,}"))
+            self.holdings_model.set_rows(holdings)
             
         except Exception as e:
             log.error(f"보유 종목 로드 오류: {e}")
     
     def update_display(self):
-        """주기적 디스플레이 업데이트"""
+        """디스플레이 업데이트 (체결/잔고 변경 알림 후 한 번)"""
         # 보유 종목 갱신
         self.load_holdings()
     
@@ -458,6 +542,11 @@ class ManualTradingDialog(QDialog):
         """다이얼로그 닫기 이벤트"""
         self.update_timer.stop()
         
+        # 보유 종목 변경 알림 해제 (다른 다이얼로그가 등록한 경우는 유지)
+        callbacks = getattr(self.kiwoom, 'callbacks', None)
+        if callbacks is not None and callbacks.get('positions_changed') == self.on_positions_changed:
+            del callbacks['positions_changed']
+        
         # 실시간 시세 해제
         if self.current_stock_code:
             try:
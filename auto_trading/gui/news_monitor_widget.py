@@ -4,17 +4,170 @@
 뉴스 크롤링 상황을 실시간으로 모니터링하는 GUI 컴포넌트
 """
 
+from collections import deque
 from datetime import datetime
+from typing import Iterable, Tuple
 from PyQt5.QtWidgets import (
-    QGroupBox, QVBoxLayout, QHBoxLayout, QTableWidget, 
-    QTableWidgetItem, QLabel, QHeaderView
+    QGroupBox, QVBoxLayout, QHBoxLayout, QTableView, 
+    QLabel, QHeaderView
 )
-from PyQt5.QtCore import Qt
+from PyQt5.QtCore import Qt, QTimer, QAbstractTableModel, QModelIndex, pyqtSignal
 from PyQt5.QtGui import QColor
 
 
+# 로그 한 줄: (시간, 소스, 종목 코드, 메시지, 레벨)
+NewsLogEntry = Tuple[str, str, str, str, str]
+
+
+class NewsLogModel(QAbstractTableModel):
+    """
+    뉴스 로그 테이블 모델 (최신 로그가 0번 행, 최대 max_rows개 보관)
+    
+    링 버퍼(deque)에 원본 로그만 보관하고, 표시 텍스트/색상/정렬은
+    화면에 보이는 셀만 data()에서 그때그때 계산합니다.
+    """
+    
+    HEADERS = ["시간", "소스", "종목", "내용", "상태"]
+    
+    SOURCE_NAMES = {
+        "naver": "네이버",
+        "daum": "다음",
+    }
+    
+    STATUS_TEXTS = {
+        "info": "ℹ️ 정보",
+        "success": "✅ 성공",
+        "warning": "⚠️ 경고",
+        "error": "❌ 오류",
+    }
+    
+    # 색상 캐시 (data()가 셀을 그릴 때마다 QColor를 새로 만들지 않도록 한 번만 생성)
+    # 소스 컬럼: 소스 이름, 상태 컬럼: 레벨 (알 수 없는 레벨은 info)
+    _FG = {
+        "naver": QColor("green"),
+        "daum": QColor("blue"),
+        "success": QColor("#00AA00"),
+        "warning": QColor("#FF8800"),
+        "error": QColor("#CC0000"),
+        "info": QColor("#0066CC"),
+    }
+    _BG = {
+        "success": QColor("#E8F5E9"),
+        "warning": QColor("#FFF3E0"),
+        "error": QColor("#FFEBEE"),
+    }
+    
+    def __init__(self, max_rows: int = 100, parent=None):
+        super().__init__(parent)
+        self._rows = deque(maxlen=max_rows)
+    
+    @property
+    def max_rows(self) -> int:
+        return self._rows.maxlen
+    
+    def prepend(self, entry: NewsLogEntry):
+        """로그 한 줄을 맨 위에 추가 (가득 차 있으면 가장 오래된 줄 삭제)"""
+        self.prepend_many((entry,))
+    
+    def prepend_many(self, entries: Iterable[NewsLogEntry]):
+        """
+        로그 여러 줄을 맨 위에 추가 (오래된 것부터, 마지막 항목이 0번 행)
+        
+        삭제/추가 시그널을 각각 한 번만 보냅니다.
+        """
+        entries = list(entries)[-self.max_rows:]
+        if not entries:
+            return
+        
+        # 넘치는 만큼 꼬리(가장 오래된 줄) 삭제
+        overflow = len(self._rows) + len(entries) - self.max_rows
+        if overflow > 0:
+            last = len(self._rows) - 1
+            self.beginRemoveRows(QModelIndex(), last - overflow + 1, last)
+            for _ in range(overflow):
+                self._rows.pop()
+            self.endRemoveRows()
+        
+        self.beginInsertRows(QModelIndex(), 0, len(entries) - 1)
+        self._rows.extendleft(entries)
+        self.endInsertRows()
+    
+    def clear(self):
+        """로그 전체 삭제"""
+        self.beginResetModel()
+        self._rows.clear()
+        self.endResetModel()
+    
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._rows)
+    
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.HEADERS)
+    
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        
+        timestamp, source, stock_code, message, level = self._rows[index.row()]
+        column = index.column()
+        
+        if role == Qt.DisplayRole:
+            if column == 0:
+                return timestamp
+            if column == 1:
+                return self.SOURCE_NAMES.get(source, source)
+            if column == 2:
+                return stock_code if stock_code else "-"
+            if column == 3:
+                return message
+            return self.STATUS_TEXTS.get(level, "ℹ️ 정보")
+        
+        if role == Qt.TextAlignmentRole:
+            # 내용 컬럼만 기본 정렬
+            return None if column == 3 else Qt.AlignCenter
+        
+        if role == Qt.ForegroundRole:
+            if column == 1 and source in ("naver", "daum"):
+                return self._FG[source]
+            if column == 4:
+                # 상태별 색상
+                return self._FG.get(level, self._FG["info"])
+            return None
+        
+        if role == Qt.BackgroundRole and column == 4:
+            return self._BG.get(level)
+        
+        return None
+    
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.HEADERS[section]
+        return super().headerData(section, orientation, role)
+
+
 class NewsMonitorWidget(QGroupBox):
-    """뉴스 검색 모니터링 위젯"""
+    """
+    뉴스 검색 모니터링 위젯
+    
+    add_news_log / update_source_stats는 크롤러 작업 스레드에서 호출되므로,
+    시그널(QueuedConnection)로 GUI 스레드에 넘긴 뒤에만 위젯/타이머/모델을 다룹니다.
+    """
+    
+    # (시간, 소스, 종목 코드, 메시지, 레벨)
+    _log_received = pyqtSignal(str, str, str, str, str)
+    # (소스, 성공 횟수, 전체 시도 횟수)
+    _stats_received = pyqtSignal(str, int, int)
+    
+    # 상태 레이블 스타일 (생성 시 한 번만 적용하고, 이후에는 state 속성만 변경)
+    _STATUS_STYLE = """
+        QLabel[state="idle"] { font-weight: bold; color: #666; }
+        QLabel[state="running"] { font-weight: bold; color: green; }
+        QLabel[state="naver"] { color: green; }
+        QLabel[state="daum"] { color: blue; }
+        QLabel[state="ok"] { font-weight: bold; color: green; }
+        QLabel[state="warn"] { font-weight: bold; color: orange; }
+        QLabel[state="bad"] { font-weight: bold; color: red; }
+    """
     
     def __init__(self, parent=None):
         super().__init__("📰 뉴스 검색 모니터링", parent)
@@ -25,14 +178,19 @@ class NewsMonitorWidget(QGroupBox):
         # 상태 표시 레이블
         status_layout = QHBoxLayout()
         self.status_label = QLabel("⏸️ 대기 중...")
-        self.status_label.setStyleSheet("font-weight: bold; color: #666;")
         status_layout.addWidget(self.status_label)
         
         # 소스별 통계
         self.naver_status = QLabel("네이버: 0/0 (0%)")
-        self.naver_status.setStyleSheet("color: green;")
         self.daum_status = QLabel("다음: 0/0 (0%)")
-        self.daum_status.setStyleSheet("color: blue;")
+        
+        for label, state in (
+            (self.status_label, "idle"),
+            (self.naver_status, "naver"),
+            (self.daum_status, "daum"),
+        ):
+            label.setProperty("state", state)
+            label.setStyleSheet(self._STATUS_STYLE)
         
         status_layout.addStretch()
         status_layout.addWidget(self.naver_status)
@@ -41,12 +199,13 @@ class NewsMonitorWidget(QGroupBox):
         
         layout.addLayout(status_layout)
         
+        # 최대 로그 개수 제한 (성능)
+        self.max_log_rows = 100
+        
         # 뉴스 로그 테이블
-        self.news_table = QTableWidget()
-        self.news_table.setColumnCount(5)
-        self.news_table.setHorizontalHeaderLabels([
-            "시간", "소스", "종목", "내용", "상태"
-        ])
+        self.news_model = NewsLogModel(self.max_log_rows, self)
+        self.news_table = QTableView()
+        self.news_table.setModel(self.news_model)
         
         # 컬럼 너비 설정
         header = self.news_table.horizontalHeader()
@@ -56,12 +215,26 @@ class NewsMonitorWidget(QGroupBox):
         header.setSectionResizeMode(3, QHeaderView.Stretch)           # 내용
         header.setSectionResizeMode(4, QHeaderView.ResizeToContents)  # 상태
         
-        # 행 높이 자동 조정
+        # 행 높이 고정 (행 추가 때마다 전체 행 높이를 다시 계산하지 않도록)
+        self.news_table.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
         self.news_table.verticalHeader().setDefaultSectionSize(30)
         self.news_table.setAlternatingRowColors(True)
         
-        # 최대 로그 개수 제한 (성능)
-        self.max_log_rows = 100
+        # 테이블에 아직 추가하지 않은 로그 (최근 것만 보관)
+        # 항목: (시간, 소스, 종목 코드, 메시지, 레벨)
+        # 보이는 동안은 짧게 모아서, 숨겨진 동안은 표시될 때 한 번에 추가
+        self._pending = deque(maxlen=self.max_log_rows)
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(100)
+        self._flush_timer.timeout.connect(self._flush_pending_logs)
+        
+        # 한 번에 이 개수 이상 추가할 때는 테이블을 잠시 숨겨 다시 그리기를 생략
+        self.hide_batch_rows = 20
+        
+        # 다른 스레드에서 온 호출은 GUI 스레드 이벤트 루프에서 처리
+        self._log_received.connect(self._on_log_received, Qt.QueuedConnection)
+        self._stats_received.connect(self._on_stats_received, Qt.QueuedConnection)
         
         layout.addWidget(self.news_table)
         
@@ -75,7 +248,7 @@ class NewsMonitorWidget(QGroupBox):
         source: str = ""
     ):
         """
-        뉴스 로그 추가
+        뉴스 로그 추가 (어느 스레드에서 호출해도 됨)
         
         Args:
             message: 로그 메시지
@@ -83,121 +256,115 @@ class NewsMonitorWidget(QGroupBox):
             stock_code: 종목 코드
             source: 뉴스 소스 (naver, daum)
         """
-        # 최대 로그 개수 초과 시 오래된 로그 삭제
-        if self.news_table.rowCount() >= self.max_log_rows:
-            self.news_table.removeRow(self.news_table.rowCount() - 1)
+        # 시간은 호출 시점 기준
+        timestamp = datetime.now().strftime("%H:%M:%S")
+        self._log_received.emit(timestamp, source, stock_code, message, level)
+    
+    def _on_log_received(self, timestamp: str, source: str, stock_code: str, message: str, level: str):
+        """뉴스 로그 추가 (GUI 스레드)"""
+        self._pending.append((timestamp, source, stock_code, message, level))
         
-        # 새 행 추가 (최신 로그가 위에 오도록)
-        self.news_table.insertRow(0)
+        # 보이는 동안은 100ms 안에 들어온 로그를 모아서 추가
+        # (숨겨진 탭 등에서는 테이블을 건드리지 않고 showEvent에서 추가)
+        if self.isVisible() and not self._flush_timer.isActive():
+            self._flush_timer.start()
         
-        # 시간
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        time_item = QTableWidgetItem(timestamp)
-        time_item.setTextAlignment(Qt.AlignCenter)
-        self.news_table.setItem(0, 0, time_item)
+        # 상태 레이블 업데이트
+        self.status_label.setText("▶️ 실행 중...")
+        self._set_label_state(self.status_label, "running")
+    
+    def showEvent(self, event):
+        """표시될 때 숨겨진 동안 쌓인 로그를 한 번에 추가"""
+        super().showEvent(event)
+        self._flush_pending_logs()
+    
+    def _flush_pending_logs(self):
+        """대기 중인 로그를 테이블에 추가"""
+        self._flush_timer.stop()
+        if not self._pending:
+            return
         
-        # 소스
-        source_name = self._get_source_display_name(source)
-        source_item = QTableWidgetItem(source_name)
-        source_item.setTextAlignment(Qt.AlignCenter)
+        batch = list(self._pending)
+        self._pending.clear()
+        self.flush_pending(batch)
+    
+    def flush_pending(self, batch: list):
+        """
+        로그 여러 줄을 한 번에 테이블에 추가 (다시 그리기는 마지막에 한 번)
         
-        if source == "naver":
-            source_item.setForeground(QColor("green"))
-        elif source == "daum":
-            source_item.setForeground(QColor("blue"))
-        
-        self.news_table.setItem(0, 1, source_item)
-        
-        # 종목
-        stock_item = QTableWidgetItem(stock_code if stock_code else "-")
-        stock_item.setTextAlignment(Qt.AlignCenter)
-        self.news_table.setItem(0, 2, stock_item)
-        
-        # 내용
-        content_item = QTableWidgetItem(message)
-        self.news_table.setItem(0, 3, content_item)
-        
-        # 상태
-        status_text = self._get_status_text(level)
-        status_item = QTableWidgetItem(status_text)
-        status_item.setTextAlignment(Qt.AlignCenter)
-        
-        # 상태별 색상
-        if level == "success":
-            status_item.setForeground(QColor("#00AA00"))
-            status_item.setBackground(QColor("#E8F5E9"))
-        elif level == "warning":
-            status_item.setForeground(QColor("#FF8800"))
-            status_item.setBackground(QColor("#FFF3E0"))
-        elif level == "error":
-            status_item.setForeground(QColor("#CC0000"))
-            status_item.setBackground(QColor("#FFEBEE"))
-        else:  # info
-            status_item.setForeground(QColor("#0066CC"))
-        
-        self.news_table.setItem(0, 4, status_item)
+        Args:
+            batch: (시간, 소스, 종목 코드, 메시지, 레벨) 리스트 (오래된 것부터)
+        """
+        table = self.news_table
+        hide_table = len(batch) >= self.hide_batch_rows and table.isVisible()
         
-        # 최신 로그로 스크롤
-        self.news_table.scrollToTop()
+        table.setUpdatesEnabled(False)
+        if hide_table:
+            table.hide()
+        try:
+            self.news_model.prepend_many(batch)
+        finally:
+            if hide_table:
+                table.show()
+            table.setUpdatesEnabled(True)
         
-        # 상태 레이블 업데이트
-        self.status_label.setText("▶️ 실행 중...")
-        self.status_label.setStyleSheet("font-weight: bold; color: green;")
+        # 최신 로그로 스크롤
+        table.scrollToTop()
     
     def update_source_stats(self, source: str, success: int, total: int):
         """
-        소스별 통계 업데이트
+        소스별 통계 업데이트 (어느 스레드에서 호출해도 됨)
         
         Args:
             source: 소스 이름 (naver, daum)
             success: 성공 횟수
             total: 전체 시도 횟수
         """
+        self._stats_received.emit(source, int(success), int(total))
+    
+    def _on_stats_received(self, source: str, success: int, total: int):
+        """소스별 통계 업데이트 (GUI 스레드)"""
         success_rate = (success / total * 100) if total > 0 else 0
         
         if source == "naver":
-            self.naver_status.setText(f"네이버: {success}/{total} ({success_rate:.0f}%)")
-            
-            # 성공률에 따라 색상 변경
-            if success_rate >= 80:
-                self.naver_status.setStyleSheet("color: green; font-weight: bold;")
-            elif success_rate >= 50:
-                self.naver_status.setStyleSheet("color: orange; font-weight: bold;")
-            else:
-                self.naver_status.setStyleSheet("color: red; font-weight: bold;")
-        
+            label = self.naver_status
         elif source == "daum":
-            self.daum_status.setText(f"다음: {success}/{total} ({success_rate:.0f}%)")
-            
-            if success_rate >= 80:
-                self.daum_status.setStyleSheet("color: green; font-weight: bold;")
-            elif success_rate >= 50:
-                self.daum_status.setStyleSheet("color: orange; font-weight: bold;")
-            else:
-                self.daum_status.setStyleSheet("color: red; font-weight: bold;")
+            label = self.daum_status
+        else:
+            return
+        
+        name = NewsLogModel.SOURCE_NAMES[source]
+        label.setText(f"{name}: {success}/{total} ({success_rate:.0f}%)")
+        
+        # 성공률에 따라 색상 변경
+        if success_rate >= 80:
+            self._set_label_state(label, "ok")
+        elif success_rate >= 50:
+            self._set_label_state(label, "warn")
+        else:
+            self._set_label_state(label, "bad")
     
     def clear_logs(self):
         """로그 전체 삭제"""
-        self.news_table.setRowCount(0)
+        self._flush_timer.stop()
+        self._pending.clear()
+        self.news_model.clear()
         self.status_label.setText("⏸️ 대기 중...")
-        self.status_label.setStyleSheet("font-weight: bold; color: #666;")
-    
-    def _get_source_display_name(self, source: str) -> str:
-        """소스 표시 이름 반환"""
-        source_map = {
-            "naver": "네이버",
-            "daum": "다음",
-        }
-        return source_map.get(source, source)
-    
-    def _get_status_text(self, level: str) -> str:
-        """레벨별 상태 텍스트 반환"""
-        status_map = {
-            "info": "ℹ️ 정보",
-            "success": "✅ 성공",
-            "warning": "⚠️ 경고",
-            "error": "❌ 오류",
-        }
-        return status_map.get(level, "ℹ️ 정보")
-
-
+        self._set_label_state(self.status_label, "idle")
+    
+    @staticmethod
+    def _set_label_state(label: QLabel, state: str):
+        """
+        상태 레이블의 state 속성 변경 (스타일시트 재파싱 없이 다시 꾸미기만 함)
+        
+        Args:
+            label: 상태 레이블
+            state: _STATUS_STYLE의 state 값
+        """
+        if label.property("state") == state:
+            return
+        
+        label.setProperty("state", state)
+        style = label.style()
+        style.unpolish(label)
+        style.polish(label)